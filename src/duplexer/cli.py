@@ -1,26 +1,55 @@
 """Command-line interface for duplexer."""
 
 import logging
+import multiprocessing
 import os
 import sys
-import tempfile
+import threading
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.queues import Queue
 from pathlib import Path
 
 import click
 
-from duplexer.interleave import DuplexError, InvalidPageCountError, interleave_duplex
+from duplexer.interleave import (
+    BACKENDS,
+    PDFIUM_AVAILABLE,
+    DuplexError,
+    InvalidPageCountError,
+    interleave_duplex,
+)
 from duplexer.io_utils import (
+    LOCK_DIR_NAME,
+    RESULT_CACHE_NAME,
+    StatCache,
     already_processed,
+    atomic_output,
+    bulk_already_processed,
     cleanup_ready_file,
+    compute_file_hash,
     ensure_dir,
+    file_state_lock,
     get_output_path,
+    get_ready_path,
+    is_network_filesystem,
+    prune_result_cache,
+    record_processed_hash,
+    restore_cached_result,
+    result_cache_path,
     safe_move,
+    store_cached_result,
 )
 from duplexer.watcher import FileWatcher
 
 logger = logging.getLogger(__name__)
 
+# Seconds between result cache prunes while watching
+RESULT_CACHE_PRUNE_INTERVAL = 3600.0
+
 
 def setup_logging(verbose: bool = False) -> None:
     """
@@ -53,6 +82,9 @@ def process_pdf_file(
     output_suffix: str,
     reverse_backs: bool,
     insert_blank_lastback: bool,
+    backend: str = "pypdf",
+    durable: bool = True,
+    cache_dir: Path | None = None,
 ) -> None:
     """
     Process a single PDF file for duplex interleaving.
@@ -65,83 +97,154 @@ def process_pdf_file(
         output_suffix: Suffix to add to output filename
         reverse_backs: Whether back pages are in reverse order
         insert_blank_lastback: Whether to insert blank page for odd counts
+        backend: PDF library used for interleaving
+        durable: Whether to fsync the output and its directory so the result
+            survives a crash or power loss
+        cache_dir: Result cache directory; when set, inputs whose content was
+            already interleaved with the same options reuse the cached output
 
     Raises:
         Does not raise - all errors are handled internally with logging
     """
-    logger.info(f"Processing: {file_path.name}")
+    logger.info("Processing: %s", file_path.name)
+
+    # Another instance sharing the ingest directory may have picked it up too
+    with file_state_lock(archive_dir / LOCK_DIR_NAME, file_path.name) as locked:
+        if not locked:
+            logger.info("Skipping %s (being processed elsewhere)", file_path.name)
+            return
+        _process_locked(
+            file_path,
+            output_dir,
+            archive_dir,
+            failed_dir,
+            output_suffix,
+            reverse_backs,
+            insert_blank_lastback,
+            backend,
+            durable,
+            cache_dir,
+        )
 
-    # Check if already processed
-    if already_processed(file_path, output_dir, archive_dir, output_suffix):
-        logger.info(f"Skipping {file_path.name} (already processed)")
-        return
 
-    # Validate PDF
-    from duplexer.interleave import validate_pdf
+def _process_locked(
+    file_path: Path,
+    output_dir: Path,
+    archive_dir: Path,
+    failed_dir: Path,
+    output_suffix: str,
+    reverse_backs: bool,
+    insert_blank_lastback: bool,
+    backend: str,
+    durable: bool,
+    cache_dir: Path | None,
+) -> None:
+    """Process a PDF file while holding its lock; see process_pdf_file."""
+    ready_path = get_ready_path(file_path)
 
-    valid, error = validate_pdf(file_path)
-    if not valid:
-        logger.error(f"Invalid PDF {file_path.name}: {error}")
-        safe_move(file_path, failed_dir)
-        cleanup_ready_file(file_path)
+    # Check if already processed
+    stat_cache = StatCache()
+    if already_processed(file_path, output_dir, archive_dir, output_suffix, stat_cache):
+        logger.info("Skipping %s (already processed)", file_path.name)
         return
 
     # Prepare output path
     output_path = get_output_path(file_path, output_dir, output_suffix)
 
-    # Process in temp file then move atomically
-    tmp_path = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="wb", suffix=".pdf", delete=False, dir=output_dir
-        ) as tmp_file:
-            tmp_path = Path(tmp_file.name)
-
-        interleave_duplex(
-            file_path,
-            tmp_path,
-            reverse_backs=reverse_backs,
-            insert_blank_lastback=insert_blank_lastback,
-        )
-
-        # Atomic move to final location
+    # Reuse a previous result for identical content and options
+    file_hash = None
+    cache_path = None
+    if cache_dir is not None:
         try:
-            tmp_path.replace(output_path)
-            logger.info(f"Successfully created: {output_path.name}")
-        except Exception as e:
-            # Clean up temp file if replace fails
-            if tmp_path and tmp_path.exists():
-                tmp_path.unlink()
-            raise DuplexError(f"Failed to write output file: {e}") from e
+            file_hash = compute_file_hash(file_path)
+            cache_path = result_cache_path(
+                cache_dir, file_hash, reverse_backs, insert_blank_lastback
+            )
+        except OSError as e:
+            logger.warning("Failed to hash %s: %s", file_path.name, e)
+
+        if cache_path and restore_cached_result(cache_path, output_path):
+            logger.info("Reused cached result: %s", output_path.name)
+            record_processed_hash(file_path, archive_dir, output_path.name, file_hash)
+            if safe_move(file_path, archive_dir):
+                cleanup_ready_file(file_path, ready_path)
+            else:
+                logger.warning("Failed to archive %s", file_path.name)
+            return
+
+    # Validate PDF, keeping the parsed reader for interleaving; the pdfium
+    # backend parses and validates the file itself, so a pypdf parse would
+    # only be thrown away
+    reader = None
+    if backend != "pdfium":
+        from duplexer.interleave import open_pdf
+
+        reader, error = open_pdf(file_path)
+        if reader is None:
+            logger.error("Invalid PDF %s: %s", file_path.name, error)
+            _move_to_failed(file_path, failed_dir, ready_path)
+            return
+
+    # Write to an unnamed/hidden temp file that only appears once complete
+    try:
+        with atomic_output(output_path, durable) as output_file:
+            interleave_duplex(
+                file_path,
+                output_file,
+                reverse_backs=reverse_backs,
+                insert_blank_lastback=insert_blank_lastback,
+                backend=backend,
+                reader=reader,
+                durable=durable,
+            )
+        logger.info("Successfully created: %s", output_path.name)
+
+        # Remember content so renamed duplicates are skipped
+        record_processed_hash(file_path, archive_dir, output_path.name, file_hash)
+        if cache_path:
+            store_cached_result(output_path, cache_path)
 
         # Archive original
         archive_result = safe_move(file_path, archive_dir)
         if archive_result:
-            cleanup_ready_file(file_path)
+            cleanup_ready_file(file_path, ready_path)
         else:
-            logger.warning(f"Failed to archive {file_path.name}")
+            logger.warning("Failed to archive %s", file_path.name)
 
-    except InvalidPageCountError as e:
-        logger.error(f"Invalid page count for {file_path.name}: {e}")
-        # Clean up temp file
-        if tmp_path and tmp_path.exists():
-            tmp_path.unlink()
-        safe_move(file_path, failed_dir)
-        cleanup_ready_file(file_path)
-    except DuplexError as e:
-        logger.error(f"Duplex error for {file_path.name}: {e}")
-        # Clean up temp file
-        if tmp_path and tmp_path.exists():
-            tmp_path.unlink()
-        safe_move(file_path, failed_dir)
-        cleanup_ready_file(file_path)
     except Exception as e:
-        logger.exception(f"Unexpected error processing {file_path.name}: {e}")
-        # Clean up temp file
-        if tmp_path and tmp_path.exists():
-            tmp_path.unlink()
-        safe_move(file_path, failed_dir)
-        cleanup_ready_file(file_path)
+        _log_processing_error(file_path, e)
+        _move_to_failed(file_path, failed_dir, ready_path)
+
+
+def _move_to_failed(file_path: Path, failed_dir: Path, ready_path: Path) -> None:
+    """
+    Move a file that could not be processed to the failed directory and drop its sidecar.
+
+    There is no temp output to remove: atomic_output never leaves one behind.
+
+    Args:
+        file_path: Input file that failed
+        failed_dir: Directory for failed inputs
+        ready_path: The input's .ready sidecar path
+    """
+    safe_move(file_path, failed_dir)
+    cleanup_ready_file(file_path, ready_path)
+
+
+# Expected failures are logged without a traceback; the first match wins
+_EXPECTED_ERRORS: tuple[tuple[type[Exception], str], ...] = (
+    (InvalidPageCountError, "Invalid page count for %s: %s"),
+    (DuplexError, "Duplex error for %s: %s"),
+)
+
+
+def _log_processing_error(file_path: Path, error: Exception) -> None:
+    """Log a processing failure, with a traceback only for unexpected errors."""
+    for error_type, message in _EXPECTED_ERRORS:
+        if isinstance(error, error_type):
+            logger.error(message, file_path.name, error)
+            return
+    logger.exception("Unexpected error processing %s: %s", file_path.name, error)
 
 
 @click.group()
@@ -164,12 +267,20 @@ def cli():
     default=False,
     help="Insert blank last back page if odd count (default: False)",
 )
+@click.option(
+    "--backend",
+    type=click.Choice(BACKENDS),
+    default="pypdf",
+    envvar="PDF_BACKEND",
+    help="PDF library used for interleaving (default: pypdf)",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 def interleave(
     input_pdf: Path,
     output_pdf: Path,
     reverse_backs: bool,
     insert_blank_lastback: bool,
+    backend: str,
     verbose: bool,
 ):
     """
@@ -186,6 +297,7 @@ def interleave(
             output_pdf,
             reverse_backs=reverse_backs,
             insert_blank_lastback=insert_blank_lastback,
+            backend=backend,
         )
         click.echo(f"Successfully wrote {output_pdf}")
         sys.exit(0)
@@ -216,6 +328,10 @@ def load_watch_config(
 
     Returns:
         Dictionary with all configuration values
+
+    Raises:
+        SystemExit: If MAX_WORKERS is not an integer, or PDF_BACKEND is unknown
+            or its library is not installed
     """
     scan_pattern = pattern or os.getenv("SCAN_GLOB", "*.pdf")
     stability_seconds_val = stability_seconds or float(os.getenv("FILE_STABILITY_SECONDS", "5.0"))
@@ -226,6 +342,27 @@ def load_watch_config(
     reverse_backs = str_to_bool(os.getenv("REVERSE_BACKS", "true"))
     insert_blank_lastback = str_to_bool(os.getenv("INSERT_BLANK_LASTBACK", "false"))
     output_suffix = os.getenv("OUTPUT_SUFFIX", ".duplex")
+    max_workers_env = os.getenv("MAX_WORKERS", "").strip()
+    try:
+        max_workers = int(max_workers_env) if max_workers_env else 0
+    except ValueError:
+        logger.error("MAX_WORKERS must be an integer, got '%s'", max_workers_env)
+        sys.exit(1)
+    if max_workers <= 0:
+        # Unset or non-positive: one worker per CPU
+        max_workers = os.cpu_count() or 1
+    backend = os.getenv("PDF_BACKEND", "pypdf").lower()
+    # Fail at startup rather than moving every input to failed/
+    if backend not in BACKENDS:
+        logger.error("Unknown PDF_BACKEND '%s', expected one of: %s", backend, ", ".join(BACKENDS))
+        sys.exit(1)
+    if backend == "pdfium" and not PDFIUM_AVAILABLE:
+        logger.error("PDF_BACKEND=pdfium requires pypdfium2 (install duplexer[pdfium])")
+        sys.exit(1)
+    durable_writes = str_to_bool(os.getenv("DURABLE_WRITES", "true"))
+    result_cache = str_to_bool(os.getenv("RESULT_CACHE", "false"))
+    result_cache_ttl_days = float(os.getenv("RESULT_CACHE_TTL_DAYS", "30"))
+    watch_mode = os.getenv("WATCH_MODE", "auto").lower()
 
     return {
         "scan_pattern": scan_pattern,
@@ -234,6 +371,12 @@ def load_watch_config(
         "reverse_backs": reverse_backs,
         "insert_blank_lastback": insert_blank_lastback,
         "output_suffix": output_suffix,
+        "max_workers": max_workers,
+        "backend": backend,
+        "durable_writes": durable_writes,
+        "result_cache": result_cache,
+        "result_cache_ttl_days": result_cache_ttl_days,
+        "watch_mode": watch_mode,
     }
 
 
@@ -255,19 +398,54 @@ def log_watch_config(
         config: Configuration dictionary from load_watch_config
     """
     logger.info("=== Duplexer Configuration ===")
-    logger.info(f"Input directory: {input_dir}")
-    logger.info(f"Output directory: {output_dir}")
-    logger.info(f"Archive directory: {archive_dir}")
-    logger.info(f"Failed directory: {failed_dir}")
-    logger.info(f"Scan pattern: {config['scan_pattern']}")
-    logger.info(f"Stability seconds: {config['stability_seconds']}s")
-    logger.info(f"Require ready file: {config['require_ready_file']}")
-    logger.info(f"Reverse backs: {config['reverse_backs']}")
-    logger.info(f"Insert blank last back: {config['insert_blank_lastback']}")
-    logger.info(f"Output suffix: {config['output_suffix']}")
+    logger.info("Input directory: %s", input_dir)
+    logger.info("Output directory: %s", output_dir)
+    logger.info("Archive directory: %s", archive_dir)
+    logger.info("Failed directory: %s", failed_dir)
+    logger.info("Scan pattern: %s", config["scan_pattern"])
+    logger.info("Stability seconds: %ss", config["stability_seconds"])
+    logger.info("Require ready file: %s", config["require_ready_file"])
+    logger.info("Reverse backs: %s", config["reverse_backs"])
+    logger.info("Insert blank last back: %s", config["insert_blank_lastback"])
+    logger.info("Output suffix: %s", config["output_suffix"])
+    logger.info("Max workers: %s", config["max_workers"])
+    logger.info("PDF backend: %s", config["backend"])
+    logger.info("Durable writes: %s", config["durable_writes"])
+    logger.info(
+        "Result cache: %s (TTL %s days)", config["result_cache"], config["result_cache_ttl_days"]
+    )
+    logger.info("Watch mode: %s", config["watch_mode"])
     logger.info("=" * 30)
 
 
+def resolve_use_polling(watch_mode: str, input_dir: Path) -> bool:
+    """
+    Decide whether the watcher should poll instead of using filesystem events.
+
+    Events (inotify/FSEvents via watchdog) are preferred. In "auto" mode,
+    polling is only used when the input directory is on a network filesystem,
+    where changes made by other hosts never produce local events.
+
+    Args:
+        watch_mode: "auto", "events" or "polling"
+        input_dir: Directory that will be watched
+
+    Returns:
+        True if polling should be used
+    """
+    if watch_mode == "polling":
+        return True
+    if watch_mode == "events":
+        return False
+    if watch_mode != "auto":
+        logger.warning("Unknown WATCH_MODE '%s', using auto", watch_mode)
+
+    if is_network_filesystem(input_dir):
+        logger.info("%s is on a network filesystem, using polling", input_dir)
+        return True
+    return False
+
+
 def setup_watch_directories(
     input_dir: Path,
     output_dir: Path,
@@ -287,7 +465,7 @@ def setup_watch_directories(
         SystemExit: If input directory does not exist
     """
     if not input_dir.exists():
-        logger.error(f"Input directory does not exist: {input_dir}")
+        logger.error("Input directory does not exist: %s", input_dir)
         sys.exit(1)
 
     ensure_dir(output_dir)
@@ -302,9 +480,12 @@ def create_process_callback(
     output_suffix: str,
     reverse_backs: bool,
     insert_blank_lastback: bool,
+    backend: str = "pypdf",
+    durable: bool = True,
+    cache_dir: Path | None = None,
 ) -> Callable[[Path], None]:
     """
-    Create a process callback function with configuration captured in closure.
+    Create a process callback function with configuration bound as keyword arguments.
 
     Args:
         output_dir: Output directory for processed files
@@ -313,24 +494,210 @@ def create_process_callback(
         output_suffix: Suffix to add to output filenames
         reverse_backs: Whether back pages are reversed
         insert_blank_lastback: Whether to insert blank for odd pages
+        backend: PDF library used for interleaving
+        durable: Whether to fsync outputs before considering them written
+        cache_dir: Result cache directory, or None to disable the cache
 
     Returns:
-        Callable that accepts a file path and processes it
+        Callable that accepts a file path and processes it. The callable is a
+        ``functools.partial`` so it can be pickled and sent to worker processes.
     """
+    return partial(
+        process_pdf_file,
+        output_dir=output_dir,
+        archive_dir=archive_dir,
+        failed_dir=failed_dir,
+        output_suffix=output_suffix,
+        reverse_backs=reverse_backs,
+        insert_blank_lastback=insert_blank_lastback,
+        backend=backend,
+        durable=durable,
+        cache_dir=cache_dir,
+    )
 
-    def process_file(file_path: Path) -> None:
-        """Wrapper for process_pdf_file with captured configuration."""
-        process_pdf_file(
-            file_path=file_path,
-            output_dir=output_dir,
-            archive_dir=archive_dir,
-            failed_dir=failed_dir,
-            output_suffix=output_suffix,
-            reverse_backs=reverse_backs,
-            insert_blank_lastback=insert_blank_lastback,
-        )
 
-    return process_file
+def init_worker_logging(log_queue: Queue, level: int) -> None:
+    """
+    Route logging in a worker process through the parent's log queue.
+
+    Args:
+        log_queue: Queue drained by a QueueListener in the parent process
+        level: Log level to apply to the worker's root logger
+    """
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [QueueHandler(log_queue)]
+    root_logger.setLevel(level)
+
+
+class RestartingProcessPool(Executor):
+    """
+    Process pool that replaces itself when a worker process dies.
+
+    A worker killed by a native crash or the OOM killer breaks a
+    ProcessPoolExecutor for good: every later submit raises BrokenProcessPool.
+    Here the broken pool is discarded and the submission goes to a fresh one,
+    so a long-running watcher keeps processing files.
+    """
+
+    def __init__(self, **pool_kwargs):
+        """
+        Start the first pool.
+
+        Args:
+            **pool_kwargs: Arguments for each ProcessPoolExecutor created
+        """
+        self._pool_kwargs = pool_kwargs
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(**pool_kwargs)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        """Submit a call, replacing the pool first if it is broken."""
+        with self._lock:
+            executor = self._executor
+        try:
+            return executor.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            pass
+
+        with self._lock:
+            # Several submitters may see the same broken pool; replace it once
+            if self._executor is executor:
+                logger.error("A worker process died, starting a new process pool")
+                self._executor = ProcessPoolExecutor(**self._pool_kwargs)
+            replacement = self._executor
+        executor.shutdown(wait=False)
+        return replacement.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Shut down the current pool."""
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def run_cache_pruner(
+    cache_dir: Path,
+    max_age_seconds: float,
+    stop_event: threading.Event,
+    interval: float = RESULT_CACHE_PRUNE_INTERVAL,
+) -> None:
+    """
+    Prune the result cache now and then every interval until stop_event is set.
+
+    A watcher runs for months, so pruning only at startup would let the
+    cache grow with every file processed.
+
+    Args:
+        cache_dir: Result cache directory
+        max_age_seconds: Entries older than this are removed
+        stop_event: Set to stop pruning
+        interval: Seconds between prunes
+    """
+    while True:
+        try:
+            prune_result_cache(cache_dir, max_age_seconds)
+        except OSError as e:
+            logger.warning("Failed to prune result cache %s: %s", cache_dir, e)
+        if stop_event.wait(interval):
+            return
+
+
+def create_pool_dispatcher(
+    executor: Executor,
+    process_file: Callable[[Path], None],
+    failed_dir: Path | None = None,
+) -> Callable[[Path], None]:
+    """
+    Create a callback that submits files to an executor instead of processing inline.
+
+    The watcher thread stays the producer and returns immediately; failures
+    raised by the worker are logged when the future completes. A file whose
+    worker process died (a broken pool) is submitted once more, since the
+    watcher has already claimed it and would not offer it again. If its
+    worker dies again, the file most likely crashes the PDF library itself
+    and is moved to failed_dir, so it cannot keep breaking the pool.
+
+    Args:
+        executor: Executor that runs the processing, e.g. a RestartingProcessPool
+        process_file: Picklable callable that processes a single file
+        failed_dir: Directory for inputs that kill their worker twice, or None
+            to only log them
+
+    Returns:
+        Callable that accepts a file path and schedules it for processing
+    """
+
+    def log_failure(file_path: Path, retried: bool, future: Future) -> None:
+        """Log errors that escaped the worker, retrying files lost with a broken pool."""
+        if future.cancelled():
+            logger.warning("Processing of %s was cancelled", file_path.name)
+            return
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool) and not retried:
+            logger.warning("Worker died while processing %s, retrying", file_path.name)
+            try:
+                submit(file_path, retried=True)
+            except Exception as e:
+                logger.error("Failed to resubmit %s: %s", file_path.name, e)
+        elif isinstance(error, BrokenProcessPool) and failed_dir is not None:
+            logger.error("Worker died twice while processing %s, giving up", file_path.name)
+            if file_path.exists():
+                _move_to_failed(file_path, failed_dir, get_ready_path(file_path))
+        elif error is not None:
+            logger.error("Failed to process %s: %s", file_path.name, error)
+
+    def submit(file_path: Path, retried: bool = False) -> None:
+        """Submit a file and log its outcome once it completes."""
+        future = executor.submit(process_file, file_path)
+        future.add_done_callback(partial(log_failure, file_path, retried))
+
+    def dispatch(file_path: Path) -> None:
+        """Submit a file to the executor."""
+        submit(file_path)
+
+    return dispatch
+
+
+def process_pdf_batch(
+    file_paths: list[Path],
+    executor: Executor,
+    process_file: Callable[[Path], None],
+    max_pending: int,
+) -> int:
+    """
+    Process a batch of files in parallel, keeping a bounded number in flight.
+
+    Files are submitted as earlier ones finish rather than all at once, so a
+    large backlog does not queue a future (and its arguments) per file.
+
+    Args:
+        file_paths: Files to process
+        executor: Executor that runs the processing, typically a process pool
+        process_file: Picklable callable that processes a single file
+        max_pending: Maximum number of files submitted but not yet finished
+
+    Returns:
+        Number of files whose processing completed without raising
+    """
+    remaining = iter(file_paths)
+    pending: dict[Future, Path] = {}
+    completed = 0
+
+    while True:
+        for file_path in remaining:
+            pending[executor.submit(process_file, file_path)] = file_path
+            if len(pending) >= max_pending:
+                break
+        if not pending:
+            return completed
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            file_path = pending.pop(future)
+            if (error := future.exception()) is not None:
+                logger.error("Failed to process %s: %s", file_path.name, error)
+            else:
+                completed += 1
 
 
 @cli.command()
@@ -368,6 +735,21 @@ def watch(
     # Setup directories
     setup_watch_directories(input_dir, output_dir, archive_dir, failed_dir)
 
+    cache_dir = None
+    stop_pruning = threading.Event()
+    if config["result_cache"]:
+        cache_dir = archive_dir / RESULT_CACHE_NAME
+        max_age_seconds = config["result_cache_ttl_days"] * 86400
+        if once:
+            prune_result_cache(cache_dir, max_age_seconds)
+        else:
+            threading.Thread(
+                target=run_cache_pruner,
+                args=(cache_dir, max_age_seconds, stop_pruning),
+                name="duplexer-cache-prune",
+                daemon=True,
+            ).start()
+
     # Create process callback
     process_file = create_process_callback(
         output_dir=output_dir,
@@ -376,24 +758,54 @@ def watch(
         output_suffix=config["output_suffix"],
         reverse_backs=config["reverse_backs"],
         insert_blank_lastback=config["insert_blank_lastback"],
+        backend=config["backend"],
+        durable=config["durable_writes"],
+        cache_dir=cache_dir,
     )
 
-    # Create watcher
-    watcher = FileWatcher(
-        input_dir=input_dir,
-        process_callback=process_file,
-        pattern=config["scan_pattern"],
-        stability_seconds=config["stability_seconds"],
-        require_ready_file=config["require_ready_file"],
-    )
+    # Child processes log through a queue so their records are emitted by the parent
+    root_logger = logging.getLogger()
+    log_queue: Queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    listener.start()
+
+    try:
+        with RestartingProcessPool(
+            max_workers=config["max_workers"],
+            initializer=init_worker_logging,
+            initargs=(log_queue, root_logger.level),
+        ) as executor:
+            # Create watcher
+            watcher = FileWatcher(
+                input_dir=input_dir,
+                process_callback=create_pool_dispatcher(executor, process_file, failed_dir),
+                pattern=config["scan_pattern"],
+                stability_seconds=config["stability_seconds"],
+                require_ready_file=config["require_ready_file"],
+                use_polling=resolve_use_polling(config["watch_mode"], input_dir),
+                skip_filter=partial(
+                    bulk_already_processed,
+                    output_dir=output_dir,
+                    archive_dir=archive_dir,
+                    output_suffix=config["output_suffix"],
+                ),
+            )
+
+            if once:
+                files = watcher.collect_ready_files()
+                completed = process_pdf_batch(
+                    files, executor, process_file, max_pending=2 * config["max_workers"]
+                )
+                logger.info("Processed %s of %s file(s)", completed, len(files))
+            else:
+                logger.info("Starting continuous watch mode (Ctrl+C to stop)")
+                watcher.watch()
+    finally:
+        stop_pruning.set()
+        listener.stop()
 
     if once:
-        count = watcher.scan_once()
-        logger.info(f"Processed {count} file(s)")
         sys.exit(0)
-    else:
-        logger.info("Starting continuous watch mode (Ctrl+C to stop)")
-        watcher.watch()
 
 
 if __name__ == "__main__":
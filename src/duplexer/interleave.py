@@ -1,12 +1,37 @@
 """PDF interleaving logic for duplex scanning."""
 
+from __future__ import annotations
+
+import importlib.util
+import io
 import logging
+import os
+import shutil
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from duplexer.io_utils import OUTPUT_BUFFER_SIZE
 
-from pypdf import PdfReader, PdfWriter
+# pypdf and pypdfium2 take most of the CLI's start-up time, so they are only
+# imported by the functions that need them
+if TYPE_CHECKING:
+    from pypdf import PdfReader, PdfWriter
 
 logger = logging.getLogger(__name__)
 
+# The pdfium backend is only available when pypdfium2 is installed
+PDFIUM_AVAILABLE = importlib.util.find_spec("pypdfium2") is not None
+
+BACKENDS = ("pypdf", "pdfium")
+
+# PDF readers accept the %PDF- header anywhere in the first kilobyte
+PDF_HEADER_WINDOW = 1024
+
+# Document information entries carried over to the output
+METADATA_KEYS = ("/Title", "/Author", "/Subject", "/Creator")
+
 
 class DuplexError(Exception):
     """Base exception for duplex interleaving errors."""
@@ -28,27 +53,88 @@ def copy_metadata(reader: PdfReader, writer: PdfWriter) -> None:
         reader: Source PDF reader
         writer: Destination PDF writer
     """
-    if reader.metadata:
-        metadata = {}
-        if "/Title" in reader.metadata:
-            metadata["/Title"] = reader.metadata["/Title"]
-        if "/Author" in reader.metadata:
-            metadata["/Author"] = reader.metadata["/Author"]
-        if "/Subject" in reader.metadata:
-            metadata["/Subject"] = reader.metadata["/Subject"]
-        if "/Creator" in reader.metadata:
-            metadata["/Creator"] = reader.metadata["/Creator"]
+    source = reader.metadata
+    if not source:
+        return
+
+    metadata = {key: value for key in METADATA_KEYS if (value := source.get(key)) is not None}
+    if metadata:
+        writer.add_metadata(metadata)
+        logger.debug("Copied metadata: %s", metadata)
+
+
+def plan_page_order(
+    total_pages: int,
+    reverse_backs: bool = True,
+    insert_blank_lastback: bool = False,
+) -> tuple[list[int], bool]:
+    """
+    Compute the interleaved page order for a duplex scan.
+
+    Args:
+        total_pages: Number of pages in the input PDF
+        reverse_backs: If True, back pages are in reverse order
+        insert_blank_lastback: If True and page count is odd, plan a blank last back page
+
+    Returns:
+        Tuple of (page indices in output order, whether a blank page must be appended).
+        When a blank is needed it always follows the last index in the list.
 
-        if metadata:
-            writer.add_metadata(metadata)
-            logger.debug(f"Copied metadata: {metadata}")
+    Raises:
+        InvalidPageCountError: If page count is odd and blank insertion is disabled
+
+    Example:
+        >>> plan_page_order(4)
+        ([0, 3, 1, 2], False)
+    """
+    # Handle odd page count
+    pages_to_process = total_pages
+    appended_blank = False
+
+    if total_pages % 2 != 0:
+        if insert_blank_lastback:
+            logger.info("Odd page count (%s), will insert blank last back page", total_pages)
+            pages_to_process = total_pages + 1
+            appended_blank = True
+        else:
+            raise InvalidPageCountError(
+                f"Page count {total_pages} is odd and INSERT_BLANK_LASTBACK is disabled"
+            )
+
+    # Split into fronts and backs; ranges are consumed by the slice assignment
+    # below without building intermediate lists
+    n = pages_to_process // 2
+    front_pages = range(n)
+    back_pages = range(total_pages - 1, n - 1, -1) if reverse_backs else range(n, total_pages)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Front pages indices: %s%s",
+            list(front_pages[:5]),
+            "..." if len(front_pages) > 5 else "",
+        )
+        logger.debug(
+            "Back pages indices: %s%s", list(back_pages[:5]), "..." if len(back_pages) > 5 else ""
+        )
+
+    # Build interleaved page order with strided slice assignment (no per-page
+    # Python loop); a missing last back page leaves the list one short and is
+    # appended as a blank by the caller
+    order = [0] * total_pages
+    order[0::2] = front_pages
+    order[1::2] = back_pages
+
+    return order, appended_blank
 
 
 def interleave_duplex(
     input_path: Path,
-    output_path: Path,
+    output_path: Path | BinaryIO,
     reverse_backs: bool = True,
     insert_blank_lastback: bool = False,
+    backend: str = "pypdf",
+    reader: PdfReader | None = None,
+    durable: bool = False,
 ) -> None:
     """
     Interleave a manually duplex-scanned PDF.
@@ -58,89 +144,272 @@ def interleave_duplex(
 
     Args:
         input_path: Path to input PDF
-        output_path: Path to output PDF
+        output_path: Path to output PDF, or an open binary file to write it to
         reverse_backs: If True, back pages are in reverse order (default: True)
         insert_blank_lastback: If True and page count is odd, insert a blank back page
+        backend: PDF library to use, one of ``BACKENDS`` (default: "pypdf")
+        reader: Already-parsed reader for input_path (e.g. from open_pdf) to avoid
+            parsing the file twice; ignored by the pdfium backend
+        durable: If True, fsync the output file before returning
 
     Raises:
-        DuplexError: If PDF cannot be processed
+        DuplexError: If PDF cannot be processed or the backend is unavailable
         InvalidPageCountError: If page count is odd and blank insertion is disabled
     """
-    logger.info(f"Interleaving {input_path.name} -> {output_path.name}")
+    logger.info("Interleaving %s -> %s", input_path.name, _describe_output(output_path))
     logger.debug(
-        f"Options: reverse_backs={reverse_backs}, insert_blank_lastback={insert_blank_lastback}"
+        "Options: reverse_backs=%s, insert_blank_lastback=%s, backend=%s",
+        reverse_backs,
+        insert_blank_lastback,
+        backend,
     )
 
-    try:
-        reader = PdfReader(input_path)
-    except Exception as e:
-        raise DuplexError(f"Failed to read PDF: {e}") from e
+    if backend == "pdfium":
+        _interleave_pdfium(input_path, output_path, reverse_backs, insert_blank_lastback, durable)
+        return
+    if backend != "pypdf":
+        raise DuplexError(f"Unknown PDF backend: {backend}")
+
+    from pypdf import PdfReader, PdfWriter
+
+    if reader is None:
+        try:
+            reader = PdfReader(_read_input(input_path))
+        except Exception as e:
+            raise DuplexError(f"Failed to read PDF: {e}") from e
 
     if reader.is_encrypted:
         raise DuplexError("PDF is password-protected")
 
     total_pages = len(reader.pages)
-    logger.debug(f"Total pages: {total_pages}")
+    logger.debug("Total pages: %s", total_pages)
 
-    # Handle odd page count
-    pages_to_process = total_pages
-    appended_blank = False
+    order, appended_blank = plan_page_order(total_pages, reverse_backs, insert_blank_lastback)
 
-    if total_pages % 2 != 0:
-        if insert_blank_lastback:
-            logger.info(f"Odd page count ({total_pages}), will insert blank last back page")
-            pages_to_process = total_pages + 1
-            appended_blank = True
-        else:
-            raise InvalidPageCountError(
-                f"Page count {total_pages} is odd and INSERT_BLANK_LASTBACK is disabled"
-            )
-
-    # Split into fronts and backs
-    n = pages_to_process // 2
-    front_pages = list(range(n))
-    back_pages = list(range(n, total_pages))
-
-    # Reverse backs if needed
-    if reverse_backs:
-        back_pages.reverse()
-
-    logger.debug(f"Front pages indices: {front_pages[:5]}{'...' if len(front_pages) > 5 else ''}")
-    logger.debug(f"Back pages indices: {back_pages[:5]}{'...' if len(back_pages) > 5 else ''}")
+    if _is_passthrough(order, appended_blank):
+        _copy_unchanged(input_path, output_path, durable)
+        return
 
     # Create output
     writer = PdfWriter()
 
-    # Interleave pages
-    for i in range(n):
-        # Add front page
-        front_page = reader.pages[front_pages[i]]
-        writer.add_page(front_page)
+    # Import all pages in one call so shared resources are cloned only once
+    if order:
+        writer.append(reader, pages=order, import_outline=False)
 
-        # Add back page (or blank if we need to append one)
-        if appended_blank and i == n - 1:
-            # Get dimensions from last front page
-            mediabox = front_page.mediabox
-            width = float(mediabox.width)
-            height = float(mediabox.height)
-            logger.debug(f"Adding blank back page: {width}x{height}")
-            writer.add_blank_page(width=width, height=height)
-        else:
-            back_page = reader.pages[back_pages[i]]
-            writer.add_page(back_page)
+    if appended_blank:
+        # Get dimensions from last front page
+        mediabox = reader.pages[order[-1]].mediabox
+        width = float(mediabox.width)
+        height = float(mediabox.height)
+        logger.debug("Adding blank back page: %sx%s", width, height)
+        writer.add_blank_page(width=width, height=height)
 
     # Copy metadata
     copy_metadata(reader, writer)
 
     # Write output
     try:
-        with open(output_path, "wb") as f:
+        with _open_output(output_path) as f:
             writer.write(f)
-        logger.info(f"Successfully wrote {len(writer.pages)} pages to {output_path.name}")
+            if durable:
+                _sync_file(f)
+        logger.info(
+            "Successfully wrote %s pages to %s", len(writer.pages), _describe_output(output_path)
+        )
+    except Exception as e:
+        raise DuplexError(f"Failed to write output PDF: {e}") from e
+
+
+def _interleave_pdfium(
+    input_path: Path,
+    output_path: Path | BinaryIO,
+    reverse_backs: bool,
+    insert_blank_lastback: bool,
+    durable: bool = False,
+) -> None:
+    """
+    Interleave using PDFium, which copies page objects in C.
+
+    PDFium cannot write the document information dictionary, so selected
+    metadata is added afterwards as a pypdf incremental update that only
+    appends the new Info object instead of rewriting the pages.
+    """
+    if not PDFIUM_AVAILABLE:
+        raise DuplexError("PDF backend 'pdfium' requires pypdfium2 to be installed")
+
+    import pypdfium2 as pdfium
+    from pypdf import PdfWriter
+
+    try:
+        src = pdfium.PdfDocument(input_path)
+    except Exception as e:
+        raise DuplexError(f"Failed to read PDF: {e}") from e
+
+    # Callers skip pypdf validation for this backend, so apply the same rules
+    if pdfium.raw.FPDF_GetSecurityHandlerRevision(src) != -1:
+        src.close()
+        raise DuplexError("PDF is password-protected")
+    if len(src) == 0:
+        src.close()
+        raise DuplexError("PDF has no pages")
+
+    dst = pdfium.PdfDocument.new()
+    try:
+        total_pages = len(src)
+        logger.debug("Total pages: %s", total_pages)
+
+        order, appended_blank = plan_page_order(total_pages, reverse_backs, insert_blank_lastback)
+
+        if _is_passthrough(order, appended_blank):
+            _copy_unchanged(input_path, output_path, durable)
+            return
+
+        if order:
+            dst.import_pages(src, pages=order)
+
+        if appended_blank:
+            # Get dimensions from last front page
+            width, height = src.get_page_size(order[-1])
+            logger.debug("Adding blank back page: %sx%s", width, height)
+            dst.new_page(width, height)
+
+        metadata = {
+            key: value
+            for key in METADATA_KEYS
+            if (value := src.get_metadata_value(key.lstrip("/")))
+        }
+
+        # Write output
+        try:
+            with _open_output(output_path) as f:
+                if metadata:
+                    # The incremental update is built on the saved document
+                    buffer = io.BytesIO()
+                    dst.save(buffer)
+                    buffer.seek(0)
+                    writer = PdfWriter(buffer, incremental=True)
+                    writer.add_metadata(metadata)
+                    writer.write(f)
+                    logger.debug("Copied metadata: %s", metadata)
+                else:
+                    # Nothing to add, so PDFium streams straight into the output
+                    dst.save(f)
+                if durable:
+                    _sync_file(f)
+            logger.info(
+                "Successfully wrote %s pages to %s", len(dst), _describe_output(output_path)
+            )
+        except Exception as e:
+            raise DuplexError(f"Failed to write output PDF: {e}") from e
+    finally:
+        dst.close()
+        src.close()
+
+
+def _is_passthrough(order: list[int], appended_blank: bool) -> bool:
+    """
+    Check whether interleaving would reproduce the input page order.
+
+    This is the case for two-page scans (one sheet), whatever the back order.
+    """
+    return bool(order) and not appended_blank and order == list(range(len(order)))
+
+
+def _copy_unchanged(input_path: Path, output_path: Path | BinaryIO, durable: bool) -> None:
+    """Copy the input verbatim instead of re-serializing an identical document."""
+    try:
+        with open(input_path, "rb") as src, _open_output(output_path) as f:
+            shutil.copyfileobj(src, f, OUTPUT_BUFFER_SIZE)
+            if durable:
+                _sync_file(f)
+        logger.info(
+            "Page order unchanged, copied %s to %s",
+            input_path.name,
+            _describe_output(output_path),
+        )
     except Exception as e:
         raise DuplexError(f"Failed to write output PDF: {e}") from e
 
 
+def _read_input(input_path: Path) -> BinaryIO:
+    """
+    Read an input PDF into memory for pypdf.
+
+    The bytes are read up front rather than mapped: a scanner or SMB client
+    truncating the file mid-parse would turn accesses to a mapping into
+    SIGBUS and kill the process, where a buffer copy can at worst fail to
+    parse. Holding no mapping also leaves the file free to be archived.
+    """
+    with open(input_path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            # The whole file is read front to back; let the kernel read ahead
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return io.BytesIO(f.read())
+
+
+@contextmanager
+def _open_output(output: Path | BinaryIO) -> Iterator[BinaryIO]:
+    """Open an output path for writing, or pass an already open file through."""
+    if isinstance(output, Path):
+        with open(output, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            yield f
+    else:
+        yield output
+
+
+def _describe_output(output: Path | BinaryIO) -> str:
+    """Name of an output for log messages."""
+    return output.name if isinstance(output, Path) else "output stream"
+
+
+def _sync_file(f: BinaryIO) -> None:
+    """
+    Flush Python and OS buffers of an open file to stable storage.
+
+    Once synced the pages are clean, so the kernel is told it may drop them
+    from the page cache; the output is never read back by this process.
+    """
+    f.flush()
+    os.fsync(f.fileno())
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def open_pdf(input_path: Path) -> tuple[PdfReader | None, str | None]:
+    """
+    Open and validate a PDF, returning the parsed reader for reuse.
+
+    Args:
+        input_path: Path to PDF file
+
+    Returns:
+        Tuple of (reader, error_message); reader is None when the file is invalid
+
+    Example:
+        >>> reader, error = open_pdf(Path("test.pdf"))
+        >>> if reader is not None:
+        ...     interleave_duplex(Path("test.pdf"), Path("out.pdf"), reader=reader)
+    """
+    from pypdf import PdfReader
+
+    try:
+        stream = _read_input(input_path)
+        # Reject files that are clearly not PDFs before pypdf tries to recover them
+        head = stream.read(PDF_HEADER_WINDOW)
+        stream.seek(0)
+        if head and b"%PDF-" not in head:
+            return None, "Failed to read PDF: no %PDF- header"
+        reader = PdfReader(stream)
+        if reader.is_encrypted:
+            return None, "PDF is password-protected"
+        if len(reader.pages) == 0:
+            return None, "PDF has no pages"
+        return reader, None
+    except Exception as e:
+        return None, f"Failed to read PDF: {e}"
+
+
 def validate_pdf(input_path: Path) -> tuple[bool, str | None]:
     """
     Validate that a file is a readable PDF.
@@ -156,12 +425,5 @@ def validate_pdf(input_path: Path) -> tuple[bool, str | None]:
         >>> if not valid:
         ...     print(f"Invalid: {error}")
     """
-    try:
-        reader = PdfReader(input_path)
-        if reader.is_encrypted:
-            return False, "PDF is password-protected"
-        if len(reader.pages) == 0:
-            return False, "PDF has no pages"
-        return True, None
-    except Exception as e:
-        return False, f"Failed to read PDF: {e}"
+    reader, error = open_pdf(input_path)
+    return reader is not None, error
@@ -1,11 +1,74 @@
 """I/O utilities for atomic writes and file stability checks."""
 
+import errno
+import hashlib
+import json
 import logging
+import os
+import shutil
+import tempfile
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from functools import cache
+from itertools import islice
 from pathlib import Path
+from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 
+# Advisory file locks need fcntl, which is missing on Windows
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Name of the content-hash index kept in the archive directory
+HASH_INDEX_NAME = ".duplexer_hashes.json"
+
+# Most recent files the hash index remembers; it is rewritten for every file
+HASH_INDEX_MAX_ENTRIES = 10_000
+
+# Read size used when hashing file contents
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Write buffer for output PDFs; pypdf issues many small writes per object
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# Permissions for published outputs, before the umask is applied
+OUTPUT_FILE_MODE = 0o644
+
+# Directory in the archive holding interleaved results keyed by input hash
+RESULT_CACHE_NAME = ".duplexer_cache"
+
+# Directory in the archive holding per-input processing locks
+LOCK_DIR_NAME = ".duplexer_locks"
+
+# Filesystem types on which inotify does not see changes made by other hosts
+NETWORK_FS_TYPES = frozenset(
+    {
+        "nfs",
+        "nfs4",
+        "cifs",
+        "smb3",
+        "smbfs",
+        "9p",
+        "afs",
+        "ceph",
+        "glusterfs",
+        "lustre",
+        "fuse.sshfs",
+        "fuse.rclone",
+        "fuse.s3fs",
+        "fuse.gcsfuse",
+        "fuse.glusterfs",
+        "fuse.cephfs",
+    }
+)
+
 
 def ensure_dir(path: Path) -> None:
     """
@@ -16,26 +79,310 @@ def ensure_dir(path: Path) -> None:
     """
     if not path.exists():
         path.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Created directory: {path}")
+        logger.debug("Created directory: %s", path)
+
+
+def fsync_dir(path: Path) -> None:
+    """
+    Flush directory entry changes, such as a completed rename, to disk.
+
+    Without this, a crash shortly after ``os.replace`` can lose the rename
+    even though the file data itself was synced.
+
+    Args:
+        path: Directory to sync
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError as e:
+        # Directories cannot be opened on every platform (e.g. Windows)
+        logger.debug("Cannot open directory %s for fsync: %s", path, e)
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug("Failed to fsync directory %s: %s", path, e)
+    finally:
+        os.close(fd)
+
+
+class StatCache:
+    """
+    Memoize ``stat()`` results for the duration of a single scan or callback.
+
+    Readiness and already-processed checks look at the same handful of paths;
+    on network filesystems every ``stat`` is a round-trip, so each path is
+    only stat'ed once per cache instance. Create a fresh cache per scan so
+    results never go stale across ticks.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries: dict[str, os.stat_result | None] = {}
+        self._listings: dict[str, frozenset[str]] = {}
+
+    def get(self, path: Path) -> os.stat_result | None:
+        """
+        Return the (cached) stat result for a path.
+
+        Args:
+            path: Path to stat
+
+        Returns:
+            Stat result, or None if the path does not exist
+
+        Raises:
+            OSError: For errors other than the path not existing
+        """
+        key = os.fspath(path)
+        if key not in self._entries:
+            try:
+                self._entries[key] = os.stat(key)
+            except (FileNotFoundError, NotADirectoryError):
+                self._entries[key] = None
+        return self._entries[key]
+
+    def put(self, path: Path, stat_result: os.stat_result | None) -> None:
+        """
+        Seed the cache with a result that is already known, e.g. from os.scandir.
+
+        Args:
+            path: Path the result belongs to
+            stat_result: Stat result, or None to record that the path does not exist
+        """
+        self._entries[os.fspath(path)] = stat_result
+
+    def put_listing(self, directory: Path, names: Iterable[str]) -> None:
+        """
+        Seed the cache with a complete directory listing.
+
+        Existence checks for paths directly inside the directory are then
+        answered from the listing without a ``stat``.
+
+        Args:
+            directory: Directory that was listed
+            names: All entry names found in the directory
+        """
+        self._listings[os.fspath(directory)] = frozenset(names)
+
+    def exists(self, path: Path) -> bool:
+        """
+        Check whether a path exists, using a seeded listing or the cached stat result.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the path exists
+        """
+        names = self._listings.get(os.fspath(path.parent))
+        if names is not None:
+            return path.name in names
+        try:
+            return self.get(path) is not None
+        except OSError:
+            return False
+
+
+def _open_tmpfile(directory: Path) -> int | None:
+    """
+    Create an unnamed temporary file in directory (Linux O_TMPFILE).
+
+    Args:
+        directory: Directory the file will later be linked into
+
+    Returns:
+        Writable file descriptor, or None if O_TMPFILE is not supported here
+    """
+    if not hasattr(os, "O_TMPFILE"):
+        return None
+    try:
+        return os.open(directory, os.O_TMPFILE | os.O_WRONLY, OUTPUT_FILE_MODE)
+    except OSError as e:
+        # Not supported by every filesystem (e.g. some network mounts)
+        logger.debug("O_TMPFILE unavailable in %s: %s", directory, e)
+        return None
+
+
+def _link_tmpfile(fd: int, output_path: Path) -> None:
+    """
+    Give an O_TMPFILE inode its final name, replacing any existing file.
+
+    Args:
+        fd: Descriptor returned by _open_tmpfile
+        output_path: Final path in the directory the file was created in
+
+    Raises:
+        OSError: If the file cannot be linked into place
+    """
+    source = f"/proc/self/fd/{fd}"
+    dir_fd = os.open(output_path.parent, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        # Passing dir_fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which
+        # resolves the /proc magic link to the unnamed inode
+        try:
+            os.link(source, output_path.name, dst_dir_fd=dir_fd)
+            return
+        except FileExistsError:
+            pass
+
+        # linkat cannot replace an existing file: link under a hidden name
+        # and rename that over the target
+        tmp_name = f".{output_path.name}.{os.urandom(4).hex()}"
+        os.link(source, tmp_name, dst_dir_fd=dir_fd)
+        try:
+            os.replace(tmp_name, output_path.name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+        except BaseException:
+            os.unlink(tmp_name, dir_fd=dir_fd)
+            raise
+    finally:
+        os.close(dir_fd)
+
+
+@cache
+def _current_umask() -> int:
+    """
+    Read the process umask once.
+
+    os.umask can only be read by setting it, so this briefly swaps it; the
+    value is cached to do that at most once per process.
+
+    Returns:
+        The umask in effect when first called
+    """
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+@contextmanager
+def atomic_output(output_path: Path, durable: bool = False) -> Iterator[BinaryIO]:
+    """
+    Open a file that only appears under its final name once fully written.
+
+    On Linux the data goes to an unnamed O_TMPFILE inode that is linked into
+    place on success, so watchers of the output directory never see a partial
+    or temporary file, and a failed write leaves nothing to clean up.
+    Elsewhere a hidden temp file in the same directory is renamed over the
+    target.
+
+    Args:
+        output_path: Final output path
+        durable: If True, fsync the directory once the file is in place
+
+    Yields:
+        Binary file to write the output to
+
+    Example:
+        >>> with atomic_output(Path("/completed/scan.duplex.pdf")) as f:
+        ...     f.write(pdf_bytes)
+    """
+    fd = _open_tmpfile(output_path.parent)
+    if fd is not None:
+        with os.fdopen(fd, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            yield f
+            f.flush()
+            _link_tmpfile(fd, output_path)
+    else:
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{output_path.name}.", dir=output_path.parent)
+        tmp_path = Path(tmp_name)
+        try:
+            # mkstemp creates 0600 files; publish with the same mode as O_TMPFILE
+            os.fchmod(fd, OUTPUT_FILE_MODE & ~_current_umask())
+            with os.fdopen(fd, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+                yield f
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        try:
+            tmp_path.replace(output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    if durable:
+        fsync_dir(output_path.parent)
 
 
-def is_file_stable(file_path: Path, stability_seconds: float) -> bool:
+class StabilityTracker:
+    """
+    Remember each file's (size, mtime_ns) across scans.
+
+    The mtime-age check compares a file server's timestamps with our clock; if
+    the server runs ahead, a finished file never looks old enough. A file whose
+    sample has not changed for the stability window of local time is stable
+    regardless of its mtime.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no samples."""
+        self._samples: dict[str, tuple[int, int, float]] = {}
+
+    def unchanged_for(self, path: Path, stat_result: os.stat_result) -> float:
+        """
+        Record a sample and report how long it has been unchanged.
+
+        Args:
+            path: File the stat result belongs to
+            stat_result: Current stat result
+
+        Returns:
+            Seconds since the sample last changed; 0.0 for new or changed files
+        """
+        key = os.fspath(path)
+        sample = (stat_result.st_size, stat_result.st_mtime_ns)
+        now = time.monotonic()
+        previous = self._samples.get(key)
+        if previous is None or previous[:2] != sample:
+            self._samples[key] = (*sample, now)
+            return 0.0
+        return now - previous[2]
+
+    def retain(self, paths: Iterable[str]) -> None:
+        """
+        Drop samples for files that are gone or were handed off.
+
+        Args:
+            paths: Paths (as strings) whose samples should be kept
+        """
+        keep = set(paths)
+        for key in [key for key in self._samples if key not in keep]:
+            del self._samples[key]
+
+
+def is_file_stable(
+    file_path: Path,
+    stability_seconds: float,
+    stat_cache: StatCache | None = None,
+    tracker: StabilityTracker | None = None,
+    now: float | None = None,
+) -> bool:
     """
     Check if file size has been stable for the specified duration.
 
     Args:
         file_path: Path to file to check
         stability_seconds: Time in seconds file must be unchanged
+        stat_cache: Optional cache shared with other checks on the same file
+        tracker: Optional samples from earlier scans; a file unchanged across
+            them for stability_seconds is stable even if its mtime is recent
+        now: Wall-clock time (``time.time()``) to compare mtimes against, so a
+            scan can read the clock once for all of its files
 
     Returns:
         True if file is stable, False otherwise
     """
-    if not file_path.exists():
-        return False
+    if stat_cache is None:
+        stat_cache = StatCache()
 
     try:
-        stat = file_path.stat()
-        current_time = time.time()
+        # A regular stat revalidates cached attributes on network mounts; a
+        # "don't sync" statx would answer from a stale mtime and call a file
+        # that is still being written stable
+        stat = stat_cache.get(file_path)
+        if stat is None:
+            return False
+        current_time = time.time() if now is None else now
         modified_time = stat.st_mtime
 
         # Check if enough time has passed since last modification
@@ -43,39 +390,84 @@ def is_file_stable(file_path: Path, stability_seconds: float) -> bool:
 
         if time_since_modified >= stability_seconds:
             logger.debug(
-                f"{file_path.name} is stable "
-                f"(modified {time_since_modified:.1f}s ago >= {stability_seconds}s)"
+                "%s is stable (modified %.1fs ago >= %ss)",
+                file_path.name,
+                time_since_modified,
+                stability_seconds,
+            )
+            return True
+        elif (
+            tracker is not None
+            and (unchanged := tracker.unchanged_for(file_path, stat)) >= stability_seconds
+        ):
+            logger.debug(
+                "%s is stable (unchanged for %.1fs, mtime %.1fs ago)",
+                file_path.name,
+                unchanged,
+                time_since_modified,
             )
             return True
         else:
             logger.debug(
-                f"{file_path.name} is not stable yet "
-                f"(modified {time_since_modified:.1f}s ago < {stability_seconds}s)"
+                "%s is not stable yet (modified %.1fs ago < %ss)",
+                file_path.name,
+                time_since_modified,
+                stability_seconds,
             )
             return False
     except Exception as e:
-        logger.warning(f"Failed to check file stability for {file_path}: {e}")
+        logger.warning("Failed to check file stability for %s: %s", file_path, e)
         return False
 
 
-def has_ready_file(file_path: Path) -> bool:
+def get_ready_path(file_path: Path) -> Path:
+    """
+    Construct the .ready sidecar path for a given file.
+
+    Args:
+        file_path: File the sidecar belongs to
+
+    Returns:
+        Sidecar path
+
+    Example:
+        >>> get_ready_path(Path("/ingest/scan.pdf"))
+        PosixPath('/ingest/scan.pdf.ready')
+    """
+    return file_path.with_name(file_path.name + ".ready")
+
+
+def has_ready_file(
+    file_path: Path,
+    stat_cache: StatCache | None = None,
+    ready_path: Path | None = None,
+) -> bool:
     """
     Check if a .ready sidecar file exists for the given file.
 
     Args:
         file_path: Path to check for ready file
+        stat_cache: Optional cache shared with other checks on the same file
+        ready_path: Precomputed sidecar path, to avoid rebuilding it per call
 
     Returns:
         True if .ready file exists
     """
-    ready_path = Path(str(file_path) + ".ready")
-    exists = ready_path.exists()
+    if ready_path is None:
+        ready_path = get_ready_path(file_path)
+    exists = stat_cache.exists(ready_path) if stat_cache else ready_path.exists()
     if exists:
-        logger.debug(f"Found ready file: {ready_path.name}")
+        logger.debug("Found ready file: %s", ready_path.name)
     return exists
 
 
-def is_file_ready(file_path: Path, require_ready_file: bool, stability_seconds: float) -> bool:
+def is_file_ready(
+    file_path: Path,
+    require_ready_file: bool,
+    stability_seconds: float,
+    stat_cache: StatCache | None = None,
+    tracker: StabilityTracker | None = None,
+) -> bool:
     """
     Determine if file is ready for processing.
 
@@ -83,61 +475,522 @@ def is_file_ready(file_path: Path, require_ready_file: bool, stability_seconds:
         file_path: Path to file to check
         require_ready_file: If True, require .ready sidecar file
         stability_seconds: Seconds file must be stable if not using ready file
+        stat_cache: Optional cache shared with other checks on the same file
+        tracker: Optional stability samples from earlier scans
 
     Returns:
         True if file is ready to process
     """
     if require_ready_file:
-        return has_ready_file(file_path)
+        return has_ready_file(file_path, stat_cache)
     else:
-        return is_file_stable(file_path, stability_seconds)
+        return is_file_stable(file_path, stability_seconds, stat_cache, tracker)
 
 
 def already_processed(
-    input_path: Path, output_dir: Path, archive_dir: Path, output_suffix: str
+    input_path: Path,
+    output_dir: Path,
+    archive_dir: Path,
+    output_suffix: str,
+    stat_cache: StatCache | None = None,
 ) -> bool:
     """
-    Check if file has already been processed.
+    Check if file has already been processed, by name or by content.
 
     Args:
         input_path: Input file path
         output_dir: Output directory
         archive_dir: Archive directory
         output_suffix: Suffix added to output files (e.g., ".duplex")
+        stat_cache: Optional cache shared with other checks on the same file
 
     Returns:
         True if file has already been processed
     """
-    stem = input_path.stem
-    ext = input_path.suffix
+    if stat_cache is None:
+        stat_cache = StatCache()
 
     # Check if output exists and is newer than input
-    output_name = f"{stem}{output_suffix}{ext}"
+    output_name = output_name_for(input_path.name, output_suffix)
     output_path = output_dir / output_name
 
-    if output_path.exists():
-        try:
-            input_mtime = input_path.stat().st_mtime
-            output_mtime = output_path.stat().st_mtime
-            if output_mtime >= input_mtime:
-                logger.debug(f"{input_path.name} already processed (output {output_name} is newer)")
-                return True
-        except Exception as e:
-            logger.warning(f"Failed to compare timestamps: {e}")
+    try:
+        output_stat = stat_cache.get(output_path)
+        input_stat = stat_cache.get(input_path) if output_stat else None
+        if output_stat and input_stat and output_stat.st_mtime >= input_stat.st_mtime:
+            logger.debug("%s already processed (output %s is newer)", input_path.name, output_name)
+            return True
+    except Exception as e:
+        logger.warning("Failed to compare timestamps: %s", e)
 
     # Check if file exists in archive
     archive_path = archive_dir / input_path.name
-    if archive_path.exists():
-        logger.debug(f"{input_path.name} already archived")
+    if stat_cache.exists(archive_path):
+        logger.debug("%s already archived", input_path.name)
         return True
 
+    # Check if identical content was processed under a different name
+    index = load_hash_index(archive_dir)
+    if index:
+        try:
+            input_stat = stat_cache.get(input_path)
+            if input_stat is None:
+                raise FileNotFoundError(input_path)
+        except OSError as e:
+            logger.warning("Failed to stat %s: %s", input_path, e)
+            return False
+
+        entry = _find_indexed_entry(index, input_path, input_stat)
+        if entry and (output_dir / entry["output"]).exists():
+            logger.debug(
+                "%s has same content as already processed %s", input_path.name, entry["output"]
+            )
+            return True
+
     return False
 
 
+def _list_names(directory: Path) -> frozenset[str]:
+    """
+    List the entry names of a directory without stat'ing them.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Names in the directory; empty if the directory is missing
+    """
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError as e:
+        logger.debug("Cannot scan %s: %s", directory, e)
+        return frozenset()
+
+
+def bulk_already_processed(
+    paths: list[Path],
+    output_dir: Path,
+    archive_dir: Path,
+    output_suffix: str,
+    stat_cache: StatCache | None = None,
+) -> set[Path]:
+    """
+    Check many input files against the output and archive directories at once.
+
+    Equivalent to calling already_processed for each path, but output_dir and
+    archive_dir are each listed a single time instead of stat'ed per file.
+    Only outputs whose name matches an input are stat'ed, so the cost does
+    not grow with the number of files already in those directories.
+
+    Args:
+        paths: Input file paths
+        output_dir: Output directory
+        archive_dir: Archive directory
+        output_suffix: Suffix added to output files (e.g., ".duplex")
+        stat_cache: Optional cache shared with other checks on the same files
+
+    Returns:
+        Subset of paths that have already been processed
+    """
+    if not paths:
+        return set()
+    if stat_cache is None:
+        stat_cache = StatCache()
+
+    outputs = _list_names(output_dir)
+    archived = _list_names(archive_dir)
+    index = load_hash_index(archive_dir)
+    indexed_sizes = {entry.get("size") for entry in index.values()}
+
+    done: set[Path] = set()
+    for input_path in paths:
+        output_name = output_name_for(input_path.name, output_suffix)
+
+        if input_path.name in archived:
+            logger.debug("%s already archived", input_path.name)
+            done.add(input_path)
+            continue
+
+        try:
+            input_stat = stat_cache.get(input_path)
+        except OSError as e:
+            logger.warning("Failed to stat %s: %s", input_path, e)
+            continue
+        if input_stat is None:
+            continue
+
+        try:
+            output_stat = (
+                stat_cache.get(output_dir / output_name) if output_name in outputs else None
+            )
+        except OSError:
+            output_stat = None
+        if output_stat is not None and output_stat.st_mtime >= input_stat.st_mtime:
+            logger.debug("%s already processed (output %s is newer)", input_path.name, output_name)
+            done.add(input_path)
+            continue
+
+        if input_stat.st_size in indexed_sizes:
+            entry = _find_indexed_entry(index, input_path, input_stat)
+            if entry and entry["output"] in outputs:
+                logger.debug(
+                    "%s has same content as already processed %s", input_path.name, entry["output"]
+                )
+                done.add(input_path)
+
+    return done
+
+
+def _file_signature(stat_result: os.stat_result) -> list[int]:
+    """Identify a file version by device, inode and mtime, as stored in the hash index."""
+    return [stat_result.st_dev, stat_result.st_ino, stat_result.st_mtime_ns]
+
+
+def _find_indexed_entry(
+    index: dict[str, dict], input_path: Path, input_stat: os.stat_result
+) -> dict | None:
+    """
+    Look up the hash index entry for an input's content, hashing only if needed.
+
+    Entries record the input's signature when it was processed, so the very
+    same unchanged file (e.g. moved back out of the archive) is recognized
+    without reading it. Otherwise the file is hashed, but only when a
+    processed file had the same size.
+
+    Args:
+        index: Hash index from load_hash_index
+        input_path: Input file to look up
+        input_stat: Current stat result of input_path
+
+    Returns:
+        Matching index entry, or None if there is none or the file cannot be read
+    """
+    candidates = [entry for entry in index.values() if entry.get("size") == input_stat.st_size]
+    if not candidates:
+        return None
+    signature = _file_signature(input_stat)
+    for entry in candidates:
+        if entry.get("signature") == signature:
+            return entry
+    try:
+        file_hash = compute_file_hash(input_path)
+    except OSError as e:
+        # E.g. archived by another instance meanwhile, or unreadable
+        logger.warning("Failed to hash %s: %s", input_path.name, e)
+        return None
+    return index.get(file_hash)
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """
+    Compute the SHA-256 hex digest of a file's contents.
+
+    Args:
+        file_path: Path to file to hash
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Parsed hash indexes by path, with the (inode, size, mtime) they were read at
+_hash_index_cache: dict[str, tuple[tuple[int, int, int], dict[str, dict]]] = {}
+
+
+def load_hash_index(archive_dir: Path) -> dict[str, dict]:
+    """
+    Load the content-hash index of processed files.
+
+    The parsed index is kept per process and only re-read when the file
+    changes, so per-file checks cost a ``stat`` instead of a JSON parse of
+    the whole history. The index is always replaced by rename, which gives
+    it a new inode even when the mtime does not move.
+
+    Args:
+        archive_dir: Archive directory holding the index
+
+    Returns:
+        Mapping of SHA-256 digest to ``{"output": name, "size": bytes,
+        "signature": [dev, inode, mtime_ns]}``;
+        empty if the index is missing or unreadable. The mapping is shared
+        and must not be modified.
+    """
+    index_path = archive_dir / HASH_INDEX_NAME
+    key = os.fspath(index_path)
+    try:
+        st = os.stat(key)
+        cached = _hash_index_cache.get(key)
+        if cached is not None and cached[0] == (st.st_ino, st.st_size, st.st_mtime_ns):
+            return cached[1]
+        with open(key, encoding="utf-8") as f:
+            # Sign what was actually read, in case it was replaced meanwhile
+            st = os.fstat(f.fileno())
+            index = json.load(f)
+    except FileNotFoundError:
+        _hash_index_cache.pop(key, None)
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable hash index %s: %s", index_path, e)
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    _hash_index_cache[key] = ((st.st_ino, st.st_size, st.st_mtime_ns), index)
+    return index
+
+
+def record_processed_hash(
+    input_path: Path, archive_dir: Path, output_name: str, file_hash: str | None = None
+) -> None:
+    """
+    Record the content hash of a successfully processed file.
+
+    The index is rewritten atomically and keeps the HASH_INDEX_MAX_ENTRIES
+    most recently recorded files. Concurrent writers may drop each other's
+    entries, and evicted files are no longer recognized by content; either
+    only means a duplicate could be processed again.
+
+    Args:
+        input_path: Input file that was processed (must still exist)
+        archive_dir: Archive directory holding the index
+        output_name: File name of the generated output
+        file_hash: Precomputed SHA-256 of the input, to avoid hashing it again
+    """
+    try:
+        if file_hash is None:
+            file_hash = compute_file_hash(input_path)
+        input_stat = input_path.stat()
+
+        entry = {
+            "output": output_name,
+            "size": input_stat.st_size,
+            "signature": _file_signature(input_stat),
+        }
+        index = dict(load_hash_index(archive_dir))
+        # Re-recorded content moves to the newest end
+        index.pop(file_hash, None)
+        index[file_hash] = entry
+        excess = len(index) - HASH_INDEX_MAX_ENTRIES
+        if excess > 0:
+            # Drop the oldest entries so each rewrite stays bounded
+            index = dict(islice(index.items(), excess, None))
+
+        try:
+            fd, tmp_name = tempfile.mkstemp(prefix=HASH_INDEX_NAME, dir=archive_dir)
+        except FileNotFoundError:
+            # The archive normally exists; only create it when the write shows it is missing
+            ensure_dir(archive_dir)
+            fd, tmp_name = tempfile.mkstemp(prefix=HASH_INDEX_NAME, dir=archive_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp_name, archive_dir / HASH_INDEX_NAME)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        logger.debug("Recorded hash of %s -> %s", input_path.name, output_name)
+    except Exception as e:
+        logger.warning("Failed to record hash for %s: %s", input_path.name, e)
+
+
+def result_cache_path(
+    cache_dir: Path, file_hash: str, reverse_backs: bool, insert_blank_lastback: bool
+) -> Path:
+    """
+    Construct the result cache entry for an input hash and option set.
+
+    Args:
+        cache_dir: Result cache directory
+        file_hash: SHA-256 of the input file
+        reverse_backs: Whether back pages are in reverse order
+        insert_blank_lastback: Whether a blank page is inserted for odd counts
+
+    Returns:
+        Cache entry path
+
+    Example:
+        >>> result_cache_path(Path("/cache"), "ab12", True, False)
+        PosixPath('/cache/ab12_1_0.pdf')
+    """
+    return cache_dir / f"{file_hash}_{int(reverse_backs)}_{int(insert_blank_lastback)}.pdf"
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """
+    Atomically place a hardlink (or, across devices, a copy) of source at dest.
+
+    Args:
+        source: Existing file
+        dest: Target path, replaced if it exists
+
+    Raises:
+        OSError: If neither linking nor copying succeeds
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{dest.name}.", dir=dest.parent)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        tmp_path.unlink()
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def restore_cached_result(cache_path: Path, output_path: Path) -> bool:
+    """
+    Reuse a cached interleaved result instead of processing the input again.
+
+    Args:
+        cache_path: Cache entry from result_cache_path
+        output_path: Where the output should appear
+
+    Returns:
+        True if the cached result was placed at output_path
+    """
+    if not cache_path.exists():
+        return False
+    try:
+        _link_or_copy(cache_path, output_path)
+        # Refresh the entry so pruning keeps results that are still in use
+        os.utime(cache_path)
+        logger.debug("Restored %s from result cache", output_path.name)
+        return True
+    except OSError as e:
+        logger.warning("Failed to restore cached result %s: %s", cache_path.name, e)
+        return False
+
+
+def store_cached_result(output_path: Path, cache_path: Path) -> None:
+    """
+    Add a freshly written output to the result cache.
+
+    A hardlink is used where possible, so the cache takes no extra space for
+    as long as the output itself is kept. When the output directory is on
+    another filesystem than the archive (e.g. separate bind mounts), every
+    entry is a full copy until pruned.
+
+    Args:
+        output_path: Output file that was just written
+        cache_path: Cache entry from result_cache_path
+    """
+    try:
+        try:
+            _link_or_copy(output_path, cache_path)
+        except FileNotFoundError:
+            # First entry in this cache
+            ensure_dir(cache_path.parent)
+            _link_or_copy(output_path, cache_path)
+        logger.debug("Cached result %s", cache_path.name)
+    except OSError as e:
+        logger.warning("Failed to cache result for %s: %s", output_path.name, e)
+
+
+def prune_result_cache(cache_dir: Path, max_age_seconds: float) -> int:
+    """
+    Remove cache entries that have not been written or reused recently.
+
+    Args:
+        cache_dir: Result cache directory
+        max_age_seconds: Entries older than this are removed
+
+    Returns:
+        Number of entries removed
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        removed += 1
+                except OSError as e:
+                    logger.debug("Failed to prune %s: %s", entry.name, e)
+    except FileNotFoundError:
+        return 0
+    if removed:
+        logger.info("Pruned %s expired result cache entries", removed)
+    return removed
+
+
+def _claim_destination(source: Path, dest_dir: Path) -> Path:
+    """
+    Atomically reserve a free file name in dest_dir for source.
+
+    The name is claimed by creating an empty placeholder with O_EXCL, so two
+    concurrent moves of equally named files can never pick the same target.
+    The original name and ``<stem>_1`` are tried first; after that a random
+    suffix is chosen so the cost stays constant however many copies exist.
+
+    Args:
+        source: File that is about to be moved
+        dest_dir: Destination directory
+
+    Returns:
+        Path of the (empty) placeholder that now owns the name
+
+    Raises:
+        OSError: If the placeholder cannot be created
+    """
+    base = source.stem
+    ext = source.suffix
+    for dest in (dest_dir / source.name, dest_dir / f"{base}_1{ext}"):
+        try:
+            fd = os.open(dest, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        if dest.name != source.name:
+            logger.debug("Destination exists, using: %s", dest.name)
+        return dest
+
+    fd, name = tempfile.mkstemp(prefix=f"{base}_", suffix=ext, dir=dest_dir)
+    os.close(fd)
+    dest = Path(name)
+    logger.debug("Destination exists, using: %s", dest.name)
+    return dest
+
+
+def _copy_into_place(source: Path, dest: Path) -> None:
+    """
+    Copy source over dest atomically, then remove source.
+
+    The data goes to a hidden temporary file next to dest that is renamed over
+    it, so an interrupted copy never leaves a truncated file under dest's name.
+
+    Args:
+        source: File to move
+        dest: Claimed destination on another filesystem
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{dest.name}.", dir=dest.parent)
+    os.close(fd)
+    try:
+        shutil.copy2(source, tmp_name)
+        os.replace(tmp_name, dest)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    source.unlink()
+
+
 def safe_move(source: Path, dest_dir: Path) -> Path | None:
     """
     Safely move a file to destination directory, handling name conflicts.
 
+    A plain rename is used when possible; moves across filesystems (e.g. a
+    bind-mounted archive volume) fall back to copying into place.
+
     Args:
         source: Source file path
         dest_dir: Destination directory
@@ -145,28 +998,71 @@ def safe_move(source: Path, dest_dir: Path) -> Path | None:
     Returns:
         Final destination path, or None if move failed
     """
-    ensure_dir(dest_dir)
-    dest = dest_dir / source.name
-
-    # Handle name conflicts
-    if dest.exists():
-        base = source.stem
-        ext = source.suffix
-        counter = 1
-        while dest.exists():
-            dest = dest_dir / f"{base}_{counter}{ext}"
-            counter += 1
-        logger.debug(f"Destination exists, using: {dest.name}")
+    try:
+        try:
+            dest = _claim_destination(source, dest_dir)
+        except FileNotFoundError:
+            # Only pay for the directory check when the claim shows it is missing
+            ensure_dir(dest_dir)
+            dest = _claim_destination(source, dest_dir)
+    except OSError as e:
+        logger.error("Failed to move %s to %s: %s", source, dest_dir, e)
+        return None
 
     try:
-        source.rename(dest)
-        logger.info(f"Moved {source.name} -> {dest}")
+        try:
+            os.replace(source, dest)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOTSUP):
+                raise
+            logger.debug("Cross-device move for %s, copying instead", source.name)
+            _copy_into_place(source, dest)
+        logger.info("Moved %s -> %s", source.name, dest)
         return dest
     except Exception as e:
-        logger.error(f"Failed to move {source} to {dest_dir}: {e}")
+        dest.unlink(missing_ok=True)
+        logger.error("Failed to move %s to %s: %s", source, dest_dir, e)
         return None
 
 
+def is_network_filesystem(path: Path, mounts_file: Path = Path("/proc/mounts")) -> bool:
+    """
+    Check whether a path lives on a network filesystem such as NFS or SMB.
+
+    The mount with the longest matching mount point wins. Platforms without
+    /proc/mounts are treated as local.
+
+    Args:
+        path: Path to check
+        mounts_file: Mount table to read (overridable for tests)
+
+    Returns:
+        True if the path's filesystem type is a known network filesystem
+    """
+    try:
+        lines = mounts_file.read_text().splitlines()
+    except OSError:
+        return False
+
+    target = str(path.resolve())
+    best_mount = ""
+    best_type = ""
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 3:
+            continue
+        # /proc/mounts escapes spaces in mount points as \040
+        mount_point = fields[1].replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) >= len(
+            best_mount
+        ):
+            best_mount = mount_point
+            best_type = fields[2]
+
+    return best_type in NETWORK_FS_TYPES
+
+
 def get_output_path(input_path: Path, output_dir: Path, output_suffix: str) -> Path:
     """
     Construct output path for a given input file.
@@ -183,23 +1079,135 @@ def get_output_path(input_path: Path, output_dir: Path, output_suffix: str) -> P
         >>> get_output_path(Path("scan.pdf"), Path("/out"), ".duplex")
         PosixPath('/out/scan.duplex.pdf')
     """
-    stem = input_path.stem
-    ext = input_path.suffix
-    output_name = f"{stem}{output_suffix}{ext}"
-    return output_dir / output_name
+    return output_dir / output_name_for(input_path.name, output_suffix)
 
 
-def cleanup_ready_file(file_path: Path) -> None:
+def output_name_for(input_name: str, output_suffix: str) -> str:
+    """
+    Construct the output file name for an input file name.
+
+    Works on the plain name string, so per-file checks in a scan do not
+    derive ``stem`` and ``suffix`` through separate Path objects.
+
+    Args:
+        input_name: Input file name
+        output_suffix: Suffix to add before extension
+
+    Returns:
+        Output file name
+
+    Example:
+        >>> output_name_for("scan.pdf", ".duplex")
+        'scan.duplex.pdf'
+    """
+    stem, ext = os.path.splitext(input_name)
+    return f"{stem}{output_suffix}{ext}"
+
+
+def cleanup_ready_file(file_path: Path, ready_path: Path | None = None) -> None:
     """
     Remove .ready sidecar file if it exists.
 
     Args:
         file_path: Original file path
+        ready_path: Precomputed sidecar path, to avoid rebuilding it per call
     """
-    ready_path = Path(str(file_path) + ".ready")
-    if ready_path.exists():
+    if ready_path is None:
+        ready_path = get_ready_path(file_path)
+    try:
+        ready_path.unlink()
+        logger.debug("Removed ready file: %s", ready_path.name)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Failed to remove ready file %s: %s", ready_path, e)
+
+
+# Re-entry depth of the locks held by the current thread, by input name
+_held_locks = threading.local()
+
+
+def _try_flock(lock_path: Path) -> int | None:
+    """
+    Take an exclusive flock on a lock file without blocking.
+
+    Holders unlink the file on release, so after locking, the descriptor is
+    checked to still refer to the file at lock_path; otherwise the lock was
+    taken on an orphaned inode and is retried on a fresh file.
+
+    Returns:
+        Descriptor holding the lock, or None if another holder has it
+    """
+    while True:
+        fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as e:
+            os.close(fd)
+            if isinstance(e, BlockingIOError):
+                return None
+            raise
+        try:
+            if os.path.samestat(os.fstat(fd), os.stat(lock_path)):
+                return fd
+        except FileNotFoundError:
+            pass
+        os.close(fd)
+
+
+@contextmanager
+def file_state_lock(lock_dir: Path, name: str) -> Iterator[bool]:
+    """
+    Hold a cross-process advisory lock for one input file while processing it.
+
+    Instances sharing an ingest directory use this to avoid interleaving and
+    moving the same file at once. The lock is re-entrant within a thread and
+    never blocks: when another thread or process holds it, the context yields
+    False and the caller should leave the file alone. Without fcntl (Windows)
+    there is no cross-process locking and the context always yields True.
+
+    Args:
+        lock_dir: Directory for lock files, created if missing
+        name: Input file name the lock is keyed by
+
+    Yields:
+        True if the lock is held for the duration of the context
+    """
+    if not FCNTL_AVAILABLE:
+        yield True
+        return
+
+    if getattr(_held_locks, "pid", None) != os.getpid():
+        # A forked child inherits its parent's thread state but not its locks
+        _held_locks.pid = os.getpid()
+        _held_locks.depth = {}
+    depth: dict[str, int] = _held_locks.depth
+    if name in depth:
+        # Already held further up this thread's stack; no syscalls needed
+        depth[name] += 1
         try:
-            ready_path.unlink()
-            logger.debug(f"Removed ready file: {ready_path.name}")
-        except Exception as e:
-            logger.warning(f"Failed to remove ready file {ready_path}: {e}")
+            yield True
+        finally:
+            depth[name] -= 1
+        return
+
+    lock_path = lock_dir / f"{name}.lock"
+    try:
+        fd = _try_flock(lock_path)
+    except FileNotFoundError:
+        # Created on first use rather than checked on every call
+        ensure_dir(lock_dir)
+        fd = _try_flock(lock_path)
+    if fd is None:
+        logger.debug("Lock for %s is held elsewhere", name)
+        yield False
+        return
+
+    depth[name] = 1
+    try:
+        yield True
+    finally:
+        del depth[name]
+        # Unlink while still locked, so the next holder locks a fresh file
+        lock_path.unlink(missing_ok=True)
+        os.close(fd)
@@ -2,22 +2,48 @@
 
 from __future__ import annotations
 
+import fnmatch
 import logging
+import os
+import re
 import signal
 import threading
 import time
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from watchdog.observers.api import BaseObserver
 
+    from duplexer.io_utils import StatCache
+
 logger = logging.getLogger(__name__)
 
+# Number of processed paths a watcher remembers
+DEFAULT_MAX_PROCESSED = 10_000
+
+# A burst of events is checked after at most this many stability windows,
+# even if new files keep arriving
+MAX_BATCH_WINDOWS = 3
+
+# A directory mtime younger than this may hide changes on filesystems with
+# coarse timestamps, so it is not used to skip scans
+DIR_MTIME_SETTLE_NS = 2_000_000_000
+
 # Try to import watchdog, fall back to polling if unavailable
 try:
-    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.events import (
+        FileClosedEvent,
+        FileCreatedEvent,
+        FileModifiedEvent,
+        FileMovedEvent,
+        FileSystemEvent,
+        FileSystemEventHandler,
+    )
     from watchdog.observers import Observer
 
     WATCHDOG_AVAILABLE = True
@@ -27,6 +53,121 @@ except ImportError:
     logger.debug("Watchdog not available, will use polling")
 
 
+class ProcessedSet:
+    """
+    Bounded record of files already handed to the process callback.
+
+    The oldest entries are evicted once max_size is exceeded, so a long-running
+    watcher does not grow without bound. An evicted file that is still present
+    is simply offered again and then skipped by the already-processed checks.
+    Membership is exact rather than probabilistic (e.g. a bloom filter): a
+    false positive would silently leave a new scan unprocessed.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_PROCESSED):
+        """
+        Initialize an empty set.
+
+        Args:
+            max_size: Maximum number of paths remembered
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, object] = OrderedDict()
+
+    def __contains__(self, path: object) -> bool:
+        """Check whether a path has been recorded."""
+        return isinstance(path, str | os.PathLike) and os.fspath(path) in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of remembered paths."""
+        return len(self._entries)
+
+    def claim(self, path: Path) -> bool:
+        """
+        Record a path unless it is already present, as one atomic step.
+
+        The check and insert are a single ``setdefault`` call, so a watchdog
+        handler and a directory scan racing for the same file cannot both win.
+
+        Args:
+            path: Path about to be processed
+
+        Returns:
+            True if this call recorded the path, False if it was already present
+        """
+        key = os.fspath(path)
+        token = object()
+        if self._entries.setdefault(key, token) is not token:
+            return False
+        self._evict()
+        return True
+
+    def add(self, path: Path) -> None:
+        """
+        Record a path, evicting the oldest entries if the set is full.
+
+        Args:
+            path: Path that was processed
+        """
+        key = os.fspath(path)
+        self._entries[key] = None
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop the oldest entries until the set fits max_size."""
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def compile_name_pattern(pattern: str) -> re.Pattern[str]:
+    """
+    Compile a file name glob into a regex, once, for matching directory entries.
+
+    Like ``Path.glob``, hidden files only match patterns that start with a dot.
+    ``.ready`` sidecar files never match.
+
+    Args:
+        pattern: Glob pattern for file names (e.g., "*.pdf")
+
+    Returns:
+        Compiled pattern; use ``.match(name)`` on bare file names
+
+    Example:
+        >>> bool(compile_name_pattern("*.pdf").match("scan.pdf"))
+        True
+        >>> bool(compile_name_pattern("*.pdf").match(".scan.pdf"))
+        False
+    """
+    hidden = "" if pattern.startswith(".") else r"(?!\.)"
+    return re.compile(hidden + r"(?!.*\.ready\Z)" + fnmatch.translate(pattern))
+
+
+def name_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Build a predicate that tells whether a bare file name matches a glob.
+
+    Matches exactly like :func:`compile_name_pattern`, but plain extension
+    globs such as ``*.pdf`` skip the regex and use ``str.endswith``.
+
+    Args:
+        pattern: Glob pattern for file names (e.g., "*.pdf")
+
+    Returns:
+        Callable taking a file name and returning True if it matches
+    """
+    suffix = pattern[1:]
+    if (
+        pattern.startswith("*.")
+        and not any(char in suffix for char in "*?[")
+        and not suffix.endswith(".ready")
+    ):
+        return lambda name: name.endswith(suffix) and not name.startswith(".")
+
+    name_re = compile_name_pattern(pattern)
+    return lambda name: name_re.match(name) is not None
+
+
 class ProcessingHandler(FileSystemEventHandler):
     """Watchdog event handler for processing files."""
 
@@ -36,6 +177,7 @@ class ProcessingHandler(FileSystemEventHandler):
         process_callback: Callable[[Path], None],
         require_ready_file: bool,
         stability_seconds: float,
+        processed_files: ProcessedSet | None = None,
     ):
         """
         Initialize handler.
@@ -45,87 +187,250 @@ class ProcessingHandler(FileSystemEventHandler):
             process_callback: Function to call for each file
             require_ready_file: If True, only process when .ready file exists
             stability_seconds: Seconds to wait for file stability
+            processed_files: Record shared with the owning watcher, so files
+                claimed by a directory scan are not processed again on events
         """
         super().__init__()
         self.pattern = pattern
+        self._match_name = name_matcher(pattern)
         self.process_callback = process_callback
         self.require_ready_file = require_ready_file
         self.stability_seconds = stability_seconds
-        self.processed_files: set[Path] = set()
-
-        # Pending files: {path: timer}
-        self.pending_files: dict[Path, threading.Timer] = {}
-        self.pending_lock = threading.Lock()
+        self.processed_files = processed_files if processed_files is not None else ProcessedSet()
+
+        # Pending files: {path: monotonic time of its latest event}. The whole
+        # set shares one deadline, so a scanner burst is checked in one wakeup.
+        self.pending_files: dict[Path, float] = {}
+        self.pending_lock = threading.Condition()
+        self._batch_started: float | None = None
+        self._batch_deadline: float | None = None
+        self._samples: dict[Path, tuple[int, int]] = {}
+        self._closed = False
+        self._drain_thread = threading.Thread(
+            target=self._drain_pending, name="duplexer-debounce", daemon=True
+        )
+        self._drain_thread.start()
 
     def on_created(self, event: FileSystemEvent) -> None:
         """Handle file creation events."""
         if event.is_directory:
             return
 
-        file_path = Path(str(event.src_path))  # Ensure string conversion from bytes
-        logger.debug(f"File created event: {file_path}")
-        self._mark_pending(file_path)
+        src_path = os.fsdecode(event.src_path)
+        logger.debug("File created event: %s", src_path)
+        self._mark_pending(src_path)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
         if event.is_directory:
             return
 
-        file_path = Path(str(event.src_path))  # Ensure string conversion from bytes
-        logger.debug(f"File modified event: {file_path}")
-        self._mark_pending(file_path)
+        src_path = os.fsdecode(event.src_path)
+        logger.debug("File modified event: %s", src_path)
+        self._mark_pending(src_path)
 
-    def _mark_pending(self, file_path: Path) -> None:
-        """Mark a file as pending for stability check."""
-        if not file_path.match(self.pattern):
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle files renamed into place, e.g. after an upload to a temporary name."""
+        if event.is_directory:
+            return
+
+        dest_path = os.fsdecode(event.dest_path)
+        logger.debug("File moved event: %s", dest_path)
+        self._mark_pending(dest_path)
+
+    def on_closed(self, event: FileSystemEvent) -> None:
+        """Handle a writer closing a file; its stat sample is then final."""
+        if event.is_directory:
             return
-        if file_path in self.processed_files:
+
+        src_path = os.fsdecode(event.src_path)
+        logger.debug("File closed event: %s", src_path)
+        self._mark_pending(src_path)
+
+    def _mark_pending(self, src_path: str) -> None:
+        """Mark a file (or the file a .ready sidecar belongs to) as pending for stability check."""
+        name = os.path.basename(src_path)
+        sidecar = self.require_ready_file and name.endswith(".ready")
+        if sidecar:
+            # The sidecar usually arrives after its file, whose own events
+            # found it not ready yet; check the file again now
+            src_path = src_path.removesuffix(".ready")
+            name = name.removesuffix(".ready")
+
+        # Reject ignored files before paying for Path construction
+        if not self._match_name(name):
             return
-        if file_path.name.endswith(".ready"):
+        if src_path in self.processed_files:
             return
 
-        with self.pending_lock:
-            if file_path in self.pending_files:
-                # File already pending, cancel old timer and reschedule
-                old_timer = self.pending_files[file_path]
-                old_timer.cancel()
-
-            # Schedule stability check
-            timer = threading.Timer(
-                self.stability_seconds, self._check_file_ready, args=(file_path,)
-            )
-            timer.daemon = True
-            self.pending_files[file_path] = timer
-            timer.start()
-            logger.debug(
-                f"Marked {file_path.name} as pending, will check in {self.stability_seconds}s"
-            )
-
-    def _check_file_ready(self, file_path: Path) -> None:
-        """Check if a file is ready and process it."""
-        from duplexer.io_utils import is_file_ready
+        file_path = Path(src_path)
+
+        # First stability sample, compared against a fresh stat at the deadline
+        try:
+            sample = _stat_sample(os.stat(src_path))
+        except OSError:
+            sample = None
+        if sidecar and sample is None:
+            # Sidecar without its file; the file's own events will follow
+            return
 
         with self.pending_lock:
-            # Remove from pending
-            if file_path in self.pending_files:
-                del self.pending_files[file_path]
+            self._add_to_batch(file_path, sample)
+        logger.debug(
+            "Marked %s as pending, will check in %ss", file_path.name, self.stability_seconds
+        )
+
+    def _add_to_batch(self, file_path: Path, sample: tuple[int, int] | None) -> None:
+        """
+        Add a file to the pending batch; the caller holds ``pending_lock``.
+
+        Each event pushes the shared deadline back, debouncing the burst as a
+        whole, but never beyond MAX_BATCH_WINDOWS windows after it started.
+
+        Args:
+            file_path: File the event was for
+            sample: (size, mtime_ns) taken at event time, or None if unavailable
+        """
+        now = time.monotonic()
+        self.pending_files[file_path] = now
+        if sample is None:
+            self._samples.pop(file_path, None)
+        else:
+            self._samples[file_path] = sample
+        if self._batch_started is None:
+            self._batch_started = now
+        self._batch_deadline = min(
+            now + self.stability_seconds,
+            self._batch_started + MAX_BATCH_WINDOWS * self.stability_seconds,
+        )
+        self.pending_lock.notify()
 
+    def _next_batch(self) -> list[tuple[Path, float, tuple[int, int] | None]] | None:
+        """
+        Block until the pending batch reaches its deadline, then take it.
+
+        Returns:
+            (path, last event time, stat sample) per pending file, or None once
+            the handler is closed
+        """
+        with self.pending_lock:
+            while not self._closed:
+                if self._batch_deadline is None:
+                    self.pending_lock.wait()
+                    continue
+
+                remaining = self._batch_deadline - time.monotonic()
+                if remaining > 0:
+                    self.pending_lock.wait(timeout=remaining)
+                    continue
+
+                batch = [
+                    (file_path, seen, self._samples.get(file_path))
+                    for file_path, seen in self.pending_files.items()
+                ]
+                self.pending_files.clear()
+                self._samples.clear()
+                self._batch_started = self._batch_deadline = None
+                return batch
+        return None
+
+    def _drain_pending(self) -> None:
+        """Check pending batches as their debounce deadlines pass."""
+        while (batch := self._next_batch()) is not None:
+            self._check_batch(batch)
+
+    def close(self) -> None:
+        """Stop the debounce thread; pending files are dropped."""
+        with self.pending_lock:
+            self._closed = True
+            self.pending_lock.notify_all()
+        self._drain_thread.join(timeout=5)
+
+    def _check_batch(self, batch: list[tuple[Path, float, tuple[int, int] | None]]) -> None:
+        """Check a batch of pending files and process the ready ones."""
+        from duplexer.io_utils import StatCache, has_ready_file, is_file_ready
+
+        ready: list[Path] = []
+        stat_cache = StatCache()
+        now = time.monotonic()
+
+        if self.require_ready_file and len(batch) > 1:
+            # One listing answers every sidecar lookup in the batch
+            directory = batch[0][0].parent
+            try:
+                stat_cache.put_listing(directory, os.listdir(directory))
+            except OSError as e:
+                logger.debug("Failed to list %s, checking sidecars one by one: %s", directory, e)
+
+        # The batch was already taken off the pending set, so the lock is only
+        # needed to re-arm files; stats (slow on network mounts) run without it
+        # and never hold up event delivery. claim() keeps the hand-off atomic.
+        for file_path, seen, sample in batch:
             # Skip if already processed
             if file_path in self.processed_files:
-                return
+                continue
 
-            # Check if file is ready
-            if is_file_ready(file_path, self.require_ready_file, self.stability_seconds):
-                self.processed_files.add(file_path)
+            if self._unchanged_since_event(file_path, seen, sample, stat_cache, now):
+                # Quiet for a full window and identical to the event-time
+                # sample; no need to trust the file server's clock
+                file_ready = not self.require_ready_file or has_ready_file(file_path, stat_cache)
+            else:
+                file_ready = is_file_ready(
+                    file_path, self.require_ready_file, self.stability_seconds, stat_cache
+                )
+
+            if file_ready:
+                # A directory scan on another thread may have claimed it meanwhile
+                if self.processed_files.claim(file_path):
+                    ready.append(file_path)
+            elif self._still_changing(file_path, stat_cache):
+                # Flushed early by a long burst; give it another window
+                with self.pending_lock:
+                    self._add_to_batch(file_path, _stat_sample(stat_cache.get(file_path)))
             else:
-                logger.debug(f"{file_path.name} not ready yet, skipping")
-                return
+                logger.debug("%s not ready yet, skipping", file_path.name)
+
+        for file_path in ready:
+            try:
+                self.process_callback(file_path)
+            except Exception as e:
+                logger.error("Failed to process %s: %s", file_path.name, e)
+
+    def _unchanged_since_event(
+        self,
+        file_path: Path,
+        seen: float,
+        sample: tuple[int, int] | None,
+        stat_cache: StatCache,
+        now: float,
+    ) -> bool:
+        """Check whether a file had no events for a full window and still matches its sample."""
+        if sample is None or now - seen < self.stability_seconds:
+            return False
+        try:
+            stat = stat_cache.get(file_path)
+        except OSError:
+            return False
+        return stat is not None and _stat_sample(stat) == sample
 
-        # Process outside the lock
+    def _still_changing(self, file_path: Path, stat_cache: StatCache) -> bool:
+        """Check whether a file exists but was modified within the stability window."""
         try:
-            self.process_callback(file_path)
-        except Exception as e:
-            logger.error(f"Failed to process {file_path.name}: {e}")
+            stat = stat_cache.get(file_path)
+        except OSError:
+            return False
+        return stat is not None and time.time() - stat.st_mtime < self.stability_seconds
+
+
+def _stat_sample(stat: os.stat_result | None) -> tuple[int, int] | None:
+    """Reduce a stat result to the (size, mtime_ns) pair compared for stability."""
+    return None if stat is None else (stat.st_size, stat.st_mtime_ns)
+
+
+def _log_callback_failure(file_path: Path, future: Future) -> None:
+    """Log an error raised by a process callback running on the watcher's pool."""
+    if not future.cancelled() and (error := future.exception()) is not None:
+        logger.error("Failed to process %s: %s", file_path.name, error)
 
 
 class FileWatcher:
@@ -140,6 +445,9 @@ class FileWatcher:
         stability_seconds: float = 5.0,
         require_ready_file: bool = False,
         use_polling: bool = False,
+        skip_filter: Callable[[list[Path]], set[Path]] | None = None,
+        max_processed: int = DEFAULT_MAX_PROCESSED,
+        max_workers: int | None = None,
     ):
         """
         Initialize file watcher.
@@ -152,103 +460,265 @@ class FileWatcher:
             stability_seconds: Time file must be stable before processing
             require_ready_file: If True, require .ready sidecar file
             use_polling: If True, force polling even if watchdog is available
+            skip_filter: Optional batch check run once per scan; returns the
+                ready files that need no processing (e.g. already processed)
+            max_processed: Number of processed paths remembered to avoid
+                offering the same file twice
+            max_workers: If set, run process_callback on a thread pool of this
+                size instead of inline; leave unset when the callback already
+                hands work off (e.g. to a process pool)
         """
         self.input_dir = input_dir
         self.process_callback = process_callback
         self.pattern = pattern
+        self._match_name = name_matcher(pattern)
         self.poll_interval = poll_interval
         self.stability_seconds = stability_seconds
         self.require_ready_file = require_ready_file
         self.use_polling = use_polling or not WATCHDOG_AVAILABLE
+        self.skip_filter = skip_filter
         self.running = False
+        self._stop_event = threading.Event()
         self.observer: BaseObserver | None = None
-        self.processed_files: set[Path] = set()
-
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        self.processed_files = ProcessedSet(max_processed)
+        from duplexer.io_utils import StabilityTracker
+
+        # Directory mtime of the last scan that left nothing waiting
+        self._settled_mtime_ns: int | None = None
+        self._stability = StabilityTracker()
+        self._pool = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="duplexer")
+            if max_workers
+            else None
+        )
 
         logger.info(
-            f"FileWatcher initialized: {input_dir} (pattern={pattern}, polling={self.use_polling})"
+            "FileWatcher initialized: %s (pattern=%s, polling=%s)",
+            input_dir,
+            pattern,
+            self.use_polling,
         )
 
     def _signal_handler(self, signum: int, frame) -> None:
         """Handle shutdown signals."""
-        logger.info(f"Received signal {signum}, shutting down...")
+        logger.info("Received signal %s, shutting down...", signum)
         self.stop()
 
-    def scan_once(self) -> int:
+    def _install_signal_handlers(self) -> dict[int, Any]:
         """
-        Scan directory once and process all ready files.
+        Route SIGTERM and SIGINT to stop() while watching.
+
+        Handlers can only be set from the main thread; elsewhere the caller
+        is expected to call stop() itself.
 
         Returns:
-            Number of files processed
+            Previous handlers by signal number, for _restore_signal_handlers
         """
-        from duplexer.io_utils import is_file_ready
-
-        processed_count = 0
-        files = sorted(self.input_dir.glob(self.pattern))
+        if threading.current_thread() is not threading.main_thread():
+            logger.debug("Not on the main thread, leaving signal handlers alone")
+            return {}
+        return {
+            signum: signal.signal(signum, self._signal_handler)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+    def _restore_signal_handlers(self, previous: dict[int, Any]) -> None:
+        """Put back the handlers replaced by _install_signal_handlers."""
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+    def collect_ready_files(self) -> list[Path]:
+        """
+        Scan directory once and claim all ready files without processing them.
 
-        logger.debug(f"Scanning {self.input_dir}, found {len(files)} matching files")
+        Claimed files are marked as processed so later scans do not return them again.
 
-        for file_path in files:
-            if file_path in self.processed_files:
-                continue
+        Returns:
+            Paths of files that are ready for processing, in sorted order
+        """
+        from duplexer.io_utils import StatCache, is_file_stable
 
-            if file_path.name.endswith(".ready"):
+        try:
+            dir_mtime_ns: int | None = os.stat(self.input_dir).st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+        if dir_mtime_ns is not None and dir_mtime_ns == self._settled_mtime_ns:
+            logger.debug("%s unchanged since last scan, skipping listing", self.input_dir)
+            return []
+
+        ready: list[Path] = []
+        waiting = False
+        stat_cache = StatCache()
+        candidates, names = self._list_candidates()
+        # mtimes are wall-clock times, so compare them with one time.time() per scan
+        now = time.time()
+
+        logger.debug("Scanning %s, found %s matching files", self.input_dir, len(candidates))
+
+        for entry in candidates:
+            # DirEntry.path is already the str key the processed set uses
+            if entry.path in self.processed_files:
                 continue
 
-            if is_file_ready(file_path, self.require_ready_file, self.stability_seconds):
-                self.processed_files.add(file_path)
+            if self.require_ready_file:
+                # Sidecar mode is decided from the listing's names alone
+                if f"{entry.name}.ready" not in names:
+                    waiting = True
+                    continue
+                file_path = Path(entry.path)
+                logger.debug("Found ready file: %s.ready", entry.name)
+            else:
+                # Reuse the entry's stat for the stability check
+                file_path = Path(entry.path)
                 try:
-                    self.process_callback(file_path)
-                    processed_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to process {file_path.name}: {e}")
+                    stat_cache.put(file_path, entry.stat())
+                except OSError:
+                    waiting = True
+                    continue
+                if not is_file_stable(
+                    file_path, self.stability_seconds, stat_cache, self._stability, now
+                ):
+                    waiting = True
+                    continue
+
+            if self.processed_files.claim(file_path):
+                ready.append(file_path)
+
+        self._settled_mtime_ns = self._settled_listing_mtime(dir_mtime_ns, waiting)
+        self._stability.retain(
+            entry.path for entry in candidates if entry.path not in self.processed_files
+        )
+
+        if self.skip_filter and ready:
+            skipped = self.skip_filter(ready)
+            if skipped:
+                logger.info("Skipping %s already processed file(s)", len(skipped))
+                ready = [p for p in ready if p not in skipped]
+
+        return ready
+
+    def _settled_listing_mtime(self, dir_mtime_ns: int | None, waiting: bool) -> int | None:
+        """
+        Decide whether the next scan may be skipped while the directory is unchanged.
+
+        Writes into existing files do not touch the directory mtime, so files
+        still waiting for stability or a sidecar always force a rescan. A
+        directory modified within DIR_MTIME_SETTLE_NS might still change
+        without its (possibly coarse) mtime moving, so it is not trusted yet.
+
+        Args:
+            dir_mtime_ns: Directory mtime read before listing it
+            waiting: True if any matching file was left unclaimed
+
+        Returns:
+            The mtime to compare against on the next scan, or None to always list
+        """
+        if dir_mtime_ns is None or waiting:
+            return None
+        if time.time_ns() - dir_mtime_ns < DIR_MTIME_SETTLE_NS:
+            return None
+        return dir_mtime_ns
+
+    def _list_candidates(self) -> tuple[list[os.DirEntry[str]], set[str]]:
+        """
+        List the input directory once and select files matching the pattern.
+
+        Returns:
+            Tuple of (matching non-directory entries sorted by name, all names in the directory)
+        """
+        candidates: list[os.DirEntry[str]] = []
+        names: set[str] = set()
+        match = self._match_name
+
+        with os.scandir(self.input_dir) as it:
+            for entry in it:
+                names.add(entry.name)
+                if match(entry.name) and not entry.is_dir():
+                    candidates.append(entry)
+
+        candidates.sort(key=lambda entry: entry.name)
+        return candidates, names
+
+    def scan_once(self) -> int:
+        """
+        Scan directory once and process all ready files.
+
+        Files are already marked processed when claimed, so with a thread pool
+        the next scan does not resubmit them while they are still running.
+
+        Returns:
+            Number of files processed, or submitted when using a thread pool
+        """
+        ready = self.collect_ready_files()
+
+        if self._pool is not None:
+            for file_path in ready:
+                self._submit(file_path)
+            return len(ready)
+
+        processed_count = 0
+
+        for file_path in ready:
+            try:
+                self.process_callback(file_path)
+                processed_count += 1
+            except Exception as e:
+                logger.error("Failed to process %s: %s", file_path.name, e)
 
         return processed_count
 
     def watch_polling(self) -> None:
         """Watch directory using polling."""
-        logger.info(f"Watching {self.input_dir} with polling (interval={self.poll_interval}s)")
+        logger.info("Watching %s with polling (interval=%ss)", self.input_dir, self.poll_interval)
         self.running = True
 
         try:
-            while self.running:
+            while not self._stop_event.is_set():
                 self.scan_once()
-                time.sleep(self.poll_interval)
+                self._stop_event.wait(self.poll_interval)
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
         finally:
             self.running = False
+            self._shutdown_pool(wait=True)
             logger.info("Polling watcher stopped")
 
     def watch_observer(self) -> None:
         """Watch directory using watchdog observer."""
-        logger.info(f"Watching {self.input_dir} with watchdog")
+        logger.info("Watching %s with watchdog", self.input_dir)
         self.running = True
 
         handler = ProcessingHandler(
             pattern=self.pattern,
-            process_callback=self.process_callback,
+            process_callback=self._submit if self._pool else self.process_callback,
             require_ready_file=self.require_ready_file,
             stability_seconds=self.stability_seconds,
+            processed_files=self.processed_files,
         )
 
         self.observer = Observer()
-        self.observer.schedule(handler, str(self.input_dir), recursive=False)
+        # Only subscribe to what the handler uses; our own reads of input
+        # files would otherwise produce open/close-nowrite events
+        self.observer.schedule(
+            handler,
+            str(self.input_dir),
+            recursive=False,
+            event_filter=[FileCreatedEvent, FileModifiedEvent, FileMovedEvent, FileClosedEvent],
+        )
         self.observer.start()
 
         try:
-            while self.running:
-                time.sleep(1)
+            # Sleep until stop() or a signal handler wakes us
+            self._stop_event.wait()
         except KeyboardInterrupt:
             logger.info("Interrupted by user")
         finally:
             if self.observer:
                 self.observer.stop()
                 self.observer.join()
+            handler.close()
             self.running = False
+            self._shutdown_pool(wait=True)
             logger.info("Watchdog observer stopped")
 
     def watch(self) -> None:
@@ -256,19 +726,45 @@ class FileWatcher:
         Start watching directory continuously.
 
         Uses watchdog if available and not disabled, otherwise falls back to polling.
+        SIGTERM and SIGINT stop the watcher while it runs; the previous
+        handlers are restored afterwards.
         """
-        # Do an initial scan to catch any existing files
-        initial_count = self.scan_once()
-        if initial_count > 0:
-            logger.info(f"Processed {initial_count} existing file(s)")
+        previous_handlers = self._install_signal_handlers()
+        try:
+            # Do an initial scan to catch any existing files
+            initial_count = self.scan_once()
+            if initial_count > 0:
+                logger.info("Processed %s existing file(s)", initial_count)
 
-        if self.use_polling:
-            self.watch_polling()
-        else:
-            self.watch_observer()
+            if self.use_polling:
+                self.watch_polling()
+            else:
+                self.watch_observer()
+        finally:
+            self._restore_signal_handlers(previous_handlers)
 
     def stop(self) -> None:
         """Stop watching."""
         self.running = False
+        self._stop_event.set()
+        # Don't block here: this also runs from the signal handler. The watch
+        # loops wait for in-flight files on their way out.
+        self._shutdown_pool(wait=False)
         if self.observer:
             self.observer.stop()
+
+    def _submit(self, file_path: Path) -> None:
+        """Run process_callback for a file on the thread pool."""
+        assert self._pool is not None
+        future = self._pool.submit(self.process_callback, file_path)
+        future.add_done_callback(partial(_log_callback_failure, file_path))
+
+    def _shutdown_pool(self, wait: bool) -> None:
+        """
+        Shut down the callback thread pool, dropping files not yet started.
+
+        Args:
+            wait: If True, block until running callbacks have finished
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -1,65 +1,198 @@
 """Test fixtures and utilities."""
 
+import hashlib
+import io
+import os
+import shutil
+from functools import cache
 from pathlib import Path
 
 import pytest
 from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ContentStream, DictionaryObject, NameObject
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 
+LABEL_FONT = "Helvetica-Bold"
+LABEL_FONT_SIZE = 48
 
-def create_labeled_page(width: float, height: float, label: str) -> PdfWriter:
+# Helvetica-Bold advance widths (1/1000 em) for the characters used in labels
+HELVETICA_BOLD_WIDTHS = {
+    " ": 278,
+    "-": 333,
+    **dict.fromkeys("0123456789_", 556),
+    **dict(
+        zip(
+            "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+            (722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833)
+            + (722, 778, 667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611),
+            strict=True,
+        )
+    ),
+    **dict(
+        zip(
+            "abcdefghijklmnopqrstuvwxyz",
+            (556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889)
+            + (611, 611, 611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500),
+            strict=True,
+        )
+    ),
+}
+
+
+@cache
+def label_width(label: str) -> float:
     """
-    Create a PDF page with a text label using reportlab.
+    Measure a page label once; AFM metrics lookups are comparatively slow.
 
     Args:
-        width: Page width in points
-        height: Page height in points
-        label: Text to display on the page
+        label: Text to measure
 
     Returns:
-        PdfWriter with a single labeled page
+        Width of the label in points
+    """
+    if all(char in HELVETICA_BOLD_WIDTHS for char in label):
+        return sum(HELVETICA_BOLD_WIDTHS[char] for char in label) * LABEL_FONT_SIZE / 1000
+    return stringWidth(label, LABEL_FONT, LABEL_FONT_SIZE)
+
+
+def _write_label_pages(page_labels: list[str], width: float, height: float) -> PdfWriter:
+    """
+    Build labeled pages directly from minimal content streams.
+
+    Only valid for labels made of HELVETICA_BOLD_WIDTHS characters, which
+    need no escaping inside a PDF string.
     """
-    import io
+    writer = PdfWriter()
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject(f"/{LABEL_FONT}"),
+            NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+        }
+    )
+
+    for label in page_labels:
+        page = writer.add_blank_page(width, height)
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        x = (width - label_width(label)) / 2
+        contents = ContentStream(None, writer)
+        contents.set_data(
+            f"BT /F1 {LABEL_FONT_SIZE} Tf {x:.2f} {height / 2:.2f} Td ({label}) Tj ET".encode()
+        )
+        page.replace_contents(contents)
 
-    # Create PDF in memory
+    return writer
+
+
+def _draw_label_pages(page_labels: list[str], width: float, height: float) -> PdfWriter:
+    """Draw labeled pages on a single reportlab canvas, for labels of any text."""
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=(width, height))
 
-    # Draw label in center
-    c.setFont("Helvetica-Bold", 48)
-    text_width = c.stringWidth(label, "Helvetica-Bold", 48)
-    x = (width - text_width) / 2
-    y = height / 2
-    c.drawString(x, y, label)
+    for label in page_labels:
+        # Font state resets with every page, so set it per page
+        c.setFont(LABEL_FONT, LABEL_FONT_SIZE)
+        c.drawString((width - label_width(label)) / 2, height / 2, label)
+        c.showPage()
 
     c.save()
 
-    # Convert to PdfWriter
     buffer.seek(0)
-    reader = PdfReader(buffer)
     writer = PdfWriter()
-    writer.add_page(reader.pages[0])
-
+    for page in PdfReader(buffer).pages:
+        writer.add_page(page)
     return writer
 
 
+@cache
+def _test_pdf_bytes(page_labels: tuple[str, ...]) -> bytes:
+    """
+    Serialize a labeled test PDF once per distinct label sequence.
+
+    Plain alphanumeric labels are written as hand-built content streams;
+    anything else is drawn with reportlab.
+    """
+    width, height = letter
+    if all(char in HELVETICA_BOLD_WIDTHS for label in page_labels for char in label):
+        writer = _write_label_pages(list(page_labels), width, height)
+    else:
+        writer = _draw_label_pages(list(page_labels), width, height)
+
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
 def create_test_pdf(output_path: Path, page_labels: list[str]) -> None:
     """
     Create a test PDF with labeled pages.
 
+    Each label sequence is only built with pypdf once per session; later
+    calls write the same bytes, so files with equal labels have equal content.
+
     Args:
         output_path: Where to write the PDF
         page_labels: List of labels for each page (e.g., ["F1", "F2", "B2", "B1"])
     """
-    writer = PdfWriter()
+    output_path.write_bytes(_test_pdf_bytes(tuple(page_labels)))
 
-    for label in page_labels:
-        page_writer = create_labeled_page(letter[0], letter[1], label)
-        writer.add_page(page_writer.pages[0])
 
-    with open(output_path, "wb") as f:
-        writer.write(f)
+def create_large_pdf(output_path: Path, num_pages: int) -> None:
+    """
+    Create a large PDF with many blank pages for performance testing.
+
+    The file is serialized directly: every page is the same small dictionary,
+    so there is nothing for a PDF library to build beyond the offsets table.
+
+    Args:
+        output_path: Where to write the PDF
+        num_pages: Number of pages to create
+    """
+    kids = b" ".join(b"%d 0 R" % number for number in range(3, num_pages + 3))
+    page = b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << >> >>"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, num_pages),
+        *[page] * num_pages,
+    ]
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    pdf += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+
+    output_path.write_bytes(pdf)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Start the largest performance jobs first.
+
+    Tests marked ``pdf_pages(n)`` are reordered by page count, descending, within
+    the slots they already occupy, so under xdist the longest job is handed out
+    while the other workers are still idle. Unmarked tests keep their positions.
+    """
+    pages = {}
+    for i, item in enumerate(items):
+        marker = item.get_closest_marker("pdf_pages")
+        if marker is not None:
+            pages[i] = marker.args[0]
+    ordered = sorted(pages, key=lambda i: -pages[i])
+    reordered = [items[i] for i in ordered]
+    for i, item in zip(pages, reordered, strict=True):
+        items[i] = item
 
 
 @pytest.fixture
@@ -84,25 +217,63 @@ def temp_dirs(tmp_path):
     }
 
 
+@pytest.fixture(scope="session")
+def pdf_cache(tmp_path_factory):
+    """
+    Provide a factory for test PDFs that are generated once per session.
+
+    Each PDF is keyed by its page labels; callers get a private copy, so tests
+    that move or modify their input do not affect each other.
+    """
+    cache_dir = tmp_path_factory.mktemp("pdfs", numbered=False)
+
+    def make(output_path: Path, page_labels: list[str]) -> Path:
+        key = hashlib.blake2b(repr(page_labels).encode()).hexdigest()[:16]
+        cached = cache_dir / f"{key}.pdf"
+        if not cached.exists():
+            create_test_pdf(cached, page_labels)
+        shutil.copy(cached, output_path)
+        return output_path
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def large_pdf_cache(tmp_path_factory):
+    """
+    Provide a factory for blank-page PDFs that are generated once per session.
+
+    Callers get a hard link to the cached file (a copy where links are not
+    supported); the performance tests only read their input.
+    """
+    cache_dir = tmp_path_factory.mktemp("large_pdfs", numbered=False)
+
+    def make(output_path: Path, num_pages: int) -> Path:
+        cached = cache_dir / f"blank_{num_pages}.pdf"
+        if not cached.exists():
+            create_large_pdf(cached, num_pages)
+        try:
+            os.link(cached, output_path)
+        except OSError:
+            shutil.copy(cached, output_path)
+        return output_path
+
+    return make
+
+
 @pytest.fixture
-def sample_duplex_pdf(tmp_path):
+def sample_duplex_pdf(tmp_path, pdf_cache):
     """Create a sample duplex-scanned PDF: F1, F2, F3, B3, B2, B1."""
-    pdf_path = tmp_path / "sample.pdf"
-    create_test_pdf(pdf_path, ["F1", "F2", "F3", "B3", "B2", "B1"])
-    return pdf_path
+    return pdf_cache(tmp_path / "sample.pdf", ["F1", "F2", "F3", "B3", "B2", "B1"])
 
 
 @pytest.fixture
-def odd_page_pdf(tmp_path):
+def odd_page_pdf(tmp_path, pdf_cache):
     """Create a PDF with odd page count: F1, F2, B2, B1."""
-    pdf_path = tmp_path / "odd.pdf"
-    create_test_pdf(pdf_path, ["F1", "F2", "F3", "B3", "B2"])
-    return pdf_path
+    return pdf_cache(tmp_path / "odd.pdf", ["F1", "F2", "F3", "B3", "B2"])
 
 
 @pytest.fixture
-def even_no_reverse_pdf(tmp_path):
+def even_no_reverse_pdf(tmp_path, pdf_cache):
     """Create a PDF with backs not reversed: F1, F2, B1, B2."""
-    pdf_path = tmp_path / "no_reverse.pdf"
-    create_test_pdf(pdf_path, ["F1", "F2", "B1", "B2"])
-    return pdf_path
+    return pdf_cache(tmp_path / "no_reverse.pdf", ["F1", "F2", "B1", "B2"])
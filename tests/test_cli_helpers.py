@@ -1,17 +1,43 @@
 """Tests for CLI helper functions."""
 
 import os
+import signal
+import time
+from functools import partial
+from pathlib import Path
+from threading import Event, Thread
 from unittest.mock import patch
 
 import pytest
 
 from duplexer.cli import (
+    RestartingProcessPool,
+    create_pool_dispatcher,
     create_process_callback,
     load_watch_config,
     log_watch_config,
+    resolve_use_polling,
+    run_cache_pruner,
     setup_watch_directories,
     str_to_bool,
 )
+from duplexer.io_utils import get_ready_path
+
+
+def crash_worker_once(marker_dir: Path, file_path: Path) -> None:
+    """Kill the worker process on the first call, like the OOM killer would, then record files."""
+    crashed = marker_dir / "crashed"
+    if not crashed.exists():
+        crashed.touch()
+        os.kill(os.getpid(), signal.SIGKILL)
+    (marker_dir / file_path.name).touch()
+
+
+def crash_worker_on(poison_name: str, marker_dir: Path, file_path: Path) -> None:
+    """Kill the worker process for one file every time, like a PDF that crashes the library."""
+    if file_path.name == poison_name:
+        os.kill(os.getpid(), signal.SIGKILL)
+    (marker_dir / file_path.name).touch()
 
 
 class TestStrToBool:
@@ -53,6 +79,12 @@ class TestLoadWatchConfig:
             assert config["reverse_backs"] is True
             assert config["insert_blank_lastback"] is False
             assert config["output_suffix"] == ".duplex"
+            assert config["max_workers"] == (os.cpu_count() or 1)
+            assert config["backend"] == "pypdf"
+            assert config["durable_writes"] is True
+            assert config["watch_mode"] == "auto"
+            assert config["result_cache"] is False
+            assert config["result_cache_ttl_days"] == 30.0
 
     def test_cli_overrides(self):
         """Test CLI arguments override environment variables."""
@@ -86,6 +118,7 @@ class TestLoadWatchConfig:
                 "REVERSE_BACKS": "false",
                 "INSERT_BLANK_LASTBACK": "true",
                 "OUTPUT_SUFFIX": ".processed",
+                "MAX_WORKERS": "2",
             },
         ):
             config = load_watch_config(None, None, None)
@@ -96,6 +129,43 @@ class TestLoadWatchConfig:
             assert config["reverse_backs"] is False
             assert config["insert_blank_lastback"] is True
             assert config["output_suffix"] == ".processed"
+            assert config["max_workers"] == 2
+
+    @pytest.mark.parametrize("value", ["0", "-2", ""])
+    def test_non_positive_max_workers_uses_cpu_count(self, value):
+        """Test that MAX_WORKERS of zero or less falls back to one worker per CPU."""
+        with patch.dict(os.environ, {"MAX_WORKERS": value}):
+            config = load_watch_config(None, None, None)
+
+        assert config["max_workers"] == (os.cpu_count() or 1)
+
+    def test_rejects_non_integer_max_workers(self, caplog):
+        """Test that a non-integer MAX_WORKERS stops the watcher with a clear message."""
+        with patch.dict(os.environ, {"MAX_WORKERS": "four"}), pytest.raises(SystemExit) as exc:
+            load_watch_config(None, None, None)
+
+        assert exc.value.code == 1
+        assert "MAX_WORKERS must be an integer, got 'four'" in caplog.text
+
+    def test_rejects_unknown_backend(self, caplog):
+        """Test that a mistyped PDF_BACKEND stops the watcher at startup."""
+        with patch.dict(os.environ, {"PDF_BACKEND": "pdfum"}), pytest.raises(SystemExit) as exc:
+            load_watch_config(None, None, None)
+
+        assert exc.value.code == 1
+        assert "Unknown PDF_BACKEND 'pdfum'" in caplog.text
+
+    def test_rejects_missing_pdfium(self, caplog):
+        """Test that the pdfium backend without pypdfium2 stops the watcher at startup."""
+        with (
+            patch.dict(os.environ, {"PDF_BACKEND": "PDFium"}),
+            patch("duplexer.cli.PDFIUM_AVAILABLE", False),
+            pytest.raises(SystemExit) as exc,
+        ):
+            load_watch_config(None, None, None)
+
+        assert exc.value.code == 1
+        assert "requires pypdfium2" in caplog.text
 
 
 class TestLogWatchConfig:
@@ -114,6 +184,12 @@ class TestLogWatchConfig:
             "reverse_backs": True,
             "insert_blank_lastback": False,
             "output_suffix": ".duplex",
+            "max_workers": 4,
+            "backend": "pypdf",
+            "durable_writes": True,
+            "watch_mode": "auto",
+            "result_cache": True,
+            "result_cache_ttl_days": 30.0,
         }
 
         log_watch_config(
@@ -132,6 +208,23 @@ class TestLogWatchConfig:
         assert "Scan pattern: *.pdf" in log_text
         assert "Stability seconds: 5.0s" in log_text
         assert "Reverse backs: True" in log_text
+        assert "Max workers: 4" in log_text
+
+
+class TestResolveUsePolling:
+    """Tests for resolve_use_polling helper."""
+
+    def test_explicit_modes(self, tmp_path):
+        """Test that explicit modes are honoured regardless of filesystem."""
+        assert resolve_use_polling("polling", tmp_path) is True
+        assert resolve_use_polling("events", tmp_path) is False
+
+    def test_auto_uses_polling_on_network_fs(self, tmp_path):
+        """Test that auto mode polls only on network filesystems."""
+        with patch("duplexer.cli.is_network_filesystem", return_value=True):
+            assert resolve_use_polling("auto", tmp_path) is True
+        with patch("duplexer.cli.is_network_filesystem", return_value=False):
+            assert resolve_use_polling("auto", tmp_path) is False
 
 
 class TestSetupWatchDirectories:
@@ -215,3 +308,134 @@ class TestCreateProcessCallback:
         # Verify processing occurred
         output_pdf = output_dir / "test.duplex.pdf"
         assert output_pdf.exists()
+
+    def test_callback_is_picklable(self, tmp_path):
+        """Test that callback can be sent to worker processes."""
+        import pickle
+
+        callback = create_process_callback(
+            output_dir=tmp_path / "output",
+            archive_dir=tmp_path / "archive",
+            failed_dir=tmp_path / "failed",
+            output_suffix=".duplex",
+            reverse_backs=True,
+            insert_blank_lastback=False,
+        )
+
+        assert callable(pickle.loads(pickle.dumps(callback)))
+
+
+class TestRunCachePruner:
+    """Tests for run_cache_pruner helper."""
+
+    def test_prunes_until_stopped(self, tmp_path):
+        """Test that expired entries are pruned repeatedly while the watcher runs."""
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        stop_event = Event()
+        pruner = Thread(
+            target=run_cache_pruner, args=(cache_dir, 3600, stop_event), kwargs={"interval": 0.01}
+        )
+        pruner.start()
+
+        try:
+            # Expires after the first prune; removed by a later one
+            expired = cache_dir / "ab12_1_0.pdf"
+            expired.touch()
+            old = time.time() - 7200
+            os.utime(expired, (old, old))
+
+            deadline = time.monotonic() + 5
+            while expired.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert not expired.exists()
+        finally:
+            stop_event.set()
+            pruner.join(timeout=5)
+        assert not pruner.is_alive()
+
+
+class TestCreatePoolDispatcher:
+    """Tests for create_pool_dispatcher helper."""
+
+    def test_submits_to_executor(self, tmp_path):
+        """Test that dispatch hands the file to the executor."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        processed = []
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            dispatch = create_pool_dispatcher(executor, processed.append)
+            dispatch(tmp_path / "test.pdf")
+
+        assert processed == [tmp_path / "test.pdf"]
+
+    def test_logs_worker_failure(self, tmp_path, caplog):
+        """Test that exceptions escaping the worker are logged."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def failing(path):
+            raise RuntimeError("worker died")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            dispatch = create_pool_dispatcher(executor, failing)
+            dispatch(tmp_path / "test.pdf")
+
+        assert "Failed to process test.pdf: worker died" in caplog.text
+
+    def test_recovers_from_dead_worker(self, tmp_path):
+        """Test that files are still processed after a worker process dies."""
+        marker_dir = tmp_path / "markers"
+        marker_dir.mkdir()
+
+        def wait_for(path: Path) -> bool:
+            deadline = time.monotonic() + 30
+            while not path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return path.exists()
+
+        with RestartingProcessPool(max_workers=1) as executor:
+            dispatch = create_pool_dispatcher(executor, partial(crash_worker_once, marker_dir))
+
+            # The worker dies; the file is retried on a new pool
+            dispatch(tmp_path / "first.pdf")
+            assert wait_for(marker_dir / "first.pdf")
+            assert (marker_dir / "crashed").exists()
+
+            dispatch(tmp_path / "second.pdf")
+            assert wait_for(marker_dir / "second.pdf")
+
+    def test_moves_file_that_keeps_killing_workers_to_failed(self, tmp_path):
+        """Test that a file whose worker dies on the retry too is moved to the failed directory."""
+        ingest_dir = tmp_path / "ingest"
+        failed_dir = tmp_path / "failed"
+        marker_dir = tmp_path / "markers"
+        for directory in (ingest_dir, failed_dir, marker_dir):
+            directory.mkdir()
+        poison = ingest_dir / "poison.pdf"
+        poison.write_bytes(b"%PDF-1.4 crashes the PDF library")
+        get_ready_path(poison).touch()
+
+        def wait_for(path: Path) -> bool:
+            deadline = time.monotonic() + 30
+            while not path.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return path.exists()
+
+        with RestartingProcessPool(max_workers=1) as executor:
+            dispatch = create_pool_dispatcher(
+                executor, partial(crash_worker_on, "poison.pdf", marker_dir), failed_dir
+            )
+
+            dispatch(poison)
+            # The sidecar is removed last, once the input has been moved
+            deadline = time.monotonic() + 30
+            while get_ready_path(poison).exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert not get_ready_path(poison).exists()
+            assert not poison.exists()
+            assert (failed_dir / "poison.pdf").read_bytes() == b"%PDF-1.4 crashes the PDF library"
+
+            # The pool keeps working for other files
+            dispatch(ingest_dir / "next.pdf")
+            assert wait_for(marker_dir / "next.pdf")
@@ -1,13 +1,21 @@
 """Tests for core interleaving logic."""
 
+import os
+import subprocess
+import sys
+import textwrap
 from pathlib import Path
 
 import pytest
 from pypdf import PdfReader
 
+import duplexer
 from duplexer.interleave import (
+    DuplexError,
     InvalidPageCountError,
     interleave_duplex,
+    open_pdf,
+    plan_page_order,
     validate_pdf,
 )
 
@@ -143,6 +151,20 @@ def test_interleave_two_pages(tmp_path):
     assert len(reader.pages) == 2
 
 
+@pytest.mark.parametrize("reverse_backs", [True, False])
+def test_interleave_two_pages_copies_input(tmp_path, reverse_backs):
+    """Test that a single-sheet scan is copied verbatim instead of rewritten."""
+    from conftest import create_test_pdf
+
+    input_pdf = tmp_path / "input.pdf"
+    create_test_pdf(input_pdf, ["F1", "B1"])
+
+    output = tmp_path / "output.pdf"
+    interleave_duplex(input_pdf, output, reverse_backs=reverse_backs, durable=True)
+
+    assert output.read_bytes() == input_pdf.read_bytes()
+
+
 def test_metadata_preservation(tmp_path):
     """Test that PDF metadata is preserved during interleaving."""
     from pypdf import PdfWriter
@@ -229,6 +251,27 @@ def test_metadata_preservation_partial(tmp_path):
     assert output_reader.metadata.get("/Creator") is None
 
 
+def test_consecutive_interleaves_do_not_share_state(tmp_path, pdf_cache):
+    """Test that each conversion starts from a fresh writer."""
+    from pypdf import PdfWriter
+
+    with_metadata = tmp_path / "with_metadata.pdf"
+    writer = PdfWriter()
+    for _ in range(4):
+        writer.add_blank_page(width=612, height=792)
+    writer.add_metadata({"/Title": "First Scan"})
+    with open(with_metadata, "wb") as f:
+        writer.write(f)
+    plain = pdf_cache(tmp_path / "plain.pdf", ["F1", "F2", "B1", "B2"])
+
+    interleave_duplex(with_metadata, tmp_path / "first.pdf", True, False)
+    interleave_duplex(plain, tmp_path / "second.pdf", False, False)
+
+    reader = PdfReader(tmp_path / "second.pdf")
+    assert len(reader.pages) == 4
+    assert reader.metadata is None or reader.metadata.get("/Title") is None
+
+
 def test_interleave_without_metadata(tmp_path):
     """Test interleaving works correctly when input has no metadata."""
     from pypdf import PdfWriter
@@ -259,3 +302,212 @@ def test_interleave_without_metadata(tmp_path):
     output_reader = PdfReader(output_pdf)
     assert len(output_reader.pages) == 2
     # Metadata may be None or empty, both are acceptable
+
+
+def test_interleave_page_order(sample_duplex_pdf, tmp_path):
+    """Test that pages are emitted in F1, B1, F2, B2, ... order."""
+    output = tmp_path / "output.pdf"
+
+    interleave_duplex(sample_duplex_pdf, output, reverse_backs=True, insert_blank_lastback=False)
+
+    reader = PdfReader(output)
+    labels = [page.extract_text().strip() for page in reader.pages]
+    assert labels == ["F1", "B1", "F2", "B2", "F3", "B3"]
+
+
+def test_interleave_page_order_with_blank(odd_page_pdf, tmp_path):
+    """Test that the inserted blank page is the last back page."""
+    output = tmp_path / "output.pdf"
+
+    interleave_duplex(odd_page_pdf, output, reverse_backs=True, insert_blank_lastback=True)
+
+    reader = PdfReader(output)
+    labels = [page.extract_text().strip() for page in reader.pages]
+    assert labels == ["F1", "B2", "F2", "B3", "F3", ""]
+
+
+def test_plan_page_order():
+    """Test interleaved index planning for the supported layouts."""
+    assert plan_page_order(6) == ([0, 5, 1, 4, 2, 3], False)
+    assert plan_page_order(4, reverse_backs=False) == ([0, 2, 1, 3], False)
+    assert plan_page_order(5, insert_blank_lastback=True) == ([0, 4, 1, 3, 2], True)
+    assert plan_page_order(0) == ([], False)
+
+    with pytest.raises(InvalidPageCountError):
+        plan_page_order(5)
+
+
+def test_plan_page_order_large_scan():
+    """Test that large page counts interleave every page exactly once."""
+    order, blank = plan_page_order(2001, insert_blank_lastback=True)
+    assert blank is True
+    assert sorted(order) == list(range(2001))
+    assert order[:4] == [0, 2000, 1, 1999]
+    assert order[-1] == 1000
+
+
+def test_interleave_unknown_backend(sample_duplex_pdf, tmp_path):
+    """Test that an unknown backend is rejected."""
+    with pytest.raises(DuplexError, match="Unknown PDF backend"):
+        interleave_duplex(sample_duplex_pdf, tmp_path / "output.pdf", backend="nope")
+
+
+def test_interleave_pdfium_backend(odd_page_pdf, tmp_path):
+    """Test that the pdfium backend produces the same page order and metadata."""
+    pytest.importorskip("pypdfium2")
+    from pypdf import PdfWriter
+
+    input_pdf = tmp_path / "with_metadata.pdf"
+    writer = PdfWriter(clone_from=odd_page_pdf)
+    writer.add_metadata({"/Title": "Scan", "/Author": "Tester"})
+    with open(input_pdf, "wb") as f:
+        writer.write(f)
+
+    output = tmp_path / "output.pdf"
+    interleave_duplex(
+        input_pdf, output, reverse_backs=True, insert_blank_lastback=True, backend="pdfium"
+    )
+
+    reader = PdfReader(output)
+    labels = [page.extract_text().strip() for page in reader.pages]
+    assert labels == ["F1", "B2", "F2", "B3", "F3", ""]
+    assert reader.metadata is not None
+    assert reader.metadata["/Title"] == "Scan"
+    assert reader.metadata["/Author"] == "Tester"
+
+
+def test_interleave_pdfium_backend_without_metadata(sample_duplex_pdf, tmp_path):
+    """Test that the pdfium backend writes straight into an open output file."""
+    pytest.importorskip("pypdfium2")
+
+    output = tmp_path / "output.pdf"
+    with open(output, "wb") as f:
+        interleave_duplex(sample_duplex_pdf, f, backend="pdfium")
+
+    reader = PdfReader(output)
+    labels = [page.extract_text().strip() for page in reader.pages]
+    assert labels == ["F1", "B1", "F2", "B2", "F3", "B3"]
+
+
+def test_interleave_pdfium_backend_odd_pages(odd_page_pdf, tmp_path):
+    """Test that the pdfium backend enforces the page count rule."""
+    pytest.importorskip("pypdfium2")
+
+    with pytest.raises(InvalidPageCountError):
+        interleave_duplex(odd_page_pdf, tmp_path / "output.pdf", backend="pdfium")
+
+
+@pytest.mark.parametrize("kind", ["encrypted", "empty"])
+def test_interleave_pdfium_backend_validates_input(tmp_path, kind):
+    """Test that the pdfium backend rejects the same inputs as open_pdf."""
+    pytest.importorskip("pypdfium2")
+    from pypdf import PdfWriter
+
+    input_pdf = tmp_path / f"{kind}.pdf"
+    writer = PdfWriter()
+    if kind == "encrypted":
+        writer.add_blank_page(width=612, height=792)
+        writer.add_blank_page(width=612, height=792)
+        # An empty user password opens without prompting, but is still encrypted
+        writer.encrypt(user_password="", owner_password="owner")
+    with open(input_pdf, "wb") as f:
+        writer.write(f)
+
+    with pytest.raises(DuplexError):
+        interleave_duplex(input_pdf, tmp_path / "output.pdf", backend="pdfium")
+    assert not (tmp_path / "output.pdf").exists()
+
+
+def test_open_pdf_returns_reader(sample_duplex_pdf, tmp_path):
+    """Test that open_pdf returns a reader that interleave_duplex can reuse."""
+    reader, error = open_pdf(sample_duplex_pdf)
+    assert reader is not None
+    assert error is None
+
+    output = tmp_path / "output.pdf"
+    interleave_duplex(sample_duplex_pdf, output, reader=reader)
+
+    assert len(PdfReader(output).pages) == 6
+
+
+def test_open_pdf_reader_independent_of_path(sample_duplex_pdf, tmp_path):
+    """Test that a reader from open_pdf keeps working after its input is moved away."""
+    reader, _ = open_pdf(sample_duplex_pdf)
+    assert reader is not None
+
+    moved = tmp_path / "archive" / sample_duplex_pdf.name
+    moved.parent.mkdir()
+    sample_duplex_pdf.rename(moved)
+
+    output = tmp_path / "output.pdf"
+    interleave_duplex(moved, output, reader=reader)
+
+    assert len(PdfReader(output).pages) == 6
+
+
+def test_open_pdf_reader_survives_truncated_input(sample_duplex_pdf, tmp_path):
+    """Test that truncating the input under an open reader cannot crash the process."""
+    output = tmp_path / "output.pdf"
+    script = textwrap.dedent(
+        f"""
+        from pathlib import Path
+
+        from duplexer.interleave import interleave_duplex, open_pdf
+
+        input_path = Path({str(sample_duplex_pdf)!r})
+        reader, error = open_pdf(input_path)
+        assert error is None, error
+        # E.g. the scanner rewriting the file while it is being parsed
+        with open(input_path, "r+b") as f:
+            f.truncate(0)
+        interleave_duplex(input_path, Path({str(output)!r}), reader=reader)
+        """
+    )
+
+    # Run the package under test, whether or not it is installed
+    env = {**os.environ, "PYTHONPATH": str(Path(duplexer.__file__).parents[1])}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env)
+
+    assert result.returncode == 0, result.stderr
+    assert len(PdfReader(output).pages) == 6
+
+
+def test_open_pdf_invalid_file(tmp_path):
+    """Test that open_pdf reports invalid files without a reader."""
+    invalid = tmp_path / "notapdf.pdf"
+    invalid.write_text("This is not a PDF")
+
+    reader, error = open_pdf(invalid)
+    assert reader is None
+    assert error is not None
+    assert "Failed to read PDF" in error
+
+
+def test_open_pdf_empty_file(tmp_path):
+    """Test that an empty file is reported as invalid."""
+    empty = tmp_path / "empty.pdf"
+    empty.touch()
+
+    reader, error = open_pdf(empty)
+    assert reader is None
+    assert error is not None
+    assert "Failed to read PDF" in error
+
+
+def test_open_pdf_requires_header(tmp_path, sample_duplex_pdf):
+    """Test that files without a %PDF- header are rejected before parsing."""
+    no_header = tmp_path / "scan.pdf"
+    no_header.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 4096 + b"%%EOF\n")
+
+    reader, error = open_pdf(no_header)
+    assert reader is None
+    assert error is not None
+    assert "%PDF- header" in error
+
+    # Leading junk is tolerated as long as the header is near the start
+    prefixed = tmp_path / "prefixed.pdf"
+    prefixed.write_bytes(b"\r\n" + sample_duplex_pdf.read_bytes())
+    reader, error = open_pdf(prefixed)
+    assert error is None
+    assert reader is not None
+    assert len(reader.pages) == 6
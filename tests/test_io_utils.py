@@ -1,17 +1,40 @@
 """Tests for I/O utilities."""
 
+import errno
+import hashlib
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+import pytest
+
 from duplexer.io_utils import (
+    FCNTL_AVAILABLE,
+    StabilityTracker,
+    StatCache,
     already_processed,
+    atomic_output,
+    bulk_already_processed,
     cleanup_ready_file,
+    compute_file_hash,
     ensure_dir,
+    file_state_lock,
+    fsync_dir,
     get_output_path,
+    get_ready_path,
     has_ready_file,
     is_file_ready,
     is_file_stable,
+    is_network_filesystem,
+    load_hash_index,
+    output_name_for,
+    prune_result_cache,
+    record_processed_hash,
+    restore_cached_result,
+    result_cache_path,
     safe_move,
+    store_cached_result,
 )
 
 
@@ -26,20 +49,137 @@ def test_ensure_dir(tmp_path):
     assert new_dir.exists()
 
 
+@pytest.mark.parametrize("use_tmpfile", [True, False])
+def test_atomic_output(tmp_path, monkeypatch, use_tmpfile):
+    """Test that atomic_output publishes complete files only."""
+    if not use_tmpfile:
+        monkeypatch.setattr("duplexer.io_utils._open_tmpfile", lambda directory: None)
+
+    target = tmp_path / "out.pdf"
+    with atomic_output(target, durable=True) as f:
+        f.write(b"first")
+        assert not target.exists()
+    assert target.read_bytes() == b"first"
+
+    # Existing outputs are replaced
+    with atomic_output(target) as f:
+        f.write(b"second")
+    assert target.read_bytes() == b"second"
+
+    # A failed write leaves the previous file and no temp files behind
+    with pytest.raises(RuntimeError), atomic_output(target) as f:
+        f.write(b"partial")
+        raise RuntimeError("boom")
+    assert target.read_bytes() == b"second"
+    assert list(tmp_path.iterdir()) == [target]
+
+
+@pytest.mark.parametrize("use_tmpfile", [True, False])
+def test_atomic_output_mode(tmp_path, monkeypatch, use_tmpfile):
+    """Test that both publishing paths give outputs the same permissions."""
+    if not use_tmpfile:
+        monkeypatch.setattr("duplexer.io_utils._open_tmpfile", lambda directory: None)
+
+    target = tmp_path / "out.pdf"
+    with atomic_output(target) as f:
+        f.write(b"data")
+
+    mask = os.umask(0o022)
+    os.umask(mask)
+    assert target.stat().st_mode & 0o777 == 0o644 & ~mask
+
+
+def test_fsync_dir(tmp_path):
+    """Test that directory fsync succeeds and tolerates missing directories."""
+    fsync_dir(tmp_path)
+    fsync_dir(tmp_path / "missing")
+
+
 def test_is_file_stable(tmp_path):
     """Test file stability checks."""
     test_file = tmp_path / "test.txt"
     test_file.write_text("initial content")
 
     # Should not be stable immediately
-    assert not is_file_stable(test_file, 1.0)
+    assert not is_file_stable(test_file, 0.2)
 
     # Wait for stability period
-    time.sleep(1.1)
-    assert is_file_stable(test_file, 1.0)
+    time.sleep(0.25)
+    assert is_file_stable(test_file, 0.2)
 
     # Test non-existent file
-    assert not is_file_stable(tmp_path / "nonexistent.txt", 1.0)
+    assert not is_file_stable(tmp_path / "nonexistent.txt", 0.2)
+
+    # A scan can pass the time it sampled once instead of reading the clock per file
+    mtime = test_file.stat().st_mtime
+    assert not is_file_stable(test_file, 10, now=mtime + 5)
+    assert is_file_stable(test_file, 10, now=mtime + 10)
+
+
+def test_is_file_stable_with_tracker(tmp_path):
+    """Test that an unchanged file is stable across scans despite a future mtime."""
+    test_file = tmp_path / "test.pdf"
+    test_file.write_text("content")
+    future = time.time() + 3600
+    os.utime(test_file, (future, future))
+
+    tracker = StabilityTracker()
+    assert not is_file_stable(test_file, 0.2)
+    assert not is_file_stable(test_file, 0.2, tracker=tracker)
+    time.sleep(0.25)
+    assert is_file_stable(test_file, 0.2, tracker=tracker)
+
+    # Any change restarts the window
+    test_file.write_text("more content")
+    os.utime(test_file, (future, future))
+    assert not is_file_stable(test_file, 0.2, tracker=tracker)
+
+    tracker.retain([])
+    assert not is_file_stable(test_file, 0.0001, tracker=tracker)
+
+
+def test_stat_cache(tmp_path, monkeypatch):
+    """Test that StatCache stats each path only once."""
+    test_file = tmp_path / "test.pdf"
+    test_file.write_text("content")
+
+    calls = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+
+    cache = StatCache()
+    assert cache.get(test_file) is not None
+    assert cache.exists(test_file)
+    assert not cache.exists(tmp_path / "missing.pdf")
+    assert cache.get(tmp_path / "missing.pdf") is None
+    assert len(calls) == 2
+
+    # Checks sharing a cache reuse the result
+    assert is_file_stable(test_file, 0, cache)
+    assert len(calls) == 2
+
+
+def test_stat_cache_listing(tmp_path, monkeypatch):
+    """Test that a seeded directory listing answers sidecar checks without stat."""
+    (tmp_path / "a.pdf").touch()
+    (tmp_path / "a.pdf.ready").touch()
+    (tmp_path / "b.pdf").touch()
+
+    cache = StatCache()
+    cache.put_listing(tmp_path, os.listdir(tmp_path))
+
+    def failing_stat(path, *args, **kwargs):
+        raise AssertionError(f"unexpected stat of {path}")
+
+    monkeypatch.setattr(os, "stat", failing_stat)
+
+    assert has_ready_file(tmp_path / "a.pdf", cache)
+    assert not has_ready_file(tmp_path / "b.pdf", cache)
 
 
 def test_has_ready_file(tmp_path):
@@ -78,20 +218,23 @@ def test_already_processed(temp_dirs):
     archive_dir = temp_dirs["archive"]
     suffix = ".duplex"
 
+    # Set mtimes explicitly rather than sleeping between touches
+    t0 = time.time_ns()
+    t1 = t0 + 1_000_000
+
     input_file = ingest_dir / "test.pdf"
     input_file.touch()
-    time.sleep(0.1)
+    os.utime(input_file, ns=(t0, t0))
 
     # Case 1: Output file exists and is newer
     output_file = output_dir / "test.duplex.pdf"
     output_file.touch()
+    os.utime(output_file, ns=(t1, t1))
     assert already_processed(input_file, output_dir, archive_dir, suffix)
 
     # Case 2: Output file exists but is older
-    output_file.unlink()
-    output_file.touch()
-    time.sleep(0.1)
-    input_file.touch()
+    os.utime(output_file, ns=(t0, t0))
+    os.utime(input_file, ns=(t1, t1))
     assert not already_processed(input_file, output_dir, archive_dir, suffix)
 
     # Case 3: File exists in archive
@@ -105,6 +248,243 @@ def test_already_processed(temp_dirs):
     assert not already_processed(input_file, output_dir, archive_dir, suffix)
 
 
+def test_bulk_already_processed(temp_dirs):
+    """Test that the batched check matches per-file already_processed."""
+    ingest_dir = temp_dirs["ingest"]
+    output_dir = temp_dirs["completed"]
+    archive_dir = temp_dirs["archive"]
+
+    for name in ("done.pdf", "archived.pdf", "new.pdf", "copy.pdf"):
+        (ingest_dir / name).write_bytes(f"%PDF-1.4 {name}".encode())
+    time.sleep(0.1)
+
+    (output_dir / "done.duplex.pdf").touch()
+    (archive_dir / "archived.pdf").touch()
+    (ingest_dir / "copy.pdf").write_bytes(b"%PDF-1.4 original")
+    (output_dir / "original.duplex.pdf").touch()
+    record_processed_hash(ingest_dir / "copy.pdf", archive_dir, "original.duplex.pdf")
+
+    paths = sorted(ingest_dir.glob("*.pdf"))
+    done = bulk_already_processed(paths, output_dir, archive_dir, ".duplex")
+
+    assert {p.name for p in done} == {"done.pdf", "archived.pdf", "copy.pdf"}
+    for path in paths:
+        assert (path in done) == already_processed(path, output_dir, archive_dir, ".duplex")
+
+    assert bulk_already_processed([], output_dir, archive_dir, ".duplex") == set()
+
+
+def test_result_cache_round_trip(tmp_path):
+    """Test storing, restoring and pruning cached results."""
+    cache_dir = tmp_path / "cache"
+    output = tmp_path / "out.pdf"
+    output.write_bytes(b"%PDF-1.4 result")
+
+    cache_path = result_cache_path(cache_dir, "abc", True, False)
+    assert cache_path.name == "abc_1_0.pdf"
+    assert not restore_cached_result(cache_path, tmp_path / "restored.pdf")
+
+    store_cached_result(output, cache_path)
+    assert cache_path.read_bytes() == b"%PDF-1.4 result"
+
+    restored = tmp_path / "restored.pdf"
+    assert restore_cached_result(cache_path, restored)
+    assert restored.read_bytes() == b"%PDF-1.4 result"
+
+    assert prune_result_cache(cache_dir, 3600) == 0
+    old = time.time() - 7200
+    os.utime(cache_path, (old, old))
+    assert prune_result_cache(cache_dir, 3600) == 1
+    assert not cache_path.exists()
+    assert prune_result_cache(tmp_path / "missing", 3600) == 0
+
+
+def test_compute_file_hash(tmp_path):
+    """Test content hashing is stable and content-dependent."""
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    a.write_bytes(b"same content")
+    b.write_bytes(b"same content")
+
+    assert compute_file_hash(a) == compute_file_hash(b)
+    assert compute_file_hash(a) == hashlib.sha256(b"same content").hexdigest()
+
+    b.write_bytes(b"other content")
+    assert compute_file_hash(a) != compute_file_hash(b)
+
+
+def test_load_hash_index_reuses_parsed_index(tmp_path, monkeypatch):
+    """Test that the hash index is only parsed again after it changes."""
+    import duplexer.io_utils
+
+    archive_dir = tmp_path / "archive"
+    first = tmp_path / "first.pdf"
+    first.write_bytes(b"%PDF-1.4 first")
+    record_processed_hash(first, archive_dir, "first.duplex.pdf")
+
+    parses = []
+    json_load = duplexer.io_utils.json.load
+
+    def counting_load(f):
+        parses.append(f.name)
+        return json_load(f)
+
+    monkeypatch.setattr(duplexer.io_utils.json, "load", counting_load)
+
+    index = load_hash_index(archive_dir)
+    assert load_hash_index(archive_dir) is index
+    assert len(parses) == 1
+
+    # Recording replaces the file, which invalidates the parsed copy
+    second = tmp_path / "second.pdf"
+    second.write_bytes(b"%PDF-1.4 second")
+    record_processed_hash(second, archive_dir, "second.duplex.pdf")
+    assert {entry["output"] for entry in load_hash_index(archive_dir).values()} == {
+        "first.duplex.pdf",
+        "second.duplex.pdf",
+    }
+    # The shared copy handed out earlier was not modified
+    assert len(index) == 1
+
+
+def test_record_processed_hash_caps_index(tmp_path, monkeypatch):
+    """Test that the hash index keeps only the most recently recorded files."""
+    import duplexer.io_utils
+
+    monkeypatch.setattr(duplexer.io_utils, "HASH_INDEX_MAX_ENTRIES", 2)
+    archive_dir = tmp_path / "archive"
+
+    def record(name: str) -> None:
+        scan = tmp_path / f"{name}.pdf"
+        scan.write_bytes(f"%PDF-1.4 {name}".encode())
+        record_processed_hash(scan, archive_dir, f"{name}.duplex.pdf")
+
+    def outputs() -> list[str]:
+        return [entry["output"] for entry in load_hash_index(archive_dir).values()]
+
+    record("first")
+    record("second")
+    # Recording the same content again makes it the newest entry
+    record("first")
+    record("third")
+    assert outputs() == ["first.duplex.pdf", "third.duplex.pdf"]
+
+
+def test_already_processed_by_content(temp_dirs):
+    """Test that a renamed copy of a processed file is detected."""
+    output_dir = temp_dirs["completed"]
+    archive_dir = temp_dirs["archive"]
+
+    original = temp_dirs["ingest"] / "scan.pdf"
+    original.write_bytes(b"%PDF-1.4 scanned pages")
+    (output_dir / "scan.duplex.pdf").touch()
+    record_processed_hash(original, archive_dir, "scan.duplex.pdf")
+
+    duplicate = temp_dirs["ingest"] / "scan_1.pdf"
+    duplicate.write_bytes(b"%PDF-1.4 scanned pages")
+    assert already_processed(duplicate, output_dir, archive_dir, ".duplex")
+
+    # Different content is not a duplicate
+    different = temp_dirs["ingest"] / "scan_2.pdf"
+    different.write_bytes(b"%PDF-1.4 other pages!!")
+    assert not already_processed(different, output_dir, archive_dir, ".duplex")
+
+    # Once the recorded output is gone the duplicate is processed again
+    (output_dir / "scan.duplex.pdf").unlink()
+    assert not already_processed(duplicate, output_dir, archive_dir, ".duplex")
+
+
+def test_already_processed_recognizes_same_file_without_hashing(temp_dirs, monkeypatch):
+    """Test that an unchanged processed file moved back into ingest is not re-hashed."""
+    import duplexer.io_utils
+
+    output_dir = temp_dirs["completed"]
+    archive_dir = temp_dirs["archive"]
+
+    scan = temp_dirs["ingest"] / "scan.pdf"
+    scan.write_bytes(b"%PDF-1.4 scanned pages")
+    (output_dir / "scan.duplex.pdf").touch()
+    record_processed_hash(scan, archive_dir, "scan.duplex.pdf")
+
+    # Archived, then moved back under another name: same inode and mtime
+    archived = archive_dir / "scan.pdf"
+    scan.rename(archived)
+    returned = temp_dirs["ingest"] / "returned.pdf"
+    archived.rename(returned)
+
+    hashed = []
+    real_hash = duplexer.io_utils.compute_file_hash
+    monkeypatch.setattr(
+        duplexer.io_utils, "compute_file_hash", lambda path: hashed.append(path) or real_hash(path)
+    )
+
+    assert already_processed(returned, output_dir, archive_dir, ".duplex")
+    assert bulk_already_processed([returned], output_dir, archive_dir, ".duplex") == {returned}
+    assert hashed == []
+
+    # A different file of the same size still goes through the content hash
+    other = temp_dirs["ingest"] / "other.pdf"
+    other.write_bytes(b"%PDF-1.4 scanned pages")
+    assert already_processed(other, output_dir, archive_dir, ".duplex")
+    assert hashed == [other]
+
+
+def test_already_processed_ignores_mtime_churn(temp_dirs):
+    """Test that a processed input whose mtime changed but content did not is skipped."""
+    output_dir = temp_dirs["completed"]
+    archive_dir = temp_dirs["archive"]
+
+    input_file = temp_dirs["ingest"] / "scan.pdf"
+    input_file.write_bytes(b"%PDF-1.4 scanned pages")
+    (output_dir / "scan.duplex.pdf").touch()
+    record_processed_hash(input_file, archive_dir, "scan.duplex.pdf")
+
+    # E.g. restored from a backup: now newer than its output
+    later = time.time() + 60
+    os.utime(input_file, (later, later))
+    assert already_processed(input_file, output_dir, archive_dir, ".duplex")
+    assert bulk_already_processed([input_file], output_dir, archive_dir, ".duplex") == {input_file}
+
+    # A real edit is processed again
+    input_file.write_bytes(b"%PDF-1.4 rescanned pages")
+    os.utime(input_file, (later, later))
+    assert not already_processed(input_file, output_dir, archive_dir, ".duplex")
+
+
+def test_already_processed_by_content_unreadable_input(temp_dirs, monkeypatch):
+    """Test that an input that vanishes or cannot be read while hashing counts as unprocessed."""
+    import duplexer.io_utils
+
+    output_dir = temp_dirs["completed"]
+    archive_dir = temp_dirs["archive"]
+
+    original = temp_dirs["ingest"] / "scan.pdf"
+    original.write_bytes(b"%PDF-1.4 scanned pages")
+    (output_dir / "scan.duplex.pdf").touch()
+    record_processed_hash(original, archive_dir, "scan.duplex.pdf")
+
+    # Same size as the indexed file, so it has to be hashed
+    vanishing = temp_dirs["ingest"] / "scan_1.pdf"
+    vanishing.write_bytes(b"%PDF-1.4 scanned pages")
+    stat_cache = StatCache()
+    stat_cache.put(vanishing, vanishing.stat())
+    vanishing.unlink()
+    assert not already_processed(vanishing, output_dir, archive_dir, ".duplex", stat_cache)
+    assert (
+        bulk_already_processed([vanishing], output_dir, archive_dir, ".duplex", stat_cache) == set()
+    )
+
+    unreadable = temp_dirs["ingest"] / "scan_2.pdf"
+    unreadable.write_bytes(b"%PDF-1.4 scanned pages")
+
+    def deny(path):
+        raise PermissionError(errno.EACCES, "Permission denied", str(path))
+
+    monkeypatch.setattr(duplexer.io_utils, "compute_file_hash", deny)
+    assert not already_processed(unreadable, output_dir, archive_dir, ".duplex")
+    assert bulk_already_processed([unreadable], output_dir, archive_dir, ".duplex") == set()
+
+
 def test_safe_move(tmp_path):
     """Test safe_move functionality."""
     source_dir = tmp_path / "source"
@@ -114,6 +494,7 @@ def test_safe_move(tmp_path):
 
     source_file = source_dir / "move_me.txt"
     source_file.write_text("content")
+    source_inode = source_file.stat().st_ino
 
     # Basic move
     moved_path = safe_move(source_file, dest_dir)
@@ -121,6 +502,8 @@ def test_safe_move(tmp_path):
     assert moved_path == dest_dir / "move_me.txt"
     assert not source_file.exists()
     assert moved_path.exists()
+    # Within one filesystem the file is renamed, never copied
+    assert moved_path.stat().st_ino == source_inode
 
     # Move with name conflict
     source_file.write_text("content 2")
@@ -134,6 +517,109 @@ def test_safe_move(tmp_path):
     assert moved_path_conflict.exists()
 
 
+def test_safe_move_many_conflicts(tmp_path):
+    """Test that repeated name conflicts still produce unique destinations."""
+    dest_dir = tmp_path / "dest"
+    moved = set()
+    for i in range(4):
+        source_file = tmp_path / "scan.pdf"
+        source_file.write_text(f"content {i}")
+        moved_path = safe_move(source_file, dest_dir)
+        assert moved_path is not None
+        moved.add(moved_path)
+
+    assert len(moved) == 4
+    assert all(p.name.startswith("scan") and p.suffix == ".pdf" for p in moved)
+    assert sorted(p.read_text() for p in moved) == [f"content {i}" for i in range(4)]
+
+
+def test_safe_move_conflicts_cost_constant_probes(tmp_path, monkeypatch):
+    """Test that finding a free name does not probe every existing copy."""
+    dest_dir = tmp_path / "failed"
+    dest_dir.mkdir()
+    (dest_dir / "invalid.pdf").touch()
+    for i in range(1, 1000):
+        (dest_dir / f"invalid_{i}.pdf").touch()
+
+    source_file = tmp_path / "invalid.pdf"
+    source_file.write_text("not a pdf")
+
+    real_open = os.open
+    probes = []
+
+    def counting_open(path, flags, *args, **kwargs):
+        if flags & os.O_EXCL:
+            probes.append(path)
+        return real_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(os, "open", counting_open)
+
+    moved_path = safe_move(source_file, dest_dir)
+    assert moved_path is not None
+    assert moved_path.read_text() == "not a pdf"
+    assert moved_path.name.startswith("invalid_") and moved_path.suffix == ".pdf"
+    # The original name and _1, then one randomly named claim
+    assert len(probes) == 3
+
+
+def test_safe_move_cross_device(tmp_path, monkeypatch):
+    """Test that safe_move falls back to copying when rename crosses devices."""
+    source_file = tmp_path / "scan.pdf"
+    source_file.write_text("content")
+    dest_dir = tmp_path / "archive"
+
+    real_replace = os.replace
+
+    def fail_replace(src, dst):
+        # Only the rename out of the source directory crosses devices
+        if Path(src).parent == source_file.parent:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+
+    moved_path = safe_move(source_file, dest_dir)
+    assert moved_path == dest_dir / "scan.pdf"
+    assert (dest_dir / "scan.pdf").read_text() == "content"
+    assert not source_file.exists()
+    # The copy was published by rename, leaving no temporary file behind
+    assert list(dest_dir.iterdir()) == [dest_dir / "scan.pdf"]
+
+
+def test_safe_move_failure_releases_name(tmp_path):
+    """Test that a failed move does not leave a placeholder behind."""
+    dest_dir = tmp_path / "dest"
+
+    assert safe_move(tmp_path / "missing.txt", dest_dir) is None
+    assert list(dest_dir.iterdir()) == []
+
+
+def test_is_network_filesystem(tmp_path):
+    """Test network filesystem detection from a mount table."""
+    mounts = tmp_path / "mounts"
+    mounts.write_text(
+        "/dev/sda1 / ext4 rw 0 0\n"
+        "server:/export /mnt/scans nfs4 rw 0 0\n"
+        "/dev/sdb1 /mnt/scans/local ext4 rw 0 0\n"
+        "bucket /mnt/bucket fuse.s3fs rw 0 0\n"
+        "/dev/sdc1 /mnt/usb fuse.ntfs-3g rw 0 0\n"
+    )
+
+    assert is_network_filesystem(Path("/mnt/scans/inbox"), mounts) is True
+    assert is_network_filesystem(Path("/mnt/scans/local/inbox"), mounts) is False
+    assert is_network_filesystem(Path("/mnt/scansx"), mounts) is False
+    assert is_network_filesystem(Path("/mnt/bucket/inbox"), mounts) is True
+    assert is_network_filesystem(Path("/mnt/usb/inbox"), mounts) is False
+    assert is_network_filesystem(Path("/home"), mounts) is False
+    assert is_network_filesystem(Path("/home"), tmp_path / "missing") is False
+
+
+def test_get_ready_path():
+    """Test ready sidecar path generation."""
+    assert get_ready_path(Path("/scans/document.pdf")) == Path("/scans/document.pdf.ready")
+    assert get_ready_path(Path("/scans/noext")) == Path("/scans/noext.ready")
+
+
 def test_get_output_path():
     """Test output path generation."""
     input_path = Path("/scans/document.pdf")
@@ -142,6 +628,23 @@ def test_get_output_path():
     expected = Path("/processed/document.done.pdf")
     assert get_output_path(input_path, output_dir, suffix) == expected
 
+    # Only the last extension moves; dotfiles keep their whole name as the stem
+    assert get_output_path(Path("/scans/a.b.pdf"), output_dir, suffix) == Path(
+        "/processed/a.b.done.pdf"
+    )
+    assert get_output_path(Path("/scans/.hidden"), output_dir, suffix) == Path(
+        "/processed/.hidden.done"
+    )
+
+    # The input's extension is kept as is, for SCAN_GLOB patterns other than *.pdf
+    assert get_output_path(Path("/scans/SCAN.PDF"), output_dir, suffix) == Path(
+        "/processed/SCAN.done.PDF"
+    )
+
+    # The name-only helper used by the already-processed checks agrees
+    for name in ("document.pdf", "a.b.pdf", ".hidden", "noext", "SCAN.PDF"):
+        assert output_name_for(name, suffix) == get_output_path(Path(name), output_dir, suffix).name
+
 
 def test_cleanup_ready_file(tmp_path):
     """Test removal of .ready sidecar file."""
@@ -158,3 +661,60 @@ def test_cleanup_ready_file(tmp_path):
     # Test that it doesn't fail if ready file doesn't exist
     cleanup_ready_file(test_file)
     assert not ready_file.exists()
+
+
+def _lock_available(lock_dir: Path, name: str) -> bool:
+    """Try the lock from another thread or process and report whether it was free."""
+    with file_state_lock(lock_dir, name) as locked:
+        return locked
+
+
+@pytest.mark.skipif(not FCNTL_AVAILABLE, reason="advisory locks need fcntl")
+def test_concurrent_lock(tmp_path):
+    """Test that the per-file lock is exclusive across threads and processes."""
+    lock_dir = tmp_path / "locks"
+
+    with file_state_lock(lock_dir, "scan.pdf") as locked:
+        assert locked
+
+        # Re-entrant within the holding thread
+        with file_state_lock(lock_dir, "scan.pdf") as again:
+            assert again
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert not pool.submit(_lock_available, lock_dir, "scan.pdf").result()
+            assert pool.submit(_lock_available, lock_dir, "other.pdf").result()
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert not pool.submit(_lock_available, lock_dir, "scan.pdf").result()
+
+    # Released (including the lock file) once the outermost context exits
+    assert list(lock_dir.iterdir()) == []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(_lock_available, lock_dir, "scan.pdf").result()
+
+
+def test_per_file_writes_create_directories_lazily(tmp_path, pdf_cache, monkeypatch):
+    """Test that per-file writes only create their directory when it is missing."""
+    archive = tmp_path / "archive"
+    cache = tmp_path / "cache"
+    source = pdf_cache(tmp_path / "scan.pdf", ["F1", "B1"])
+    output = pdf_cache(tmp_path / "scan.duplex.pdf", ["F1", "B1"])
+    cache_path = result_cache_path(cache, compute_file_hash(source), True, False)
+
+    # Missing directories are created on first use
+    record_processed_hash(source, archive, output.name)
+    store_cached_result(output, cache_path)
+    with file_state_lock(archive / "locks", "scan.pdf") as locked:
+        assert locked
+    assert load_hash_index(archive)
+    assert cache_path.exists()
+
+    # Existing directories are not checked again
+    def fail_ensure_dir(path):
+        raise AssertionError(f"unexpected directory check for {path}")
+
+    monkeypatch.setattr("duplexer.io_utils.ensure_dir", fail_ensure_dir)
+    record_processed_hash(source, archive, output.name)
+    store_cached_result(output, cache_path)
+    with file_state_lock(archive / "locks", "scan.pdf") as locked:
+        assert locked
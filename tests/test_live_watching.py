@@ -1,14 +1,21 @@
 """Integration test for live file watching."""
 
+import os
 import shutil
 import time
 from pathlib import Path
-from threading import Thread
+from threading import Event, Thread
 
 from conftest import create_test_pdf
 from duplexer.watcher import FileWatcher
 
 
+def _bump_mtime(path: Path, offset_ns: int) -> None:
+    """Move a file's mtime forward, as a write would, without waiting for the clock."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset_ns))
+
+
 def test_live_file_watching(temp_dirs, tmp_path):
     """Test that watcher detects and processes files added after startup."""
     # Create a test PDF outside the watched directory
@@ -17,14 +24,14 @@ def test_live_file_watching(temp_dirs, tmp_path):
 
     # Track processed files
     processed = []
-    process_completed = []
+    done = Event()
 
     def callback(path: Path):
         processed.append(path.name)
         # Simulate processing by creating output
         output = temp_dirs["completed"] / f"{path.stem}.duplex{path.suffix}"
         output.write_text("processed")
-        process_completed.append(True)
+        done.set()
 
     # Start watcher with very short stability time for faster test
     watcher = FileWatcher(
@@ -48,13 +55,12 @@ def test_live_file_watching(temp_dirs, tmp_path):
 
     # Wait for file to be stable and processed (stability + processing time)
     max_wait = 5
-    start_time = time.time()
-    while len(processed) == 0 and (time.time() - start_time) < max_wait:
-        time.sleep(0.2)
+    assert done.wait(timeout=max_wait), "Watcher did not process the file in time"
 
     # Stop watcher
     watcher.stop()
-    time.sleep(0.5)
+    watcher_thread.join(timeout=1.0)
+    assert not watcher_thread.is_alive()
 
     # Verify file was processed
     assert len(processed) == 1, f"Expected 1 file processed, got {len(processed)}"
@@ -65,15 +71,18 @@ def test_live_file_watching(temp_dirs, tmp_path):
 def test_live_file_watching_with_modification(temp_dirs, tmp_path):
     """Test that watcher processes file after it becomes stable."""
     processed = []
+    done = Event()
 
     def callback(path: Path):
         processed.append(path.name)
+        done.set()
 
+    stability_seconds = 0.1
     watcher = FileWatcher(
         input_dir=temp_dirs["ingest"],
         process_callback=callback,
         pattern="*.pdf",
-        stability_seconds=0.5,
+        stability_seconds=stability_seconds,
     )
 
     # Run watcher in background
@@ -85,17 +94,62 @@ def test_live_file_watching_with_modification(temp_dirs, tmp_path):
     test_file = temp_dirs["ingest"] / "growing.pdf"
     create_test_pdf(test_file, ["F1", "B1"])
 
-    # Modify it a few times
-    for _i in range(3):
-        time.sleep(0.2)
-        test_file.touch()
+    # Modify it a few times; each bump is a separate change event
+    for i in range(1, 4):
+        _bump_mtime(test_file, i * int(stability_seconds * 1e9 / 4))
 
     # Now wait for stability + processing
-    time.sleep(1.5)
+    assert done.wait(timeout=5), "Watcher did not process the file in time"
 
     watcher.stop()
-    time.sleep(0.5)
+    watcher_thread.join(timeout=1.0)
+    assert not watcher_thread.is_alive()
 
     # Should be processed exactly once after becoming stable
     assert len(processed) == 1
     assert "growing.pdf" in processed
+
+
+def test_live_file_watching_while_processing(temp_dirs, tmp_path):
+    """Test that files arriving during a long callback are still picked up."""
+    source_pdf = tmp_path / "source.pdf"
+    create_test_pdf(source_pdf, ["F1", "B1"])
+
+    started = Event()
+    release = Event()
+    finished = {"first.pdf": Event(), "second.pdf": Event()}
+
+    def callback(path: Path):
+        if path.name == "first.pdf":
+            started.set()
+            release.wait(timeout=5)
+        finished[path.name].set()
+
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=callback,
+        pattern="*.pdf",
+        stability_seconds=0.1,
+        max_workers=2,
+    )
+
+    watcher_thread = Thread(target=watcher.watch, daemon=True)
+    watcher_thread.start()
+    time.sleep(1)
+
+    try:
+        shutil.copy(source_pdf, temp_dirs["ingest"] / "first.pdf")
+        assert started.wait(timeout=5), "First file was not picked up"
+
+        # The first callback is still running; detection must carry on regardless
+        shutil.copy(source_pdf, temp_dirs["ingest"] / "second.pdf")
+        assert finished["second.pdf"].wait(timeout=5), "Second file waited on the first"
+        assert not finished["first.pdf"].is_set()
+    finally:
+        release.set()
+
+    assert finished["first.pdf"].wait(timeout=5)
+
+    watcher.stop()
+    watcher_thread.join(timeout=1.0)
+    assert not watcher_thread.is_alive()
@@ -1,30 +1,19 @@
 """Performance tests for large PDF handling."""
 
+import os
 import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pytest
-from pypdf import PdfReader, PdfWriter
+from pypdf import PdfReader
 
 from duplexer.interleave import interleave_duplex
+from duplexer.watcher import FileWatcher
 
-
-def create_large_pdf(output_path: Path, num_pages: int) -> None:
-    """
-    Create a large PDF with many blank pages for performance testing.
-
-    Args:
-        output_path: Where to write the PDF
-        num_pages: Number of pages to create
-    """
-    writer = PdfWriter()
-
-    # Create blank pages efficiently
-    for _ in range(num_pages):
-        writer.add_blank_page(width=612, height=792)
-
-    with open(output_path, "wb") as f:
-        writer.write(f)
+pytestmark = pytest.mark.slow
 
 
 def get_file_size_mb(path: Path) -> float:
@@ -32,47 +21,24 @@ def get_file_size_mb(path: Path) -> float:
     return path.stat().st_size / (1024 * 1024)
 
 
-@pytest.mark.slow
-def test_large_pdf_100_pages(tmp_path):
-    """Test interleaving a 100-page PDF completes quickly."""
-    # Create 100-page PDF (50 fronts, 50 backs)
-    input_pdf = tmp_path / "large_100.pdf"
-    create_large_pdf(input_pdf, 100)
-
-    output_pdf = tmp_path / "output.pdf"
-
-    # Time the interleaving
-    start_time = time.time()
-    interleave_duplex(
-        input_pdf,
-        output_pdf,
-        reverse_backs=True,
-        insert_blank_lastback=False,
-    )
-    elapsed = time.time() - start_time
-
-    # Verify output
-    assert output_pdf.exists()
-    reader = PdfReader(output_pdf)
-    assert len(reader.pages) == 100
-
-    # Should complete in under 5 seconds
-    assert elapsed < 5.0, f"Processing took {elapsed:.2f}s, expected < 5s"
-
-    # Log performance metrics
-    print(
-        f"\n100-page PDF: {elapsed:.3f}s, "
-        f"input={get_file_size_mb(input_pdf):.2f}MB, "
-        f"output={get_file_size_mb(output_pdf):.2f}MB"
-    )
-
-
-@pytest.mark.slow
-def test_large_pdf_500_pages(tmp_path):
-    """Test interleaving a 500-page PDF completes in reasonable time."""
-    # Create 500-page PDF (250 fronts, 250 backs)
-    input_pdf = tmp_path / "large_500.pdf"
-    create_large_pdf(input_pdf, 500)
+@pytest.mark.parametrize(
+    ("num_pages", "max_elapsed"),
+    [
+        pytest.param(100, 5.0, marks=pytest.mark.pdf_pages(100), id="100_pages"),
+        pytest.param(
+            500,
+            20.0,
+            marks=[pytest.mark.pdf_pages(500), pytest.mark.xdist_group("pdf_500")],
+            id="500_pages",
+        ),
+        # Pages are imported in one append pass, so this stays far below the old 40s budget
+        pytest.param(1000, 8.0, marks=pytest.mark.pdf_pages(1000), id="1000_pages"),
+    ],
+)
+def test_large_pdf(tmp_path, large_pdf_cache, num_pages, max_elapsed):
+    """Test interleaving large PDFs (half fronts, half backs) within a time budget."""
+    input_pdf = tmp_path / f"large_{num_pages}.pdf"
+    large_pdf_cache(input_pdf, num_pages)
 
     output_pdf = tmp_path / "output.pdf"
 
@@ -89,100 +55,56 @@ def test_large_pdf_500_pages(tmp_path):
     # Verify output
     assert output_pdf.exists()
     reader = PdfReader(output_pdf)
-    assert len(reader.pages) == 500
+    assert len(reader.pages) == num_pages
 
-    # Should complete in under 20 seconds
-    assert elapsed < 20.0, f"Processing took {elapsed:.2f}s, expected < 20s"
+    assert elapsed < max_elapsed, f"Processing took {elapsed:.2f}s, expected < {max_elapsed:.0f}s"
 
     # Log performance metrics
     print(
-        f"\n500-page PDF: {elapsed:.3f}s, "
+        f"\n{num_pages}-page PDF: {elapsed:.3f}s, "
         f"input={get_file_size_mb(input_pdf):.2f}MB, "
         f"output={get_file_size_mb(output_pdf):.2f}MB"
     )
 
 
-@pytest.mark.slow
-def test_large_pdf_1000_pages(tmp_path):
-    """Test interleaving a 1000-page PDF (stress test)."""
-    # Create 1000-page PDF (500 fronts, 500 backs)
-    input_pdf = tmp_path / "large_1000.pdf"
-    create_large_pdf(input_pdf, 1000)
-
-    output_pdf = tmp_path / "output.pdf"
-
-    # Time the interleaving
-    start_time = time.time()
-    interleave_duplex(
-        input_pdf,
-        output_pdf,
-        reverse_backs=True,
-        insert_blank_lastback=False,
-    )
-    elapsed = time.time() - start_time
-
-    # Verify output
-    assert output_pdf.exists()
-    reader = PdfReader(output_pdf)
-    assert len(reader.pages) == 1000
-
-    # Should complete in under 40 seconds
-    assert elapsed < 40.0, f"Processing took {elapsed:.2f}s, expected < 40s"
-
-    # Log performance metrics
-    print(
-        f"\n1000-page PDF: {elapsed:.3f}s, "
-        f"input={get_file_size_mb(input_pdf):.2f}MB, "
-        f"output={get_file_size_mb(output_pdf):.2f}MB"
-    )
-
-
-@pytest.mark.slow
-def test_memory_efficiency_large_pdf(tmp_path):
+@pytest.mark.pdf_pages(500)
+@pytest.mark.xdist_group("pdf_500")
+def test_memory_efficiency_large_pdf(tmp_path, large_pdf_cache):
     """
     Test that large PDF processing doesn't load entire file into memory.
 
     This test verifies the implementation streams pages rather than
     loading the entire PDF into memory at once.
     """
-    import os
-
-    import psutil
-
-    # Get current process
-    process = psutil.Process(os.getpid())
-
-    # Record initial memory usage
-    initial_memory_mb = process.memory_info().rss / (1024 * 1024)
-
     # Create 500-page PDF
     input_pdf = tmp_path / "large_500.pdf"
-    create_large_pdf(input_pdf, 500)
+    large_pdf_cache(input_pdf, 500)
 
     file_size_mb = get_file_size_mb(input_pdf)
 
-    # Process the PDF
-    output_pdf = tmp_path / "output.pdf"
-    interleave_duplex(
-        input_pdf,
-        output_pdf,
-        reverse_backs=True,
-        insert_blank_lastback=False,
-    )
+    # Trace only the allocations made while interleaving
+    tracemalloc.start()
+    try:
+        output_pdf = tmp_path / "output.pdf"
+        interleave_duplex(
+            input_pdf,
+            output_pdf,
+            reverse_backs=True,
+            insert_blank_lastback=False,
+        )
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
 
-    # Record peak memory usage
-    peak_memory_mb = process.memory_info().rss / (1024 * 1024)
-    memory_increase_mb = peak_memory_mb - initial_memory_mb
+    memory_increase_mb = peak_bytes / (1024 * 1024)
 
-    # Memory increase should be reasonable (not loading entire file)
-    # For blank pages, PDFs are very small, so we check for reasonable overhead
-    # Allow up to 50MB increase (much larger than file but reasonable for processing)
-    max_allowed_mb = max(50.0, file_size_mb * 10)
+    # Memory increase should be reasonable. The input is read into memory
+    # whole, so the bound includes that copy of it; for blank pages the PDFs
+    # are very small, so this mostly checks for reasonable overhead
+    max_allowed_mb = max(20.0, file_size_mb * 10)
 
     print(
-        f"\nMemory usage: initial={initial_memory_mb:.2f}MB, "
-        f"peak={peak_memory_mb:.2f}MB, "
-        f"increase={memory_increase_mb:.2f}MB, "
+        f"\nMemory usage: peak={memory_increase_mb:.2f}MB, "
         f"file_size={file_size_mb:.2f}MB, "
         f"max_allowed={max_allowed_mb:.2f}MB"
     )
@@ -192,8 +114,8 @@ def test_memory_efficiency_large_pdf(tmp_path):
     )
 
 
-@pytest.mark.slow
-def test_concurrent_large_pdf_processing(tmp_path):
+@pytest.mark.pdf_pages(600)
+def test_concurrent_large_pdf_processing(tmp_path, large_pdf_cache):
     """
     Test that multiple large PDFs can be processed without issues.
 
@@ -203,23 +125,17 @@ def test_concurrent_large_pdf_processing(tmp_path):
     pdfs = []
     for i in range(3):
         input_pdf = tmp_path / f"large_{i}.pdf"
-        create_large_pdf(input_pdf, 200)
+        large_pdf_cache(input_pdf, 200)
         pdfs.append(input_pdf)
 
-    # Process all PDFs
-    start_time = time.time()
-    outputs = []
-
-    for i, input_pdf in enumerate(pdfs):
-        output_pdf = tmp_path / f"output_{i}.pdf"
-        interleave_duplex(
-            input_pdf,
-            output_pdf,
-            reverse_backs=True,
-            insert_blank_lastback=False,
-        )
-        outputs.append(output_pdf)
+    outputs = [tmp_path / f"output_{i}.pdf" for i in range(len(pdfs))]
+    workers = min(len(pdfs), os.cpu_count() or 1)
+    interleave = partial(interleave_duplex, reverse_backs=True, insert_blank_lastback=False)
 
+    # Process all PDFs at once, like the watch-mode worker pool
+    start_time = time.time()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(interleave, pdfs, outputs))
     elapsed = time.time() - start_time
 
     # Verify all outputs
@@ -228,31 +144,23 @@ def test_concurrent_large_pdf_processing(tmp_path):
         reader = PdfReader(output_pdf)
         assert len(reader.pages) == 200
 
-    # Should complete in reasonable time
-    assert elapsed < 15.0, f"Processing 3x200 pages took {elapsed:.2f}s"
+    # The files run side by side, so the budget shrinks with the worker count;
+    # the constant covers starting the worker processes
+    max_allowed = 15.0 / workers + 2.0
+    assert elapsed < max_allowed, f"Processing 3x200 pages took {elapsed:.2f}s"
 
-    print(f"\nProcessed 3 PDFs (200 pages each) in {elapsed:.3f}s")
+    print(f"\nProcessed 3 PDFs (200 pages each) on {workers} workers in {elapsed:.3f}s")
 
 
-def test_page_order_preserved_large_pdf(tmp_path):
+def test_page_order_preserved_large_pdf(tmp_path, large_pdf_cache):
     """
     Test that page order is correct even with large PDFs.
 
     This ensures the interleaving algorithm works correctly at scale.
     """
-    # Create a 100-page PDF with specific pattern
+    # Create a 100-page PDF: 50 fronts (F1-F50), 50 backs (B50-B1)
     input_pdf = tmp_path / "ordered.pdf"
-    writer = PdfWriter()
-
-    # Add 100 pages: 50 fronts (F1-F50), 50 backs (B50-B1)
-    for _ in range(1, 51):
-        writer.add_blank_page(width=612, height=792)
-
-    for _ in range(50, 0, -1):
-        writer.add_blank_page(width=612, height=792)
-
-    with open(input_pdf, "wb") as f:
-        writer.write(f)
+    large_pdf_cache(input_pdf, 100)
 
     # Interleave
     output_pdf = tmp_path / "output.pdf"
@@ -272,10 +180,10 @@ def test_page_order_preserved_large_pdf(tmp_path):
     # the interleaving completed without errors and has correct count
 
 
-def test_edge_case_minimum_large_pdf(tmp_path):
+def test_edge_case_minimum_large_pdf(tmp_path, large_pdf_cache):
     """Test edge case: exactly 2 pages (minimum for interleaving)."""
     input_pdf = tmp_path / "minimal.pdf"
-    create_large_pdf(input_pdf, 2)
+    large_pdf_cache(input_pdf, 2)
 
     output_pdf = tmp_path / "output.pdf"
     interleave_duplex(
@@ -287,3 +195,32 @@ def test_edge_case_minimum_large_pdf(tmp_path):
 
     reader = PdfReader(output_pdf)
     assert len(reader.pages) == 2
+
+
+def test_scan_large_ingest_directory(tmp_path):
+    """Test that one scan of a directory with thousands of files stays cheap."""
+    num_files = 5000
+    old = time.time() - 3600
+    for i in range(num_files):
+        path = tmp_path / f"scan_{i:05d}.pdf"
+        path.touch()
+        os.utime(path, (old, old))
+        if i % 2:
+            (tmp_path / f"notes_{i:05d}.txt").touch()
+
+    watcher = FileWatcher(
+        input_dir=tmp_path,
+        process_callback=lambda path: None,
+        pattern="*.pdf",
+        stability_seconds=1.0,
+    )
+
+    start_time = time.time()
+    ready = watcher.collect_ready_files()
+    elapsed = time.time() - start_time
+
+    assert len(ready) == num_files
+    # One listing and one stat per candidate; batching the stats is not worth a dependency
+    assert elapsed < 2.0, f"Scanning took {elapsed:.2f}s, expected < 2s"
+
+    print(f"\nScanned {num_files} files in {elapsed:.3f}s")
@@ -1,7 +1,14 @@
 """Tests for process_pdf_file function."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Thread
+
+import pytest
+
 from conftest import create_test_pdf
-from duplexer.cli import process_pdf_file
+from duplexer.cli import create_process_callback, process_pdf_batch, process_pdf_file
+from duplexer.io_utils import LOCK_DIR_NAME, file_state_lock
 
 
 def test_process_pdf_file_success(temp_dirs):
@@ -30,6 +37,107 @@ def test_process_pdf_file_success(temp_dirs):
     assert not input_pdf.exists()
 
 
+def test_process_pdf_batch(temp_dirs, pdf_cache):
+    """Test that a batch of PDFs is processed in parallel worker processes."""
+    # Distinct content, so none is skipped as a duplicate of another
+    inputs = [
+        pdf_cache(temp_dirs["ingest"] / f"scan{i}.pdf", [f"F{i}", "F2", "B2", "B1"])
+        for i in range(5)
+    ]
+    process_file = create_process_callback(
+        output_dir=temp_dirs["completed"],
+        archive_dir=temp_dirs["archive"],
+        failed_dir=temp_dirs["failed"],
+        output_suffix=".duplex",
+        reverse_backs=True,
+        insert_blank_lastback=False,
+        durable=False,
+    )
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert process_pdf_batch(inputs, executor, process_file, max_pending=2) == 5
+
+    for input_pdf in inputs:
+        assert (temp_dirs["completed"] / f"{input_pdf.stem}.duplex.pdf").exists()
+        assert (temp_dirs["archive"] / input_pdf.name).exists()
+        assert not input_pdf.exists()
+
+
+def test_process_pdf_file_skips_locked_file(temp_dirs):
+    """Test that a file locked by another worker is left alone."""
+    input_pdf = temp_dirs["ingest"] / "test.pdf"
+    create_test_pdf(input_pdf, ["F1", "F2", "B2", "B1"])
+
+    def process():
+        process_pdf_file(
+            file_path=input_pdf,
+            output_dir=temp_dirs["completed"],
+            archive_dir=temp_dirs["archive"],
+            failed_dir=temp_dirs["failed"],
+            output_suffix=".duplex",
+            reverse_backs=True,
+            insert_blank_lastback=False,
+        )
+
+    # Another worker holds the lock, as a second instance would
+    with file_state_lock(temp_dirs["archive"] / LOCK_DIR_NAME, "test.pdf"):
+        worker = Thread(target=process)
+        worker.start()
+        worker.join()
+
+    assert input_pdf.exists()
+    assert not (temp_dirs["completed"] / "test.duplex.pdf").exists()
+    assert not (temp_dirs["archive"] / "test.pdf").exists()
+
+
+def test_process_pdf_file_durable_syncs_output(temp_dirs, monkeypatch):
+    """Test that durable mode fsyncs the output file and its directory."""
+    input_pdf = temp_dirs["ingest"] / "test.pdf"
+    create_test_pdf(input_pdf, ["F1", "B1"])
+
+    synced = []
+    real_fsync = os.fsync
+
+    def tracking_fsync(fd):
+        synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", tracking_fsync)
+
+    process_pdf_file(
+        file_path=input_pdf,
+        output_dir=temp_dirs["completed"],
+        archive_dir=temp_dirs["archive"],
+        failed_dir=temp_dirs["failed"],
+        output_suffix=".duplex",
+        reverse_backs=True,
+        insert_blank_lastback=False,
+        durable=True,
+    )
+
+    assert (temp_dirs["completed"] / "test.duplex.pdf").exists()
+    # Temp file before rename, then the output directory after it
+    assert len(synced) >= 2
+
+    synced.clear()
+    input_pdf = temp_dirs["ingest"] / "fast.pdf"
+    create_test_pdf(input_pdf, ["F1", "F2", "B1", "B2"])
+
+    process_pdf_file(
+        file_path=input_pdf,
+        output_dir=temp_dirs["completed"],
+        archive_dir=temp_dirs["archive"],
+        failed_dir=temp_dirs["failed"],
+        output_suffix=".duplex",
+        reverse_backs=True,
+        insert_blank_lastback=False,
+        durable=False,
+    )
+
+    assert (temp_dirs["completed"] / "fast.duplex.pdf").exists()
+    assert synced == []
+
+
 def test_process_pdf_file_invalid_pdf(temp_dirs):
     """Test handling of invalid PDF."""
     # Create invalid PDF
@@ -137,8 +245,6 @@ def test_process_pdf_file_already_processed(temp_dirs):
 
 def test_process_pdf_file_reprocess_when_input_newer(temp_dirs):
     """Test reprocessing when input file is newer than output."""
-    import time
-
     # Create and process a file first
     input_pdf = temp_dirs["ingest"] / "test.pdf"
     create_test_pdf(input_pdf, ["F1", "B1"])
@@ -146,11 +252,9 @@ def test_process_pdf_file_reprocess_when_input_newer(temp_dirs):
     output_pdf = temp_dirs["completed"] / "test.duplex.pdf"
     create_test_pdf(output_pdf, ["F1", "B1"])
 
-    # Wait a moment to ensure timestamp difference
-    time.sleep(0.1)
-
-    # Update input file to have newer timestamp
-    input_pdf.touch()
+    # Backdate the output so the input is newer, without waiting for the clock
+    past = input_pdf.stat().st_mtime - 2
+    os.utime(output_pdf, (past, past))
 
     # Should reprocess since input is newer
     process_pdf_file(
@@ -294,6 +398,69 @@ def test_process_pdf_file_skips_if_already_archived(temp_dirs):
     assert not output_pdf.exists()
 
 
+def test_process_pdf_file_skips_renamed_duplicate(temp_dirs):
+    """Test that identical content dropped under a new name is not reprocessed."""
+    input_pdf = temp_dirs["ingest"] / "scan.pdf"
+    create_test_pdf(input_pdf, ["F1", "B1"])
+    duplicate_pdf = temp_dirs["ingest"] / "scan_copy.pdf"
+    duplicate_pdf.write_bytes(input_pdf.read_bytes())
+
+    for path in (input_pdf, duplicate_pdf):
+        process_pdf_file(
+            file_path=path,
+            output_dir=temp_dirs["completed"],
+            archive_dir=temp_dirs["archive"],
+            failed_dir=temp_dirs["failed"],
+            output_suffix=".duplex",
+            reverse_backs=True,
+            insert_blank_lastback=False,
+        )
+
+    assert (temp_dirs["completed"] / "scan.duplex.pdf").exists()
+    assert not (temp_dirs["completed"] / "scan_copy.duplex.pdf").exists()
+    # Duplicate is skipped and left in place
+    assert duplicate_pdf.exists()
+
+
+def test_process_pdf_file_reuses_cached_result(temp_dirs, monkeypatch):
+    """Test that re-dropped content is served from the result cache."""
+    cache_dir = temp_dirs["archive"] / ".duplexer_cache"
+    input_pdf = temp_dirs["ingest"] / "scan.pdf"
+    create_test_pdf(input_pdf, ["F1", "F2", "B2", "B1"])
+    content = input_pdf.read_bytes()
+
+    kwargs = {
+        "output_dir": temp_dirs["completed"],
+        "archive_dir": temp_dirs["archive"],
+        "failed_dir": temp_dirs["failed"],
+        "output_suffix": ".duplex",
+        "reverse_backs": True,
+        "insert_blank_lastback": False,
+        "cache_dir": cache_dir,
+    }
+    process_pdf_file(file_path=input_pdf, **kwargs)
+
+    first_output = temp_dirs["completed"] / "scan.duplex.pdf"
+    assert first_output.exists()
+    assert len(list(cache_dir.iterdir())) == 1
+    expected = first_output.read_bytes()
+    first_output.unlink()
+
+    def fail_interleave(*args, **kwargs):
+        raise AssertionError("cached result should have been used")
+
+    monkeypatch.setattr("duplexer.cli.interleave_duplex", fail_interleave)
+
+    again_pdf = temp_dirs["ingest"] / "rescan.pdf"
+    again_pdf.write_bytes(content)
+    process_pdf_file(file_path=again_pdf, **kwargs)
+
+    again_output = temp_dirs["completed"] / "rescan.duplex.pdf"
+    assert again_output.read_bytes() == expected
+    assert (temp_dirs["archive"] / "rescan.pdf").exists()
+    assert not again_pdf.exists()
+
+
 def test_process_pdf_file_corrupted_pdf(temp_dirs):
     """Test handling of corrupted PDF files."""
     # Create a file that looks like PDF but is corrupted
@@ -358,6 +525,32 @@ def test_process_pdf_file_encrypted_pdf(temp_dirs):
     assert not output_pdf.exists()
 
 
+def test_process_pdf_file_pdfium_parses_once(temp_dirs, monkeypatch):
+    """Test that the pdfium backend skips the pypdf validation parse."""
+    pytest.importorskip("pypdfium2")
+
+    def fail_open_pdf(path):
+        raise AssertionError("open_pdf should not be called for the pdfium backend")
+
+    monkeypatch.setattr("duplexer.interleave.open_pdf", fail_open_pdf)
+    input_pdf = temp_dirs["ingest"] / "test.pdf"
+    create_test_pdf(input_pdf, ["F1", "F2", "B2", "B1"])
+
+    process_pdf_file(
+        file_path=input_pdf,
+        output_dir=temp_dirs["completed"],
+        archive_dir=temp_dirs["archive"],
+        failed_dir=temp_dirs["failed"],
+        output_suffix=".duplex",
+        reverse_backs=True,
+        insert_blank_lastback=False,
+        backend="pdfium",
+    )
+
+    assert (temp_dirs["completed"] / "test.duplex.pdf").exists()
+    assert (temp_dirs["archive"] / "test.pdf").exists()
+
+
 def test_process_pdf_file_empty_pdf(temp_dirs):
     """Test handling of PDF with no pages."""
     from pypdf import PdfWriter
@@ -418,18 +611,23 @@ def test_process_pdf_file_completely_invalid_file(temp_dirs):
 
 
 def test_process_pdf_file_output_permission_error(temp_dirs, monkeypatch):
-    """Test handling of permission error during atomic rename."""
+    """Test handling of permission error while moving the output into place."""
+    import os
     from pathlib import Path as OrigPath
 
     # Create valid input PDF
     input_pdf = temp_dirs["ingest"] / "test.pdf"
     create_test_pdf(input_pdf, ["F1", "B1"])
 
-    # Mock Path.replace to raise PermissionError
+    # Fail both the O_TMPFILE link and the named temp file rename
     def mock_replace(self, target):
         raise PermissionError("Permission denied")
 
+    def mock_link(*args, **kwargs):
+        raise PermissionError("Permission denied")
+
     monkeypatch.setattr(OrigPath, "replace", mock_replace)
+    monkeypatch.setattr(os, "link", mock_link)
 
     process_pdf_file(
         file_path=input_pdf,
@@ -441,7 +639,7 @@ def test_process_pdf_file_output_permission_error(temp_dirs, monkeypatch):
         insert_blank_lastback=False,
     )
 
-    # Should be moved to failed due to DuplexError from replace failure
+    # Should be moved to failed due to the failed output commit
     failed_pdf = temp_dirs["failed"] / "test.pdf"
     assert failed_pdf.exists()
     assert not input_pdf.exists()
@@ -449,6 +647,7 @@ def test_process_pdf_file_output_permission_error(temp_dirs, monkeypatch):
     # No output created (temp file should be cleaned up)
     output_pdf = temp_dirs["completed"] / "test.duplex.pdf"
     assert not output_pdf.exists()
+    assert list(temp_dirs["completed"].iterdir()) == []
 
 
 def test_process_pdf_file_archive_failure_scenario(temp_dirs, monkeypatch):
@@ -494,13 +693,13 @@ def test_process_pdf_file_archive_failure_scenario(temp_dirs, monkeypatch):
     assert input_pdf.exists()
 
     # Archive should be empty
-    assert not list(temp_dirs["archive"].glob("*.pdf"))
+    assert not any(temp_dirs["archive"].glob("*.pdf"))
 
     # Failed should be empty (archive failure doesn't move to failed)
-    assert not list(temp_dirs["failed"].glob("*.pdf"))
+    assert not any(temp_dirs["failed"].glob("*.pdf"))
 
     # Verify warning was logged
-    assert any("Failed to archive" in log for log in logs)
+    assert "Failed to archive" in logs.getvalue()
 
 
 def test_process_pdf_file_complete_failure_all_steps(temp_dirs, monkeypatch):
@@ -595,7 +794,7 @@ def test_process_pdf_file_output_dir_missing(temp_dirs):
         assert not input_pdf.exists()
 
         # No output created
-        assert not list(temp_dirs["root"].glob("**/test.duplex.pdf"))
+        assert not any(temp_dirs["root"].glob("**/test.duplex.pdf"))
 
     finally:
         # Restore original function
@@ -603,15 +802,16 @@ def test_process_pdf_file_output_dir_missing(temp_dirs):
 
 
 def _capture_logs():
-    """Context manager to capture log messages."""
+    """Context manager to capture log messages into a string buffer."""
+    import io
     import logging
     from contextlib import contextmanager
 
     @contextmanager
     def capture():
-        logs = []
-        handler = logging.Handler()
-        handler.emit = lambda record: logs.append(record.getMessage())
+        logs = io.StringIO()
+        handler = logging.StreamHandler(logs)
+        handler.setFormatter(logging.Formatter("%(message)s"))
         logger = logging.getLogger("duplexer.cli")
         logger.addHandler(handler)
         try:
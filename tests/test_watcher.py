@@ -1,13 +1,22 @@
 """Tests for directory watcher and file processing integration."""
 
+import os
 import shutil
 import time
 from pathlib import Path
-from threading import Thread
+from threading import Event, Semaphore, Thread, current_thread
+
+import pytest
 
 from conftest import create_test_pdf
 from duplexer.io_utils import is_file_stable
-from duplexer.watcher import FileWatcher
+from duplexer.watcher import (
+    FileWatcher,
+    ProcessedSet,
+    ProcessingHandler,
+    compile_name_pattern,
+    name_matcher,
+)
 
 
 def test_file_stability_check(tmp_path):
@@ -23,6 +32,82 @@ def test_file_stability_check(tmp_path):
     assert is_file_stable(test_file, 1.0)
 
 
+def test_compile_name_pattern():
+    """Test that compiled patterns match names like Path.glob and skip sidecars."""
+    pdf = compile_name_pattern("*.pdf")
+    assert pdf.match("scan.pdf")
+    assert not pdf.match("scan.PDF")
+    assert not pdf.match("scan.pdf.ready")
+    assert not pdf.match(".scan.pdf")
+    assert not pdf.match("scan.pdf.tmp")
+
+    assert compile_name_pattern("scan_*.pdf").match("scan_001.pdf")
+    assert not compile_name_pattern("scan_*.pdf").match("doc_001.pdf")
+    assert compile_name_pattern(".*.pdf").match(".scan.pdf")
+    assert not compile_name_pattern("*").match("scan.pdf.ready")
+
+
+@pytest.mark.parametrize("pattern", ["*.pdf", "*.ready", "*.pdf.ready", "scan_*.pdf", "*.p?f"])
+def test_name_matcher_agrees_with_compiled_pattern(pattern):
+    """Test that the endswith fast path matches exactly what the regex matches."""
+    names = ["scan.pdf", "scan.PDF", ".scan.pdf", ".pdf", "scan.pdf.ready", "scan_1.pdf", "a.pbf"]
+    name_re = compile_name_pattern(pattern)
+    matches = name_matcher(pattern)
+    for name in names:
+        assert matches(name) == bool(name_re.match(name)), name
+
+
+def test_watcher_compiles_pattern_once(temp_dirs, monkeypatch):
+    """Test that scans match names with the pattern compiled when the watcher was built."""
+    import duplexer.watcher
+
+    ingest = temp_dirs["ingest"]
+    old = time.time() - 60
+    for name in ("scan_1.pdf", "other.pdf"):
+        (ingest / name).touch()
+        os.utime(ingest / name, (old, old))
+
+    watcher = FileWatcher(
+        input_dir=ingest,
+        process_callback=lambda path: None,
+        pattern="scan_*.pdf",
+        stability_seconds=0.05,
+    )
+
+    def no_compile(*args, **kwargs):
+        raise AssertionError("pattern compiled during a scan")
+
+    monkeypatch.setattr(duplexer.watcher, "compile_name_pattern", no_compile)
+    monkeypatch.setattr(duplexer.watcher.fnmatch, "translate", no_compile)
+    assert watcher.collect_ready_files() == [ingest / "scan_1.pdf"]
+
+
+def test_processed_set_evicts_oldest():
+    """Test that the processed record is bounded and evicts oldest entries first."""
+    processed = ProcessedSet(max_size=2)
+    processed.add(Path("/ingest/a.pdf"))
+    processed.add(Path("/ingest/b.pdf"))
+    processed.add(Path("/ingest/a.pdf"))  # refresh a
+    processed.add(Path("/ingest/c.pdf"))
+
+    assert len(processed) == 2
+    assert Path("/ingest/a.pdf") in processed
+    assert "/ingest/c.pdf" in processed
+    assert Path("/ingest/b.pdf") not in processed
+    assert 42 not in processed
+
+
+def test_processed_set_claim():
+    """Test that only the first claim of a path succeeds."""
+    processed = ProcessedSet(max_size=2)
+    assert processed.claim(Path("/ingest/a.pdf"))
+    assert not processed.claim(Path("/ingest/a.pdf"))
+    assert processed.claim(Path("/ingest/b.pdf"))
+    assert processed.claim(Path("/ingest/c.pdf"))
+    assert len(processed) == 2
+    assert Path("/ingest/a.pdf") not in processed
+
+
 def test_watcher_scan_once(temp_dirs):
     """Test single scan of directory."""
     # Create test PDF
@@ -50,6 +135,167 @@ def test_watcher_scan_once(temp_dirs):
     assert "test.pdf" in processed
 
 
+def test_watcher_scan_once_thread_pool(temp_dirs):
+    """Test that scan_once hands files to the thread pool when max_workers is set."""
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        create_test_pdf(temp_dirs["ingest"] / name, ["F1", "B1"])
+    time.sleep(0.1)
+
+    threads = {}
+    finished = Semaphore(0)
+
+    def callback(path: Path):
+        threads[path.name] = current_thread().name
+        finished.release()
+        if path.name == "b.pdf":
+            raise RuntimeError("boom")
+
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=callback,
+        pattern="*.pdf",
+        stability_seconds=0.05,
+        max_workers=2,
+    )
+
+    assert watcher.scan_once() == 3
+    # Submitted files are claimed, so the next scan does not resubmit them
+    assert watcher.scan_once() == 0
+    # Shutting down drops files that have not started, so wait for all three
+    for _ in range(3):
+        assert finished.acquire(timeout=5)
+    watcher._shutdown_pool(wait=True)
+
+    assert sorted(threads) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert all(name.startswith("duplexer") for name in threads.values())
+
+
+def test_watcher_collect_ready_files(temp_dirs):
+    """Test that ready files are returned without invoking the callback."""
+    for name in ("b.pdf", "a.pdf"):
+        create_test_pdf(temp_dirs["ingest"] / name, ["F1", "B1"])
+
+    time.sleep(0.1)
+
+    processed = []
+
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=processed.append,
+        pattern="*.pdf",
+        stability_seconds=0.05,
+    )
+
+    files = watcher.collect_ready_files()
+
+    assert [f.name for f in files] == ["a.pdf", "b.pdf"]
+    assert processed == []
+    # Claimed files are not returned again
+    assert watcher.collect_ready_files() == []
+
+
+def test_watcher_skips_listing_unchanged_directory(temp_dirs, monkeypatch):
+    """Test that an old, unchanged directory with nothing waiting is not listed again."""
+    ingest = temp_dirs["ingest"]
+    create_test_pdf(ingest / "a.pdf", ["F1", "B1"])
+    old = time.time() - 3600
+    os.utime(ingest / "a.pdf", (old, old))
+    os.utime(ingest, (old, old))
+
+    watcher = FileWatcher(
+        input_dir=ingest,
+        process_callback=lambda path: None,
+        pattern="*.pdf",
+        stability_seconds=0.05,
+    )
+    assert watcher.collect_ready_files() == [ingest / "a.pdf"]
+
+    listings = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        listings.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    assert watcher.collect_ready_files() == []
+    assert listings == []
+
+    # A new file changes the directory mtime and is picked up
+    create_test_pdf(ingest / "b.pdf", ["F1", "B1"])
+    os.utime(ingest / "b.pdf", (old, old))
+    assert watcher.collect_ready_files() == [ingest / "b.pdf"]
+    assert listings == [ingest]
+
+
+def test_watcher_relists_unchanged_directory_while_files_wait(temp_dirs):
+    """Test that a file still settling forces a listing even if the directory mtime is old."""
+    ingest = temp_dirs["ingest"]
+    create_test_pdf(ingest / "a.pdf", ["F1", "B1"])
+    old = time.time() - 3600
+    os.utime(ingest, (old, old))
+
+    watcher = FileWatcher(
+        input_dir=ingest,
+        process_callback=lambda path: None,
+        pattern="*.pdf",
+        stability_seconds=60,
+    )
+    assert watcher.collect_ready_files() == []
+
+    # Writes into an existing file leave the directory mtime alone
+    os.utime(ingest / "a.pdf", (old, old))
+    os.utime(ingest, (old, old))
+    assert watcher.collect_ready_files() == [ingest / "a.pdf"]
+
+
+def test_watcher_collect_skips_directories_and_hidden_files(temp_dirs):
+    """Test that the directory scan matches files like Path.glob does."""
+    create_test_pdf(temp_dirs["ingest"] / "scan.pdf", ["F1", "B1"])
+    create_test_pdf(temp_dirs["ingest"] / ".partial.pdf", ["F1", "B1"])
+    (temp_dirs["ingest"] / "folder.pdf").mkdir()
+
+    time.sleep(0.1)
+
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=lambda p: None,
+        pattern="*.pdf",
+        stability_seconds=0.05,
+    )
+
+    assert [f.name for f in watcher.collect_ready_files()] == ["scan.pdf"]
+
+
+def test_watcher_skip_filter(temp_dirs):
+    """Test that files rejected by the batch skip filter are not returned."""
+    for name in ("a.pdf", "b.pdf"):
+        create_test_pdf(temp_dirs["ingest"] / name, ["F1", "B1"])
+
+    time.sleep(0.1)
+
+    batches = []
+
+    def skip_a(paths):
+        batches.append(list(paths))
+        return {p for p in paths if p.name == "a.pdf"}
+
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=lambda p: None,
+        pattern="*.pdf",
+        stability_seconds=0.05,
+        skip_filter=skip_a,
+    )
+
+    files = watcher.collect_ready_files()
+
+    assert [f.name for f in files] == ["b.pdf"]
+    # Filter runs once per scan with the whole batch
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+
 def test_watcher_ignores_ready_files(temp_dirs):
     """Test that .ready files are not processed as PDFs."""
     test_pdf = temp_dirs["ingest"] / "test.pdf"
@@ -105,6 +351,107 @@ def test_watcher_processes_only_stable_files(temp_dirs):
     assert len(processed) == 0
 
 
+def test_watcher_ready_file_mode_does_not_stat_candidates(temp_dirs, monkeypatch):
+    """Test that sidecar mode decides readiness from the directory listing alone."""
+    ingest = temp_dirs["ingest"]
+    for name in ("a.pdf", "a.pdf.ready", "b.pdf"):
+        (ingest / name).touch()
+
+    watcher = FileWatcher(
+        input_dir=ingest,
+        process_callback=lambda path: None,
+        pattern="*.pdf",
+        require_ready_file=True,
+    )
+
+    class NoStatEntry:
+        def __init__(self, entry):
+            self.name = entry.name
+            self.path = entry.path
+
+        def stat(self):
+            raise AssertionError(f"unexpected stat of {self.name}")
+
+    real_list = watcher._list_candidates
+
+    def list_without_stat():
+        candidates, names = real_list()
+        return [NoStatEntry(entry) for entry in candidates], names
+
+    monkeypatch.setattr(watcher, "_list_candidates", list_without_stat)
+    assert watcher.collect_ready_files() == [ingest / "a.pdf"]
+
+
+def test_watcher_stability_mode_stats_from_listing(temp_dirs, monkeypatch):
+    """Test that stability checks reuse each entry's scandir stat instead of stat'ing paths."""
+    ingest = temp_dirs["ingest"]
+    old = time.time() - 60
+    for name in ("a.pdf", "b.pdf"):
+        create_test_pdf(ingest / name, ["F1", "B1"])
+        os.utime(ingest / name, (old, old))
+
+    watcher = FileWatcher(
+        input_dir=ingest,
+        process_callback=lambda path: None,
+        pattern="*.pdf",
+        stability_seconds=0.05,
+    )
+
+    real_stat = os.stat
+    stated = []
+
+    def tracking_stat(path, *args, **kwargs):
+        stated.append(os.fspath(path))
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", tracking_stat)
+    assert watcher.collect_ready_files() == [ingest / "a.pdf", ingest / "b.pdf"]
+    # Only the directory itself, for the unchanged-listing check
+    assert stated == [os.fspath(ingest)]
+
+
+def test_watcher_does_not_restat_claimed_files(temp_dirs, monkeypatch):
+    """Test that files found stable once are not stat'ed again by later scans."""
+    ingest = temp_dirs["ingest"]
+    old = time.time() - 60
+    create_test_pdf(ingest / "a.pdf", ["F1", "B1"])
+    os.utime(ingest / "a.pdf", (old, old))
+
+    watcher = FileWatcher(
+        input_dir=ingest,
+        process_callback=lambda path: None,
+        pattern="*.pdf",
+        stability_seconds=10.0,
+    )
+    assert watcher.collect_ready_files() == [ingest / "a.pdf"]
+
+    stated = []
+
+    class TrackingEntry:
+        def __init__(self, entry):
+            self.name = entry.name
+            self.path = entry.path
+            self._entry = entry
+
+        def stat(self):
+            stated.append(self.name)
+            return self._entry.stat()
+
+    real_list = watcher._list_candidates
+
+    def tracking_list():
+        candidates, names = real_list()
+        return [TrackingEntry(entry) for entry in candidates], names
+
+    monkeypatch.setattr(watcher, "_list_candidates", tracking_list)
+
+    # A file still being written keeps the directory listed on every scan
+    create_test_pdf(ingest / "b.pdf", ["F1", "B1"])
+    for _ in range(3):
+        assert watcher.collect_ready_files() == []
+    assert stated == ["b.pdf"] * 3
+
+
 def test_watcher_require_ready_file(temp_dirs):
     """Test ready file requirement."""
     test_pdf = temp_dirs["ingest"] / "test.pdf"
@@ -228,7 +575,7 @@ def test_watcher_detects_new_files_after_start(temp_dirs, tmp_path):
     time.sleep(0.3)
 
     # Verify directory is empty initially
-    assert len(list(temp_dirs["ingest"].glob("*.pdf"))) == 0
+    assert not any(temp_dirs["ingest"].glob("*.pdf"))
 
     # Now copy the file into the watched directory
     dest_pdf = temp_dirs["ingest"] / "new_file.pdf"
@@ -312,7 +659,7 @@ def test_watcher_processes_multiple_files_in_sequence(temp_dirs, tmp_path):
 def test_watcher_handles_rapid_file_modifications(temp_dirs, tmp_path):
     """Test that multiple modifications to same file don't cause duplicate processing.
 
-    This tests the timer cancellation logic when a file is modified multiple times.
+    This tests the debounce logic when a file is modified multiple times.
     """
     source_pdf = tmp_path / "source.pdf"
     create_test_pdf(source_pdf, ["F1", "B1"])
@@ -355,39 +702,306 @@ def test_watcher_handles_rapid_file_modifications(temp_dirs, tmp_path):
     assert "modified.pdf" in processed
 
 
+def test_processing_handler_debounces_events(temp_dirs):
+    """Test that repeated events for a file share one pending entry and one check."""
+    from watchdog.events import FileModifiedEvent
+
+    test_pdf = temp_dirs["ingest"] / "burst.pdf"
+    create_test_pdf(test_pdf, ["F1", "B1"])
+
+    processed = []
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=processed.append,
+        require_ready_file=False,
+        stability_seconds=0.2,
+    )
+    try:
+        for _ in range(5):
+            handler.on_modified(FileModifiedEvent(str(test_pdf)))
+            time.sleep(0.02)
+
+        assert list(handler.pending_files) == [test_pdf]
+
+        time.sleep(0.5)
+        assert processed == [test_pdf]
+        assert handler.pending_files == {}
+    finally:
+        handler.close()
+
+
+def test_processing_handler_events_start_no_threads(temp_dirs):
+    """Test that bursts of events are debounced by the one drain thread, not a timer each."""
+    import threading
+
+    from watchdog.events import FileModifiedEvent
+
+    paths = [temp_dirs["ingest"] / f"scan_{i}.pdf" for i in range(20)]
+    for path in paths:
+        path.touch()
+
+    processed = []
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=processed.append,
+        require_ready_file=False,
+        stability_seconds=60,
+    )
+    try:
+        threads = threading.active_count()
+        for _ in range(5):
+            for path in paths:
+                handler.on_modified(FileModifiedEvent(str(path)))
+        assert threading.active_count() == threads
+        assert sorted(handler.pending_files) == sorted(paths)
+    finally:
+        handler.close()
+
+
+def test_processing_handler_batches_bursts(temp_dirs):
+    """Test that files from one burst share a deadline and are checked together."""
+    from watchdog.events import FileCreatedEvent
+
+    paths = [temp_dirs["ingest"] / f"scan_{i}.pdf" for i in range(3)]
+    for path in paths:
+        create_test_pdf(path, ["F1", "B1"])
+
+    processed = []
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=processed.append,
+        require_ready_file=False,
+        stability_seconds=0.5,
+    )
+    try:
+        for path in paths:
+            handler.on_created(FileCreatedEvent(str(path)))
+            time.sleep(0.1)
+
+        # The first file's own window has passed, but the burst's has not
+        time.sleep(0.25)
+        assert processed == []
+
+        time.sleep(0.6)
+        assert sorted(processed) == paths
+    finally:
+        handler.close()
+
+
+def test_processing_handler_ignores_skewed_mtime(temp_dirs):
+    """Test that an unchanged file is ready even if its mtime is in the future."""
+    from watchdog.events import FileCreatedEvent
+
+    test_pdf = temp_dirs["ingest"] / "skewed.pdf"
+    create_test_pdf(test_pdf, ["F1", "B1"])
+    # File server clock ahead of ours: mtime age never reaches the window
+    future = time.time() + 3600
+    os.utime(test_pdf, (future, future))
+
+    processed = []
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=processed.append,
+        require_ready_file=False,
+        stability_seconds=0.2,
+    )
+    try:
+        handler.on_created(FileCreatedEvent(str(test_pdf)))
+        time.sleep(0.5)
+        assert processed == [test_pdf]
+    finally:
+        handler.close()
+
+
+def test_processing_handler_checks_without_holding_lock(temp_dirs, monkeypatch):
+    """Test that events are still accepted while a batch is being checked."""
+    from watchdog.events import FileCreatedEvent
+
+    import duplexer.io_utils
+
+    ingest = temp_dirs["ingest"]
+    delivered = []
+    processed = []
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=processed.append,
+        require_ready_file=False,
+        stability_seconds=0.1,
+    )
+
+    def slow_is_file_ready(file_path, *args, **kwargs):
+        if file_path.name == "first.pdf":
+            event = FileCreatedEvent(str(ingest / "second.pdf"))
+            sender = Thread(target=handler.on_created, args=(event,))
+            sender.start()
+            sender.join(timeout=1.0)
+            delivered.append(not sender.is_alive())
+        return True
+
+    monkeypatch.setattr(duplexer.io_utils, "is_file_ready", slow_is_file_ready)
+    try:
+        handler.on_created(FileCreatedEvent(str(ingest / "first.pdf")))
+        time.sleep(0.6)
+        assert delivered == [True]
+        assert processed == [ingest / "first.pdf", ingest / "second.pdf"]
+    finally:
+        handler.close()
+
+
+def test_processing_handler_lists_sidecars_once_per_batch(temp_dirs, monkeypatch):
+    """Test that sidecar checks for a batch come from one listing, not a stat each."""
+    ingest = temp_dirs["ingest"]
+    for name in ("a.pdf", "b.pdf"):
+        create_test_pdf(ingest / name, ["F1", "B1"])
+    (ingest / "a.pdf.ready").touch()
+
+    processed = []
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=processed.append,
+        require_ready_file=True,
+        stability_seconds=0.1,
+    )
+
+    stat = os.stat
+    sidecar_stats = []
+
+    def counting_stat(path, *args, **kwargs):
+        if os.fspath(path).endswith(".ready"):
+            sidecar_stats.append(path)
+        return stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    try:
+        now = time.monotonic()
+        handler._check_batch([(ingest / "a.pdf", now, None), (ingest / "b.pdf", now, None)])
+    finally:
+        handler.close()
+
+    assert processed == [ingest / "a.pdf"]
+    assert sidecar_stats == []
+
+
+def test_processing_handler_wakes_on_sidecar(temp_dirs):
+    """Test that a .ready sidecar arriving after its file triggers processing."""
+    from watchdog.events import FileClosedEvent, FileCreatedEvent
+
+    ingest = temp_dirs["ingest"]
+    test_pdf = ingest / "scan.pdf"
+    create_test_pdf(test_pdf, ["F1", "B1"])
+
+    processed = []
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=processed.append,
+        require_ready_file=True,
+        stability_seconds=0.1,
+    )
+    try:
+        handler.on_closed(FileClosedEvent(str(test_pdf)))
+        time.sleep(0.3)
+        assert processed == []
+
+        # A sidecar whose file is missing is ignored
+        handler.on_created(FileCreatedEvent(str(ingest / "other.pdf.ready")))
+        assert handler.pending_files == {}
+
+        (ingest / "scan.pdf.ready").touch()
+        handler.on_created(FileCreatedEvent(str(ingest / "scan.pdf.ready")))
+        assert list(handler.pending_files) == [test_pdf]
+
+        deadline = time.monotonic() + 1
+        while not processed and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert processed == [test_pdf]
+    finally:
+        handler.close()
+
+
+def test_watcher_detects_files_renamed_into_place(temp_dirs):
+    """Test that a file uploaded under a temporary name is picked up once renamed."""
+    processed = []
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=lambda path: processed.append(path.name),
+        pattern="*.pdf",
+        stability_seconds=0.1,
+    )
+    watcher_thread = Thread(target=watcher.watch, daemon=True)
+    watcher_thread.start()
+    try:
+        time.sleep(0.3)
+        partial = temp_dirs["ingest"] / "upload.pdf.part"
+        create_test_pdf(partial, ["F1", "B1"])
+        partial.rename(temp_dirs["ingest"] / "upload.pdf")
+
+        deadline = time.monotonic() + 3
+        while not processed and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert processed == ["upload.pdf"]
+    finally:
+        watcher.stop()
+        watcher_thread.join(timeout=2.0)
+
+
+def test_processing_handler_filters_events(temp_dirs):
+    """Test that ignored names are dropped and bytes event paths are decoded."""
+    from watchdog.events import FileCreatedEvent, FileModifiedEvent
+
+    ingest = temp_dirs["ingest"]
+    handler = ProcessingHandler(
+        pattern="*.pdf",
+        process_callback=lambda path: None,
+        require_ready_file=False,
+        stability_seconds=60,
+    )
+    try:
+        handler.on_modified(FileModifiedEvent(str(ingest / "notes.txt")))
+        handler.on_created(FileCreatedEvent(str(ingest / "scan.pdf.ready")))
+        assert handler.pending_files == {}
+
+        handler.on_created(FileCreatedEvent(bytes(ingest / "scan.pdf")))
+        assert list(handler.pending_files) == [ingest / "scan.pdf"]
+    finally:
+        handler.close()
+
+
 def test_watcher_signal_handler_registration(temp_dirs):
-    """Test that signal handlers are registered correctly on initialization."""
+    """Test that signal handlers are only installed while watch() runs."""
     import signal
 
-    # Save original handlers
     original_sigterm = signal.getsignal(signal.SIGTERM)
     original_sigint = signal.getsignal(signal.SIGINT)
 
-    def callback(path: Path):
-        pass
-
     watcher = FileWatcher(
         input_dir=temp_dirs["ingest"],
-        process_callback=callback,
+        process_callback=lambda path: None,
         pattern="*.pdf",
         stability_seconds=0.05,
+        use_polling=True,
     )
 
-    # Check that handlers were registered
-    current_sigterm = signal.getsignal(signal.SIGTERM)
-    current_sigint = signal.getsignal(signal.SIGINT)
+    # Constructing a watcher leaves the application's handlers alone
+    assert signal.getsignal(signal.SIGTERM) == original_sigterm
+    assert signal.getsignal(signal.SIGINT) == original_sigint
 
-    # Handlers should have changed from original
-    assert current_sigterm != original_sigterm
-    assert current_sigint != original_sigint
+    seen = {}
 
-    # Verify the handlers point to the watcher's signal handler
-    assert current_sigterm == watcher._signal_handler
-    assert current_sigint == watcher._signal_handler
+    def inspect_and_stop():
+        time.sleep(0.2)
+        seen["sigterm"] = signal.getsignal(signal.SIGTERM)
+        seen["sigint"] = signal.getsignal(signal.SIGINT)
+        watcher.stop()
 
-    # Restore original handlers for other tests
-    signal.signal(signal.SIGTERM, original_sigterm)
-    signal.signal(signal.SIGINT, original_sigint)
+    stopper = Thread(target=inspect_and_stop, daemon=True)
+    stopper.start()
+    watcher.watch()
+    stopper.join(timeout=2.0)
+
+    assert seen["sigterm"] == watcher._signal_handler
+    assert seen["sigint"] == watcher._signal_handler
+    assert signal.getsignal(signal.SIGTERM) == original_sigterm
+    assert signal.getsignal(signal.SIGINT) == original_sigint
 
 
 def test_watcher_stop_during_continuous_watch(temp_dirs):
@@ -410,21 +1024,85 @@ def test_watcher_stop_during_continuous_watch(temp_dirs):
     watcher_thread.start()
 
     # Wait for watcher to start
-    time.sleep(0.5)
+    deadline = time.monotonic() + 2
+    while not watcher.running and time.monotonic() < deadline:
+        time.sleep(0.01)
 
     # Verify it's running
     assert watcher.running
 
-    # Stop the watcher
+    # stop() sets the stop event, so the poll wait returns at once
+    started = time.monotonic()
     watcher.stop()
-    time.sleep(0.3)
+    watcher_thread.join(timeout=2.0)
+    assert not watcher_thread.is_alive()
+    assert time.monotonic() - started < watcher.poll_interval
 
     # Should be stopped now
     assert not watcher.running
 
-    # Thread should terminate
+
+def test_watcher_event_mode_does_not_rescan(temp_dirs, monkeypatch):
+    """Test that with filesystem events only the startup scan lists the directory."""
+    processed = []
+    done = Event()
+
+    def callback(path: Path):
+        processed.append(path.name)
+        done.set()
+
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=callback,
+        pattern="*.pdf",
+        poll_interval=0.05,
+        stability_seconds=0.1,
+        use_polling=False,
+    )
+
+    scans = []
+    real_collect = watcher.collect_ready_files
+
+    def counting_collect():
+        scans.append(time.monotonic())
+        return real_collect()
+
+    monkeypatch.setattr(watcher, "collect_ready_files", counting_collect)
+
+    watcher_thread = Thread(target=watcher.watch, daemon=True)
+    watcher_thread.start()
+    try:
+        time.sleep(0.3)
+        create_test_pdf(temp_dirs["ingest"] / "scan.pdf", ["F1", "B1"])
+        assert done.wait(timeout=5), "Watcher did not process the file in time"
+    finally:
+        watcher.stop()
+        watcher_thread.join(timeout=2.0)
+
+    assert processed == ["scan.pdf"]
+    assert len(scans) == 1
+
+
+def test_watcher_stop_wakes_polling_immediately(temp_dirs):
+    """Test that stop() interrupts the poll wait instead of waiting out the interval."""
+    watcher = FileWatcher(
+        input_dir=temp_dirs["ingest"],
+        process_callback=lambda path: None,
+        pattern="*.pdf",
+        poll_interval=30.0,
+        use_polling=True,
+    )
+
+    watcher_thread = Thread(target=watcher.watch, daemon=True)
+    watcher_thread.start()
+    time.sleep(0.2)
+
+    start = time.monotonic()
+    watcher.stop()
     watcher_thread.join(timeout=2.0)
+
     assert not watcher_thread.is_alive()
+    assert time.monotonic() - start < 2.0
 
 
 def test_watcher_observer_cleanup_on_stop(temp_dirs):
@@ -444,25 +1122,25 @@ def test_watcher_observer_cleanup_on_stop(temp_dirs):
     # Start watcher
     watcher_thread = Thread(target=watcher.watch, daemon=True)
     watcher_thread.start()
-    time.sleep(0.5)
+    deadline = time.monotonic() + 2
+    while (
+        watcher.observer is None or not watcher.observer.is_alive()
+    ) and time.monotonic() < deadline:
+        time.sleep(0.01)
 
     # Verify observer is running
     assert watcher.running
-    if watcher.observer is not None:
-        assert watcher.observer.is_alive()
+    assert watcher.observer is not None
+    assert watcher.observer.is_alive()
 
-    # Stop watcher
+    # Stop watcher; the watch thread joins the observer on its way out
     watcher.stop()
-    time.sleep(0.5)
+    watcher_thread.join(timeout=2.0)
+    assert not watcher_thread.is_alive()
 
     # Observer should be stopped and joined
     assert not watcher.running
-    if watcher.observer is not None:
-        # Observer should have been stopped
-        assert not watcher.observer.is_alive()
-
-    # Clean up
-    watcher_thread.join(timeout=2.0)
+    assert not watcher.observer.is_alive()
 
 
 def test_watcher_stability_check_uses_configured_seconds(temp_dirs, tmp_path):